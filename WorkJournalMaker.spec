@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('web', 'web')],
-    hiddenimports=['config_manager', 'web.database'],
+    hiddenimports=['config_manager', 'web.database', 'bedrock_client', 'google_genai_client', 'cborg_client', 'mock_llm_client'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -15,14 +15,17 @@ from pathlib import Path
 import boto3
 from botocore.exceptions import ClientError, BotoCoreError
 import json
-import time
 import logging
 import os
 
-from base_llm_client import BaseLLMClient
+from base_llm_client import BaseLLMClient, ENTITY_SCHEMA
+from cancellation import cancellable_sleep
 from config_manager import BedrockConfig
 from llm_data_structures import AnalysisResult, APIStats
 
+# Tool Claude is forced to call in structured-output mode; its input is the result
+ENTITY_TOOL_NAME = "record_journal_entities"
+
 
 class BedrockClient(BaseLLMClient):
     """
@@ -42,6 +45,7 @@ class BedrockClient(BaseLLMClient):
         self.config = config
         self.client = self._create_bedrock_client()
         super().__init__()
+        self._init_rate_limiter("bedrock", config.model_id, config)
 
     def _create_bedrock_client(self):
         """
@@ -93,22 +97,34 @@ class BedrockClient(BaseLLMClient):
         Raises:
             Exception: If all retry attempts fail
         """
-        request_body = self._format_bedrock_request(system=system, user=user)
+        request_body = self._format_bedrock_request(
+            system=system, user=user, structured=self.structured_output
+        )
         response = self._make_api_call_with_retry(request_body)
+        self._record_cache_usage(response.get('usage', {}).get('cache_read_input_tokens'))
         return self._extract_text_from_response(response)
 
-    def _format_bedrock_request(self, system: str, user: str) -> Dict[str, Any]:
+    def _format_bedrock_request(self, system: str, user: str,
+                                structured: bool = False) -> Dict[str, Any]:
         """
         Format request for Bedrock API with separate system and user fields.
 
+        With prompt_caching enabled the system prompt is sent as a text block
+        marked with cache_control, so repeated requests read it from the
+        prompt cache (once it reaches the model's minimum cacheable length).
+
         Args:
             system: Trusted system instructions for Claude.
             user: Untrusted user content to analyze.
+            structured: Force a tool call whose input schema is ENTITY_SCHEMA,
+                so the entities come back as validated JSON.
 
         Returns:
             Dict: Formatted request body for Bedrock
         """
-        return {
+        if self.config.prompt_caching:
+            system = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+        request = {
             "anthropic_version": "bedrock-2023-05-31",
             "max_tokens": 1000,
             "system": system,
@@ -121,6 +137,14 @@ class BedrockClient(BaseLLMClient):
             "temperature": 0.1,  # Low temperature for consistent extraction
             "top_p": 0.9
         }
+        if structured:
+            request["tools"] = [{
+                "name": ENTITY_TOOL_NAME,
+                "description": "Record the entities extracted from the journal entry.",
+                "input_schema": ENTITY_SCHEMA,
+            }]
+            request["tool_choice"] = {"type": "tool", "name": ENTITY_TOOL_NAME}
+        return request
 
     def _make_api_call_with_retry(self, request_body: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -135,26 +159,29 @@ class BedrockClient(BaseLLMClient):
         Raises:
             Exception: If all retry attempts fail
         """
+        body = json.dumps(request_body)
         for attempt in range(self.config.max_retries + 1):
             try:
-                response = self.client.invoke_model(
-                    modelId=self.config.model_id,
-                    body=json.dumps(request_body),
-                    contentType='application/json',
-                    accept='application/json'
-                )
-
+                with self._request_slot(body):
+                    response = self.client.invoke_model(
+                        modelId=self.config.model_id,
+                        body=body,
+                        contentType='application/json',
+                        accept='application/json'
+                    )
+
+                self._record_request_success()
                 return json.loads(response['body'].read())
 
             except ClientError as e:
                 error_code = e.response['Error']['Code']
 
                 if error_code == 'ThrottlingException':
-                    self.stats.rate_limit_hits += 1
+                    self._record_rate_limit()
                     if attempt < self.config.max_retries:
                         wait_time = max(self.config.rate_limit_delay, (2 ** attempt) + 1)
                         self.logger.warning(f"Rate limited, waiting {wait_time}s before retry {attempt + 1}")
-                        time.sleep(wait_time)
+                        cancellable_sleep(wait_time)
                         continue
 
                 self.logger.error(f"Bedrock API error: {error_code} - {e}")
@@ -164,7 +191,7 @@ class BedrockClient(BaseLLMClient):
                 if attempt < self.config.max_retries:
                     wait_time = (2 ** attempt) + 1
                     self.logger.warning(f"Network error, retrying in {wait_time}s: {e}")
-                    time.sleep(wait_time)
+                    cancellable_sleep(wait_time)
                     continue
                 raise
 
@@ -178,6 +205,8 @@ class BedrockClient(BaseLLMClient):
         """
         Extract text content from the Bedrock API response format.
 
+        A tool_use block (structured output) is returned as its JSON input.
+
         Args:
             response: Raw response dict from Bedrock API
 
@@ -191,6 +220,10 @@ class BedrockClient(BaseLLMClient):
         if not content:
             raise ValueError("No content in response")
 
+        for block in content:
+            if block.get('type') == 'tool_use' and block.get('name') == ENTITY_TOOL_NAME:
+                return json.dumps(block.get('input', {}))
+
         text_content = content[0].get('text', '')
         if not text_content:
             raise ValueError("No text content in response")
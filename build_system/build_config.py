@@ -182,6 +182,13 @@ class BuildConfig:
             # Template engine
             'jinja2.ext',
             
+            # LLM provider clients (imported by name when a provider is selected)
+            'bedrock_client',
+            'google_genai_client',
+            'cborg_client',
+            'mock_llm_client',
+            'openai',
+            
             # Google GenAI (if used)
             'google.genai',
             'google.genai.models',
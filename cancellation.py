@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# ABOUTME: Cooperative cancellation tokens for long-running summarization work.
+# ABOUTME: Checked per file, per period, before each LLM request and during retry backoff.
+"""
+Cancellation - Stop pipeline phases promptly from another thread.
+
+A CancellationToken is created per task and cancelled by whoever owns the
+task (e.g. the web service's cancel endpoint). Pipeline functions take the
+token as an argument and activate it with cancellation_scope(); code deeper
+down (LLM clients, retry loops, worker threads started with a copied
+context) calls check_cancelled() and cancellable_sleep() without needing
+the token threaded through every signature.
+
+Cancellation surfaces as TaskCancelledError, which the provider fallback
+and error-tolerant summary code let through instead of treating it as a
+provider failure.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+import threading
+import time
+
+from llm_data_structures import APIStats
+
+
+class TaskCancelledError(Exception):
+    """Raised when the task running the current code has been cancelled."""
+
+    def __init__(self, message: str = "Task was cancelled", api_stats: Optional[APIStats] = None):
+        super().__init__(message)
+        self.api_stats = api_stats  # calls made before cancellation, when known
+
+
+class CancellationToken:
+    """Thread-safe cancellation flag that also interrupts backoff sleeps."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise TaskCancelledError()
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep for seconds, raising TaskCancelledError as soon as the token is cancelled."""
+        if self._event.wait(seconds):
+            raise TaskCancelledError()
+
+
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar("cancellation_token", default=None)
+
+
+@contextmanager
+def cancellation_scope(token: Optional[CancellationToken]) -> Iterator[None]:
+    """Make token the one checked by code called inside the block (None: no-op)."""
+    if token is None:
+        yield
+        return
+    reset = _current_token.set(token)
+    try:
+        yield
+    finally:
+        _current_token.reset(reset)
+
+
+def check_cancelled() -> None:
+    """Raise TaskCancelledError if the current task has been cancelled."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def cancellable_sleep(seconds: float) -> None:
+    """time.sleep that wakes up and raises when the current task is cancelled."""
+    token = _current_token.get()
+    if token is None:
+        time.sleep(seconds)
+    else:
+        token.sleep(seconds)
@@ -11,7 +11,6 @@ deduplication, stats) is inherited from BaseLLMClient.
 
 from typing import Dict, Any
 import os
-import time
 import logging
 
 try:
@@ -19,9 +18,16 @@ try:
 except ImportError:
     openai = None
 
-from base_llm_client import BaseLLMClient
+from base_llm_client import BaseLLMClient, ENTITY_SCHEMA
+from cancellation import cancellable_sleep
 from config_manager import CBORGConfig
 
+# OpenAI-compatible structured output constrained to the entity schema
+ENTITY_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "journal_entities", "schema": ENTITY_SCHEMA, "strict": True},
+}
+
 
 class CBORGClient(BaseLLMClient):
     """
@@ -61,6 +67,9 @@ class CBORGClient(BaseLLMClient):
             timeout=config.timeout,
         )
         super().__init__()
+        self._init_rate_limiter("cborg", config.model, config)
+        # CBORG proxies many models; cleared if the model rejects response_format
+        self._response_format_supported = True
 
         self.logger.info(f"Initialized CBORG client with model: {config.model}")
         self.logger.info(f"Endpoint: {config.endpoint}")
@@ -81,27 +90,24 @@ class CBORGClient(BaseLLMClient):
         """
         for attempt in range(self.config.max_retries + 1):
             try:
-                response = self.client.chat.completions.create(
-                    model=self.config.model,
-                    messages=[
-                        {"role": "system", "content": system},
-                        {"role": "user", "content": user},
-                    ],
-                    temperature=0.1,
-                    max_tokens=1000,
-                )
+                with self._request_slot(system, user):
+                    response = self._create_completion(system, user)
+                self._record_request_success()
                 return response.choices[0].message.content
 
             except Exception as e:
                 error_message = str(e).lower()
 
+                if self._is_rate_limit(error_message):
+                    self._record_rate_limit()
+
                 if self._is_retryable(error_message):
                     if attempt < self.config.max_retries:
                         wait_time = (2 ** attempt) + 1
                         self.logger.warning(
                             f"Retryable error, waiting {wait_time}s before retry {attempt + 1}: {e}"
                         )
-                        time.sleep(wait_time)
+                        cancellable_sleep(wait_time)
                         continue
 
                 # Non-retryable or exhausted retries
@@ -112,6 +118,38 @@ class CBORGClient(BaseLLMClient):
             f"Failed to complete API call after {self.config.max_retries + 1} attempts"
         )
 
+    def _create_completion(self, system: str, user: str):
+        """
+        Send one chat completion, with structured output when the model supports it.
+
+        A model that rejects response_format is asked again without it, and
+        later requests skip it; the prompt still asks for JSON.
+        """
+        request = dict(
+            model=self.config.model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            temperature=0.1,
+            max_tokens=1000,
+        )
+        if self.structured_output and self._response_format_supported:
+            try:
+                return self.client.chat.completions.create(
+                    **request, response_format=ENTITY_RESPONSE_FORMAT
+                )
+            except Exception as e:
+                if "response_format" not in str(e).lower():
+                    raise
+                self.logger.warning(f"Model {self.config.model} does not support response_format: {e}")
+                self._response_format_supported = False
+        return self.client.chat.completions.create(**request)
+
+    def _is_rate_limit(self, error_message: str) -> bool:
+        """Check if an error is the provider refusing a request for quota reasons."""
+        return any(indicator in error_message for indicator in ("rate limit", "too many requests", "429"))
+
     def _is_retryable(self, error_message: str) -> bool:
         """Check if an error should be retried (rate limits, network issues)."""
         retryable_indicators = [
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# ABOUTME: Per-provider circuit breaker and latency tracking for the unified LLM client.
+# ABOUTME: Skips providers that keep failing and supplies p95 deadlines for hedged requests.
+"""
+Circuit Breaker - Provider health tracking for UnifiedLLMClient.
+
+A CircuitBreaker opens after a run of consecutive failures so the provider
+is skipped outright instead of costing a full retry/backoff cycle per file.
+After reset_timeout it lets a single probe request through (half-open);
+success closes the circuit again, failure re-opens it.
+
+A LatencyTracker keeps recent successful response times so the unified
+client can hedge: if a provider has not answered by its p95 latency, the
+next provider in the chain is asked in parallel.
+"""
+
+from collections import deque
+from typing import Callable, Deque, Optional
+import math
+import threading
+import time
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RESET_TIMEOUT = 30.0
+
+# Hedging needs a stable percentile; below this many samples it is disabled.
+LATENCY_WINDOW = 100
+MIN_LATENCY_SAMPLES = 20
+
+
+class ProviderUnavailableError(Exception):
+    """Raised when every provider in the chain has an open circuit."""
+    pass
+
+
+class CircuitBreaker:
+    """
+    Closed → open → half-open state machine for one provider.
+
+    Usage:
+        if breaker.allow_request():
+            ... call provider ...
+            breaker.record_success()  # or breaker.record_failure()
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            name: Provider name, for logs.
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds an open circuit waits before a probe.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Return True if a request may be sent now.
+
+        An open circuit whose timeout has elapsed moves to half-open and
+        admits exactly one probe; other callers are refused until it reports.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_abandoned(self) -> None:
+        """The admitted request was abandoned (e.g. cancelled) without an outcome."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+
+class LatencyTracker:
+    """Sliding window of successful response times for one provider."""
+
+    def __init__(self, window: int = LATENCY_WINDOW, min_samples: int = MIN_LATENCY_SAMPLES):
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, fraction: float = 0.95) -> Optional[float]:
+        """Nearest-rank percentile, or None until min_samples are recorded."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        rank = max(1, math.ceil(fraction * len(ordered)))
+        return ordered[rank - 1]
@@ -75,6 +75,10 @@ class BedrockConfig:
     timeout: int = 30
     max_retries: int = 3
     rate_limit_delay: float = 1.0
+    requests_per_minute: Optional[int] = None  # client-side quota; None = unlimited
+    tokens_per_minute: Optional[int] = None
+    max_concurrency: int = 8  # ceiling for the adaptive concurrency limit
+    prompt_caching: bool = False  # cache_control on the system prompt
 
 
 @dataclass
@@ -83,6 +87,11 @@ class GoogleGenAIConfig:
     project: str = "your-gcp-project-id"
     location: str = "us-central1"
     model: str = "gemini-2.0-flash-001"
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    max_concurrency: int = 8
+    prompt_caching: bool = False  # serve the system prompt from cached content
+    prompt_cache_ttl_seconds: int = 3600
 
 
 @dataclass
@@ -94,13 +103,38 @@ class CBORGConfig:
     max_retries: int = 3
     rate_limit_delay: float = 1.0
     timeout: int = 30
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    max_concurrency: int = 8
+
+
+@dataclass
+class MockConfig:
+    """Configuration for the offline mock provider used for load and performance testing."""
+    model: str = "mock-entities"
+    latency_ms: float = 200.0  # median simulated response time
+    latency_sigma: float = 0.5  # spread of the log-normal latency; 0 = fixed latency
+    error_rate: float = 0.0  # fraction of requests failing with a simulated server error
+    rate_limit_rate: float = 0.0  # fraction of requests refused with a simulated 429
+    seed: int = 0  # seeds latency and error injection
+    max_retries: int = 3
+    rate_limit_delay: float = 0.5  # first retry wait; doubles on each retry
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    max_concurrency: int = 8
 
 
 @dataclass
 class LLMConfig:
     """Configuration for LLM provider selection and fallback chain."""
-    provider: str = "bedrock"  # Options: "bedrock", "google_genai", or "cborg"
+    provider: str = "bedrock"  # Options: "bedrock", "google_genai", "cborg" or "mock"
     fallback_providers: List[str] = field(default_factory=list)  # e.g. ["bedrock", "cborg"]
+    analysis_chunk_tokens: int = 2000  # estimated content tokens per analysis request
+    analysis_concurrency: int = 4  # chunks of one entry analyzed at once
+    circuit_failure_threshold: int = 3  # consecutive failures before a provider is skipped
+    circuit_reset_seconds: float = 30.0  # wait before probing a skipped provider again
+    hedge_requests: bool = False  # race the next provider when one exceeds its p95 latency
+    structured_output: bool = True  # provider-native JSON output for entity extraction
 
 
 @dataclass
@@ -111,6 +145,24 @@ class ProcessingConfig:
     max_file_size_mb: int = 50
     batch_size: int = 10
     database_path: Optional[str] = None
+    stream_threshold_mb: int = 4
+    analysis_budget_chars: int = 100000
+    analysis_sampling: str = "head"
+
+
+@dataclass
+class DatabaseConfig:
+    """SQLite performance profile applied to every web database connection."""
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size_mb: int = 64
+    cache_size_mb: int = 16
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5000
+    pool_size: int = 5
+    max_overflow: int = 5
+    read_pool_size: int = 5
+    sync_history_retention_days: int = 30
 
 
 @dataclass
@@ -129,10 +181,12 @@ class AppConfig:
     bedrock: BedrockConfig = field(default_factory=BedrockConfig)
     google_genai: GoogleGenAIConfig = field(default_factory=GoogleGenAIConfig)
     cborg: CBORGConfig = field(default_factory=CBORGConfig)
+    mock: MockConfig = field(default_factory=MockConfig)
     llm: LLMConfig = field(default_factory=LLMConfig)
     processing: ProcessingConfig = field(default_factory=ProcessingConfig)
     logging: LogConfig = field(default_factory=LogConfig)
     auth: AuthConfig = field(default_factory=AuthConfig)
+    database: DatabaseConfig = field(default_factory=DatabaseConfig)
 
 
 class ConfigManager:
@@ -261,6 +315,9 @@ class ConfigManager:
             'WJS_GOOGLE_GENAI_LOCATION': ['google_genai', 'location'],
             'WJS_GOOGLE_GENAI_MODEL': ['google_genai', 'model'],
             'WJS_LLM_PROVIDER': ['llm', 'provider'],
+            'WJS_MOCK_LATENCY_MS': ['mock', 'latency_ms'],
+            'WJS_MOCK_ERROR_RATE': ['mock', 'error_rate'],
+            'WJS_MOCK_RATE_LIMIT_RATE': ['mock', 'rate_limit_rate'],
             'WJS_BASE_PATH': ['processing', 'base_path'],
             'WJS_OUTPUT_PATH': ['processing', 'output_path'],
             'WJS_DATABASE_PATH': ['processing', 'database_path'],
@@ -284,6 +341,8 @@ class ConfigManager:
                 final_key = config_path[-1]
                 if final_key == 'max_file_size_mb':
                     current[final_key] = int(value)
+                elif final_key in ('latency_ms', 'error_rate', 'rate_limit_rate'):
+                    current[final_key] = float(value)
                 elif final_key == 'level':
                     current[final_key] = value.upper()
                 else:
@@ -310,7 +369,11 @@ class ConfigManager:
             aws_secret_key_env=bedrock_dict.get('aws_secret_key_env', BedrockConfig.aws_secret_key_env),
             timeout=bedrock_dict.get('timeout', BedrockConfig.timeout),
             max_retries=bedrock_dict.get('max_retries', BedrockConfig.max_retries),
-            rate_limit_delay=bedrock_dict.get('rate_limit_delay', BedrockConfig.rate_limit_delay)
+            rate_limit_delay=bedrock_dict.get('rate_limit_delay', BedrockConfig.rate_limit_delay),
+            requests_per_minute=bedrock_dict.get('requests_per_minute', BedrockConfig.requests_per_minute),
+            tokens_per_minute=bedrock_dict.get('tokens_per_minute', BedrockConfig.tokens_per_minute),
+            max_concurrency=bedrock_dict.get('max_concurrency', BedrockConfig.max_concurrency),
+            prompt_caching=bedrock_dict.get('prompt_caching', BedrockConfig.prompt_caching)
         )
         
         # Extract Google GenAI configuration
@@ -318,7 +381,14 @@ class ConfigManager:
         google_genai_config = GoogleGenAIConfig(
             project=google_genai_dict.get('project', GoogleGenAIConfig.project),
             location=google_genai_dict.get('location', GoogleGenAIConfig.location),
-            model=google_genai_dict.get('model', GoogleGenAIConfig.model)
+            model=google_genai_dict.get('model', GoogleGenAIConfig.model),
+            requests_per_minute=google_genai_dict.get('requests_per_minute', GoogleGenAIConfig.requests_per_minute),
+            tokens_per_minute=google_genai_dict.get('tokens_per_minute', GoogleGenAIConfig.tokens_per_minute),
+            max_concurrency=google_genai_dict.get('max_concurrency', GoogleGenAIConfig.max_concurrency),
+            prompt_caching=google_genai_dict.get('prompt_caching', GoogleGenAIConfig.prompt_caching),
+            prompt_cache_ttl_seconds=google_genai_dict.get(
+                'prompt_cache_ttl_seconds', GoogleGenAIConfig.prompt_cache_ttl_seconds
+            )
         )
         
         # Extract CBORG configuration
@@ -329,14 +399,39 @@ class ConfigManager:
             model=cborg_dict.get('model', CBORGConfig.model),
             max_retries=cborg_dict.get('max_retries', CBORGConfig.max_retries),
             rate_limit_delay=cborg_dict.get('rate_limit_delay', CBORGConfig.rate_limit_delay),
-            timeout=cborg_dict.get('timeout', CBORGConfig.timeout)
+            timeout=cborg_dict.get('timeout', CBORGConfig.timeout),
+            requests_per_minute=cborg_dict.get('requests_per_minute', CBORGConfig.requests_per_minute),
+            tokens_per_minute=cborg_dict.get('tokens_per_minute', CBORGConfig.tokens_per_minute),
+            max_concurrency=cborg_dict.get('max_concurrency', CBORGConfig.max_concurrency)
+        )
+
+        # Extract mock provider configuration
+        mock_dict = config_dict.get('mock', {})
+        mock_config = MockConfig(
+            model=mock_dict.get('model', MockConfig.model),
+            latency_ms=mock_dict.get('latency_ms', MockConfig.latency_ms),
+            latency_sigma=mock_dict.get('latency_sigma', MockConfig.latency_sigma),
+            error_rate=mock_dict.get('error_rate', MockConfig.error_rate),
+            rate_limit_rate=mock_dict.get('rate_limit_rate', MockConfig.rate_limit_rate),
+            seed=mock_dict.get('seed', MockConfig.seed),
+            max_retries=mock_dict.get('max_retries', MockConfig.max_retries),
+            rate_limit_delay=mock_dict.get('rate_limit_delay', MockConfig.rate_limit_delay),
+            requests_per_minute=mock_dict.get('requests_per_minute', MockConfig.requests_per_minute),
+            tokens_per_minute=mock_dict.get('tokens_per_minute', MockConfig.tokens_per_minute),
+            max_concurrency=mock_dict.get('max_concurrency', MockConfig.max_concurrency)
         )
 
         # Extract LLM configuration
         llm_dict = config_dict.get('llm', {})
         llm_config = LLMConfig(
             provider=llm_dict.get('provider', LLMConfig.provider),
-            fallback_providers=llm_dict.get('fallback_providers', [])
+            fallback_providers=llm_dict.get('fallback_providers', []),
+            analysis_chunk_tokens=llm_dict.get('analysis_chunk_tokens', LLMConfig.analysis_chunk_tokens),
+            analysis_concurrency=llm_dict.get('analysis_concurrency', LLMConfig.analysis_concurrency),
+            circuit_failure_threshold=llm_dict.get('circuit_failure_threshold', LLMConfig.circuit_failure_threshold),
+            circuit_reset_seconds=llm_dict.get('circuit_reset_seconds', LLMConfig.circuit_reset_seconds),
+            hedge_requests=llm_dict.get('hedge_requests', LLMConfig.hedge_requests),
+            structured_output=llm_dict.get('structured_output', LLMConfig.structured_output)
         )
         
         # Extract processing configuration
@@ -346,7 +441,10 @@ class ConfigManager:
             output_path=processing_dict.get('output_path', ProcessingConfig.output_path),
             max_file_size_mb=processing_dict.get('max_file_size_mb', ProcessingConfig.max_file_size_mb),
             batch_size=processing_dict.get('batch_size', ProcessingConfig.batch_size),
-            database_path=processing_dict.get('database_path', ProcessingConfig.database_path)
+            database_path=processing_dict.get('database_path', ProcessingConfig.database_path),
+            stream_threshold_mb=processing_dict.get('stream_threshold_mb', ProcessingConfig.stream_threshold_mb),
+            analysis_budget_chars=processing_dict.get('analysis_budget_chars', ProcessingConfig.analysis_budget_chars),
+            analysis_sampling=processing_dict.get('analysis_sampling', ProcessingConfig.analysis_sampling)
         )
         
         # Extract logging configuration
@@ -380,14 +478,32 @@ class ConfigManager:
             refresh_token_ttl=auth_dict.get('refresh_token_ttl', AuthConfig.refresh_token_ttl),
         )
 
+        # Extract database performance configuration
+        database_dict = config_dict.get('database', {})
+        database_config = DatabaseConfig(
+            journal_mode=database_dict.get('journal_mode', DatabaseConfig.journal_mode),
+            synchronous=database_dict.get('synchronous', DatabaseConfig.synchronous),
+            mmap_size_mb=database_dict.get('mmap_size_mb', DatabaseConfig.mmap_size_mb),
+            cache_size_mb=database_dict.get('cache_size_mb', DatabaseConfig.cache_size_mb),
+            temp_store=database_dict.get('temp_store', DatabaseConfig.temp_store),
+            busy_timeout_ms=database_dict.get('busy_timeout_ms', DatabaseConfig.busy_timeout_ms),
+            pool_size=database_dict.get('pool_size', DatabaseConfig.pool_size),
+            max_overflow=database_dict.get('max_overflow', DatabaseConfig.max_overflow),
+            read_pool_size=database_dict.get('read_pool_size', DatabaseConfig.read_pool_size),
+            sync_history_retention_days=database_dict.get('sync_history_retention_days',
+                                                          DatabaseConfig.sync_history_retention_days),
+        )
+
         return AppConfig(
             bedrock=bedrock_config,
             google_genai=google_genai_config,
             cborg=cborg_config,
+            mock=mock_config,
             llm=llm_config,
             processing=processing_config,
             logging=logging_config,
             auth=auth_config,
+            database=database_config,
         )
     
     def _validate_config(self, config: AppConfig) -> None:
@@ -401,7 +517,7 @@ class ConfigManager:
             ValueError: If configuration is invalid
         """
         # Validate LLM provider
-        valid_providers = ["bedrock", "google_genai", "cborg"]
+        valid_providers = ["bedrock", "google_genai", "cborg", "mock"]
         if config.llm.provider not in valid_providers:
             raise ValueError(f"Invalid LLM provider '{config.llm.provider}'. Must be one of: {valid_providers}")
 
@@ -412,6 +528,31 @@ class ConfigManager:
             if fb == config.llm.provider:
                 raise ValueError(f"Fallback provider '{fb}' cannot be the same as the primary provider")
         
+        if config.llm.analysis_chunk_tokens <= 0 or config.llm.analysis_concurrency <= 0:
+            raise ValueError("analysis_chunk_tokens and analysis_concurrency must be positive")
+        
+        if config.llm.circuit_failure_threshold <= 0 or config.llm.circuit_reset_seconds < 0:
+            raise ValueError("circuit_failure_threshold must be positive and circuit_reset_seconds non-negative")
+        
+        for section in ("bedrock", "google_genai", "cborg", "mock"):
+            provider_config = getattr(config, section)
+            for limit in ("requests_per_minute", "tokens_per_minute"):
+                value = getattr(provider_config, limit)
+                if value is not None and value <= 0:
+                    raise ValueError(f"{section}.{limit} must be positive or null")
+            if provider_config.max_concurrency <= 0:
+                raise ValueError(f"{section}.max_concurrency must be positive")
+        
+        if config.google_genai.prompt_cache_ttl_seconds <= 0:
+            raise ValueError("google_genai.prompt_cache_ttl_seconds must be positive")
+        
+        if config.mock.latency_ms < 0 or config.mock.latency_sigma < 0:
+            raise ValueError("mock.latency_ms and mock.latency_sigma must not be negative")
+        
+        for rate in ("error_rate", "rate_limit_rate"):
+            if not 0 <= getattr(config.mock, rate) <= 1:
+                raise ValueError(f"mock.{rate} must be between 0 and 1")
+        
         # Validate paths exist or can be created
         base_path = Path(config.processing.base_path).expanduser()
         output_path = Path(config.processing.output_path).expanduser()
@@ -430,6 +571,34 @@ class ConfigManager:
         if config.processing.max_file_size_mb <= 0:
             raise ValueError("max_file_size_mb must be positive")
         
+        if config.processing.stream_threshold_mb <= 0:
+            raise ValueError("stream_threshold_mb must be positive")
+        
+        if config.processing.analysis_budget_chars <= 0:
+            raise ValueError("analysis_budget_chars must be positive")
+        
+        valid_sampling = ["head", "tail", "sample"]
+        if config.processing.analysis_sampling not in valid_sampling:
+            raise ValueError(f"Invalid analysis_sampling '{config.processing.analysis_sampling}'. Must be one of: {valid_sampling}")
+        
+        valid_journal_modes = ["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"]
+        if config.database.journal_mode.upper() not in valid_journal_modes:
+            raise ValueError(f"Invalid database journal_mode '{config.database.journal_mode}'. Must be one of: {valid_journal_modes}")
+        
+        valid_synchronous = ["OFF", "NORMAL", "FULL", "EXTRA"]
+        if config.database.synchronous.upper() not in valid_synchronous:
+            raise ValueError(f"Invalid database synchronous '{config.database.synchronous}'. Must be one of: {valid_synchronous}")
+        
+        valid_temp_store = ["DEFAULT", "FILE", "MEMORY"]
+        if config.database.temp_store.upper() not in valid_temp_store:
+            raise ValueError(f"Invalid database temp_store '{config.database.temp_store}'. Must be one of: {valid_temp_store}")
+        
+        if config.database.pool_size <= 0 or config.database.read_pool_size <= 0:
+            raise ValueError("database pool sizes must be positive")
+        
+        if config.database.sync_history_retention_days <= 0:
+            raise ValueError("sync_history_retention_days must be positive")
+        
         if config.bedrock.timeout <= 0:
             raise ValueError("bedrock timeout must be positive")
         
@@ -519,19 +688,34 @@ class ConfigManager:
         example_config = {
             'llm': {
                 'provider': 'google_genai',
-                'fallback_providers': ['bedrock', 'cborg']
+                'fallback_providers': ['bedrock', 'cborg'],
+                'analysis_chunk_tokens': 2000,
+                'analysis_concurrency': 4,
+                'circuit_failure_threshold': 3,
+                'circuit_reset_seconds': 30.0,
+                'hedge_requests': False,
+                'structured_output': True
             },
             'bedrock': {
                 'region': 'us-east-2',
                 'model_id': 'anthropic.claude-sonnet-4-20250514-v1:0',
                 'timeout': 30,
                 'max_retries': 3,
-                'rate_limit_delay': 1.0
+                'rate_limit_delay': 1.0,
+                'requests_per_minute': None,
+                'tokens_per_minute': None,
+                'max_concurrency': 8,
+                'prompt_caching': False
             },
             'google_genai': {
                 'project': 'your-gcp-project-id',
                 'location': 'us-central1',
-                'model': 'gemini-2.0-flash-001'
+                'model': 'gemini-2.0-flash-001',
+                'requests_per_minute': None,
+                'tokens_per_minute': None,
+                'max_concurrency': 8,
+                'prompt_caching': False,
+                'prompt_cache_ttl_seconds': 3600
             },
             'cborg': {
                 'endpoint': 'https://cborg.lbl.gov/v1',
@@ -539,14 +723,33 @@ class ConfigManager:
                 'model': 'lbl/cborg-chat:latest',
                 'max_retries': 3,
                 'rate_limit_delay': 1.0,
-                'timeout': 30
+                'timeout': 30,
+                'requests_per_minute': None,
+                'tokens_per_minute': None,
+                'max_concurrency': 8
+            },
+            'mock': {
+                'model': 'mock-entities',
+                'latency_ms': 200.0,
+                'latency_sigma': 0.5,
+                'error_rate': 0.0,
+                'rate_limit_rate': 0.0,
+                'seed': 0,
+                'max_retries': 3,
+                'rate_limit_delay': 0.5,
+                'requests_per_minute': None,
+                'tokens_per_minute': None,
+                'max_concurrency': 8
             },
             'processing': {
                 'base_path': '~/Desktop/worklogs/',
                 'output_path': '~/Desktop/worklogs/summaries/',
                 'database_path': None,
                 'max_file_size_mb': 50,
-                'batch_size': 10
+                'batch_size': 10,
+                'stream_threshold_mb': 4,
+                'analysis_budget_chars': 100000,
+                'analysis_sampling': 'head'
             },
             'logging': {
                 'level': 'INFO',
@@ -564,6 +767,18 @@ class ConfigManager:
                 'secret_key': '',
                 'access_token_ttl': 1800,
                 'refresh_token_ttl': 604800,
+            },
+            'database': {
+                'journal_mode': 'WAL',
+                'synchronous': 'NORMAL',
+                'mmap_size_mb': 64,
+                'cache_size_mb': 16,
+                'temp_store': 'MEMORY',
+                'busy_timeout_ms': 5000,
+                'pool_size': 5,
+                'max_overflow': 5,
+                'read_pool_size': 5,
+                'sync_history_retention_days': 30,
             }
         }
         
@@ -595,6 +810,9 @@ class ConfigManager:
         elif self.config.llm.provider == "cborg":
             print(f"CBORG Endpoint: {self.config.cborg.endpoint}")
             print(f"CBORG Model: {self.config.cborg.model}")
+        elif self.config.llm.provider == "mock":
+            print(f"Mock Latency: {self.config.mock.latency_ms} ms (sigma {self.config.mock.latency_sigma})")
+            print(f"Mock Error Rate: {self.config.mock.error_rate}, 429 Rate: {self.config.mock.rate_limit_rate}")
 
         if self.config.llm.fallback_providers:
             print(f"Fallback Providers: {', '.join(self.config.llm.fallback_providers)}")
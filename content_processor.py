@@ -6,22 +6,68 @@ content sanitization, and comprehensive error handling. It processes journal
 files discovered by the FileDiscovery system and prepares them for LLM analysis.
 
 Key features:
-- Automatic encoding detection using chardet
+- Single-read decoding: BOM sniffing and strict UTF-8 first, chardet only as a fallback
+- Per-file encoding cache keyed by path, size and mtime
 - Content sanitization and normalization
 - File size limits and memory management
 - Comprehensive error handling and recovery
 - Processing statistics and performance tracking
+- Parallel file reading with an optional process pool for CPU-bound work
+- Streaming mode for large files: bounded memory, full statistics, and a
+  head/tail/sampled excerpt kept for analysis
 """
 
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 from typing import List, Optional, Dict, Tuple
 import chardet
+import codecs
 import logging
+import threading
 import time
 import re
 
+# Default number of concurrent file reads; reads are I/O bound (often on
+# network home directories), so this is independent of the CPU count.
+DEFAULT_IO_WORKERS = 8
+
+# Byte order marks, longest first so UTF-32 LE is not mistaken for UTF-16 LE
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Encodings detected for previously seen files, keyed by (path, size, mtime_ns).
+# Shared across ContentProcessor instances so repeated runs skip detection.
+ENCODING_CACHE_SIZE = 10000
+_encoding_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_encoding_cache_lock = threading.Lock()
+
+# Sanitization patterns, applied as whole-document substitutions
+_LINE_ENDINGS = re.compile(r'\r\n?')
+_EXCESS_BLANK_LINES = re.compile(r'\n{4,}')
+_ALNUM_CHAR = re.compile(r'[^\W_]')  # same characters as str.isalnum()
+
+# Minimum alphanumeric characters for content to count as meaningful
+MIN_ALNUM_CHARS = 3
+
+# Files above the stream threshold are read in STREAM_CHUNK_SIZE pieces and
+# only an analysis budget of sanitized text is kept in memory.
+DEFAULT_STREAM_THRESHOLD_MB = 4
+DEFAULT_ANALYSIS_BUDGET_CHARS = 100_000
+STREAM_CHUNK_SIZE = 256 * 1024
+WORD_COUNT_SLICE = 64 * 1024
+ENCODING_SAMPLE_SIZE = 32768
+SAMPLING_STRATEGIES = ("head", "tail", "sample")
+SAMPLE_EXCERPTS = 8
+OMISSION_MARKER = "[...]"
+
 
 @dataclass
 class ProcessedContent:
@@ -39,6 +85,22 @@ class ProcessedContent:
     encoding: str
     processing_time: float
     errors: List[str]
+    truncated: bool = False  # content is an excerpt; counts describe the whole file
+
+
+@dataclass
+class SanitizedContent:
+    """
+    Result of the single-pass sanitizer.
+    
+    Carries the normalized text together with the statistics that used to be
+    computed by separate passes over the document.
+    """
+    text: str
+    word_count: int
+    line_count: int
+    is_meaningful: bool
+    truncated: bool = False
 
 
 @dataclass
@@ -57,6 +119,227 @@ class ProcessingStats:
     processing_time: float
 
 
+@dataclass
+class _LoadedFile:
+    """Outcome of statting (and, below the stream threshold, reading) one file."""
+    file_size: int
+    fingerprint: Optional[Tuple]
+    start_time: float
+    raw: Optional[bytes] = None
+    stream: bool = False
+
+
+class _ContentRetainer:
+    """
+    Keeps at most a fixed budget of streamed, sanitized text.
+    
+    "head" keeps the beginning, "tail" the end, and "sample" keeps
+    SAMPLE_EXCERPTS excerpts starting at evenly spaced byte offsets of the
+    input. The first budget characters are always held, so a document that
+    turns out to fit is returned whole whatever the strategy.
+    """
+    
+    def __init__(self, strategy: str, budget: int, total_bytes: int):
+        self.strategy = strategy
+        self.budget = budget
+        self.total_chars = 0
+        self._head: List[str] = []
+        self._head_chars = 0
+        self._tail: deque = deque()
+        self._tail_chars = 0
+        self._excerpt_size = max(1, budget // SAMPLE_EXCERPTS)
+        self._excerpt_starts = [total_bytes * i // SAMPLE_EXCERPTS for i in range(SAMPLE_EXCERPTS)]
+        self._next_excerpt = 0
+        self._capture_left = 0
+        self._excerpts: List[List[str]] = []
+    
+    def add(self, text: str, input_offset: int) -> None:
+        """Offer sanitized text that was decoded from the chunk at input_offset."""
+        self.total_chars += len(text)
+        
+        if self._head_chars < self.budget:
+            piece = text[:self.budget - self._head_chars]
+            self._head.append(piece)
+            self._head_chars += len(piece)
+        
+        if self.strategy == "tail":
+            self._tail.append(text)
+            self._tail_chars += len(text)
+            while self._tail_chars - len(self._tail[0]) >= self.budget:
+                self._tail_chars -= len(self._tail.popleft())
+        elif self.strategy == "sample":
+            self._add_sample(text, input_offset)
+    
+    def _add_sample(self, text: str, input_offset: int) -> None:
+        if not self._capture_left:
+            starts = self._excerpt_starts
+            if self._next_excerpt >= len(starts) or input_offset < starts[self._next_excerpt]:
+                return
+            # One excerpt per chunk, even if a chunk spans several start offsets
+            while self._next_excerpt < len(starts) and input_offset >= starts[self._next_excerpt]:
+                self._next_excerpt += 1
+            self._excerpts.append([])
+            self._capture_left = self._excerpt_size
+        
+        piece = text[:self._capture_left]
+        self._excerpts[-1].append(piece)
+        self._capture_left -= len(piece)
+    
+    def result(self) -> Tuple[str, bool]:
+        """Return (retained text, whether anything was left out)."""
+        if self.total_chars <= self.budget:
+            return "".join(self._head), False
+        
+        marker = "\n" + OMISSION_MARKER + "\n"
+        if self.strategy == "tail":
+            return OMISSION_MARKER + "\n" + "".join(self._tail)[-self.budget:], True
+        if self.strategy == "sample":
+            excerpts = ["".join(parts) for parts in self._excerpts]
+            return marker.join(excerpts) + marker.rstrip("\n"), True
+        return "".join(self._head) + marker.rstrip("\n"), True
+
+
+class _StreamingSanitizer:
+    """
+    Incremental equivalent of ContentProcessor._normalize().
+    
+    Text may be fed in arbitrary pieces. Complete lines are normalized a
+    chunk at a time with the same C-level operations as the whole-document
+    path; only the state that spans a boundary (a trailing CR, the unfinished
+    line, the current run of blank lines) is carried over. Output goes to a
+    _ContentRetainer while word, line and alphanumeric counts cover the whole
+    document. A line longer than max_line_chars is emitted in pieces so a
+    file without newlines cannot defeat the memory bound.
+    """
+    
+    def __init__(self, retainer: _ContentRetainer, max_line_chars: int = STREAM_CHUNK_SIZE):
+        self.retainer = retainer
+        self.max_line_chars = max_line_chars
+        self.word_count = 0
+        self.line_count = 0
+        self._alnum = 0
+        self._partial = ""
+        self._partial_emitted = False  # a prefix of the unfinished line was already output
+        self._pending_cr = False
+        self._blank_run = 0
+        self._started = False
+        self._ends_in_word = False
+        self._offset = 0
+    
+    def feed(self, text: str, input_offset: int = 0) -> None:
+        """Consume decoded text taken from the input chunk at input_offset."""
+        self._offset = input_offset
+        if self._pending_cr:
+            text = "\r" + text
+            self._pending_cr = False
+        # A CR at the end may be the first half of a CRLF split across chunks
+        if text.endswith("\r"):
+            text = text[:-1]
+            self._pending_cr = True
+        if not text:
+            return
+        
+        lines = _LINE_ENDINGS.sub("\n", text).split("\n")
+        lines[0] = self._partial + lines[0]
+        self._partial = lines.pop()
+        if lines:
+            self._emit_lines(lines)
+        if len(self._partial) > self.max_line_chars:
+            self._flush_partial()
+    
+    def finish(self) -> SanitizedContent:
+        """Flush the last line and return the retained text with full-document counts."""
+        # A pending CR only ends the last line; trailing blank lines are dropped anyway
+        self._pending_cr = False
+        last, self._partial = self._partial, ""
+        self._emit_lines([last])
+        
+        if not self._started:
+            return SanitizedContent(text="", word_count=0, line_count=0, is_meaningful=False)
+        
+        text, truncated = self.retainer.result()
+        return SanitizedContent(
+            text=text,
+            word_count=self.word_count,
+            line_count=self.line_count,
+            is_meaningful=self._alnum >= MIN_ALNUM_CHARS,
+            truncated=truncated
+        )
+    
+    def _emit_lines(self, lines: List[str]) -> None:
+        """Normalize and output complete lines."""
+        if self._partial_emitted:
+            # Remainder of a long line whose beginning is already out
+            self._partial_emitted = False
+            rest = lines[0].rstrip()
+            if rest:
+                self._emit(rest, continuation=True)
+            self._blank_run = 0
+            lines = lines[1:]
+            if not lines:
+                return
+        
+        lines = list(map(str.rstrip, lines))
+        empty = lines.count("")
+        if empty == len(lines):
+            self._blank_run += len(lines)
+            return
+        self.line_count += len(lines) - empty
+        
+        first = next(i for i, line in enumerate(lines) if line)
+        last = len(lines) - next(i for i, line in enumerate(reversed(lines)) if line)
+        body = "\n".join(lines[first:last])
+        if "\n\n\n\n" in body:
+            body = _EXCESS_BLANK_LINES.sub("\n\n\n", body)
+        
+        self._start_line(body, leading_blanks=first)
+        self._blank_run = len(lines) - last
+    
+    def _flush_partial(self) -> None:
+        """Output an over-long unfinished line up to its last visible character."""
+        visible = len(self._partial.rstrip())
+        if not visible:
+            return
+        prefix, self._partial = self._partial[:visible], self._partial[visible:]
+        if self._partial_emitted:
+            self._emit(prefix, continuation=True)
+        else:
+            self.line_count += 1
+            self._start_line(prefix)
+            self._blank_run = 0
+            self._partial_emitted = True
+    
+    def _start_line(self, text: str, leading_blanks: int = 0) -> None:
+        """Output text beginning on a new line, after at most two blank lines."""
+        if self._started:
+            text = "\n" * (min(self._blank_run + leading_blanks, 2) + 1) + text
+        else:
+            text = text.lstrip()
+        self._emit(text)
+    
+    def _emit(self, text: str, continuation: bool = False) -> None:
+        # Count words a slice at a time so split() never builds a chunk-sized list
+        words = 0
+        for start in range(0, len(text), WORD_COUNT_SLICE):
+            words += len(text[start:start + WORD_COUNT_SLICE].split())
+            if start and not text[start - 1].isspace() and not text[start].isspace():
+                words -= 1
+        # A word split between two pieces of the same line is one word
+        if continuation and self._ends_in_word and not text[0].isspace():
+            words -= 1
+        self.word_count += words
+        self._ends_in_word = not text[-1].isspace()
+        
+        if self._alnum < MIN_ALNUM_CHARS:
+            for _ in _ALNUM_CHAR.finditer(text):
+                self._alnum += 1
+                if self._alnum >= MIN_ALNUM_CHARS:
+                    break
+        
+        self._started = True
+        self.retainer.add(text, self._offset)
+
+
 class ContentProcessor:
     """
     Handles processing of journal files with encoding detection and content sanitization.
@@ -65,19 +348,46 @@ class ContentProcessor:
     - Automatic encoding detection with fallback strategies
     - Content sanitization and normalization
     - File size validation and memory management
+    - Streaming of large files with a bounded analysis excerpt
     - Comprehensive error handling and recovery
     - Performance tracking and statistics
     """
     
-    def __init__(self, max_file_size_mb: int = 50):
+    def __init__(self, max_file_size_mb: int = 50, max_workers: Optional[int] = None,
+                 use_process_pool: bool = False,
+                 stream_threshold_mb: float = DEFAULT_STREAM_THRESHOLD_MB,
+                 analysis_budget_chars: int = DEFAULT_ANALYSIS_BUDGET_CHARS,
+                 analysis_sampling: str = "head"):
         """
         Initialize ContentProcessor with configuration.
         
         Args:
             max_file_size_mb: Maximum file size in MB to process (default: 50MB)
+            max_workers: Concurrent file reads (default: DEFAULT_IO_WORKERS; 1 = serial)
+            use_process_pool: Run decoding and sanitization in worker processes
+                instead of the reading threads
+            stream_threshold_mb: Files larger than this are streamed in chunks
+                instead of being read whole (default: 4MB)
+            analysis_budget_chars: Sanitized characters kept from a streamed file
+            analysis_sampling: Which part of a streamed file to keep: "head",
+                "tail" or "sample" (evenly spaced excerpts)
+            
+        Raises:
+            ValueError: If analysis_sampling is not a known strategy
         """
+        if analysis_sampling not in SAMPLING_STRATEGIES:
+            raise ValueError(
+                f"analysis_sampling must be one of {', '.join(SAMPLING_STRATEGIES)}, "
+                f"got {analysis_sampling!r}"
+            )
+        
         self.max_file_size_mb = max_file_size_mb
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
+        self.max_workers = max_workers if max_workers is not None else DEFAULT_IO_WORKERS
+        self.use_process_pool = use_process_pool
+        self.stream_threshold_bytes = int(stream_threshold_mb * 1024 * 1024)
+        self.analysis_budget_chars = analysis_budget_chars
+        self.analysis_sampling = analysis_sampling
         self.logger = logging.getLogger(__name__)
     
     def process_files(self, file_paths: List[Path]) -> Tuple[List[ProcessedContent], ProcessingStats]:
@@ -85,7 +395,8 @@ class ContentProcessor:
         Process all files and return content with comprehensive statistics.
         
         Files are processed in chronological order based on their filenames.
-        Individual file failures do not stop the overall processing.
+        Individual file failures do not stop the overall processing. Files are
+        read concurrently when max_workers > 1; results keep chronological order.
         
         Args:
             file_paths: List of file paths to process
@@ -106,21 +417,13 @@ class ContentProcessor:
         successful_count = 0
         failed_count = 0
         
-        for file_path in sorted_files:
-            try:
-                # Process individual file
-                content = self._process_single_file(file_path)
-                
-                if content:
-                    processed_content.append(content)
-                    total_size_bytes += file_path.stat().st_size if file_path.exists() else 0
-                    total_words += content.word_count
-                    successful_count += 1
-                else:
-                    failed_count += 1
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to process file {file_path}: {e}")
+        for content, file_size in self._process_all(sorted_files):
+            if content:
+                processed_content.append(content)
+                total_size_bytes += file_size
+                total_words += content.word_count
+                successful_count += 1
+            else:
                 failed_count += 1
         
         processing_time = time.time() - start_time
@@ -166,6 +469,92 @@ class ContentProcessor:
         
         return sorted(file_paths, key=extract_date)
     
+    def _process_all(self, sorted_files: List[Path]) -> List[Tuple[Optional[ProcessedContent], int]]:
+        """
+        Process files serially or in parallel, preserving input order.
+        
+        Threads overlap the stat/read latency; with use_process_pool the
+        decode/sanitize step is handed to worker processes as each read completes.
+        
+        Args:
+            sorted_files: File paths in chronological order
+            
+        Returns:
+            List of (ProcessedContent or None, file size in bytes), one per file
+        """
+        workers = min(self.max_workers, len(sorted_files))
+        if workers <= 1:
+            return [self._process_file(file_path) for file_path in sorted_files]
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="content-io") as io_pool:
+            if not self.use_process_pool:
+                return list(io_pool.map(self._process_file, sorted_files))
+            
+            with ProcessPoolExecutor(max_workers=workers) as cpu_pool:
+                pending = []
+                for file_path, loaded in zip(sorted_files, io_pool.map(self._load_file_safely, sorted_files)):
+                    hint = self._cached_encoding(loaded.fingerprint)
+                    future = None
+                    if loaded.stream:
+                        # Streaming is read-bound and already memory-bounded; keep it on a thread
+                        future = io_pool.submit(self._stream_content, file_path,
+                                                loaded.file_size, loaded.start_time, hint)
+                    elif loaded.raw is not None:
+                        future = cpu_pool.submit(self._build_content, file_path, loaded.raw,
+                                                 loaded.start_time, hint)
+                    pending.append((file_path, future, loaded.file_size, loaded.fingerprint))
+                
+                # Workers cannot update this process's cache, so record encodings here
+                results = []
+                for file_path, future, file_size, fingerprint in pending:
+                    content = None
+                    if future is not None:
+                        try:
+                            content = future.result()
+                        except Exception as e:
+                            self.logger.error(f"Failed to process file {file_path}: {e}")
+                    if content:
+                        self._remember_encoding(fingerprint, content.encoding)
+                    results.append((content, file_size))
+                return results
+    
+    def _process_file(self, file_path: Path) -> Tuple[Optional[ProcessedContent], int]:
+        """
+        Read and process one file, never raising.
+        
+        Returns:
+            Tuple of (ProcessedContent or None, file size in bytes)
+        """
+        try:
+            loaded = self._load_file(file_path)
+            hint = self._cached_encoding(loaded.fingerprint)
+            if loaded.stream:
+                content = self._stream_content(file_path, loaded.file_size, loaded.start_time, hint)
+            elif loaded.raw is not None:
+                content = self._build_content(file_path, loaded.raw, loaded.start_time, hint)
+            else:
+                return None, loaded.file_size
+            if content:
+                self._remember_encoding(loaded.fingerprint, content.encoding)
+            return content, loaded.file_size
+        except Exception as e:
+            self.logger.error(f"Failed to process file {file_path}: {e}")
+            return None, 0
+    
+    def _load_file_safely(self, file_path: Path) -> _LoadedFile:
+        """
+        Load one file for the process pool, never raising.
+        
+        Returns:
+            _LoadedFile; an unreadable file comes back empty, sized 0, like
+            a failure in _process_file()
+        """
+        try:
+            return self._load_file(file_path)
+        except Exception as e:
+            self.logger.error(f"Failed to process file {file_path}: {e}")
+            return _LoadedFile(0, None, time.time())
+    
     def _process_single_file(self, file_path: Path) -> Optional[ProcessedContent]:
         """
         Process a single file with comprehensive error handling.
@@ -176,49 +565,84 @@ class ContentProcessor:
         Returns:
             ProcessedContent object if successful, None if failed
         """
+        return self._process_file(file_path)[0]
+    
+    def _load_file(self, file_path: Path) -> _LoadedFile:
+        """
+        Stat and read a file once, applying the size limits.
+        
+        Files above the stream threshold are not read here; they are marked
+        for _stream_content() instead.
+        
+        Args:
+            file_path: Path to the file to read
+            
+        Returns:
+            _LoadedFile with the raw bytes (None if the file was rejected or
+            is to be streamed), file size, encoding cache fingerprint and start time
+        """
         start_time = time.time()
-        errors = []
         
         try:
-            # Check if file exists
-            if not file_path.exists():
-                errors.append(f"File does not exist: {file_path}")
-                return None
-            
-            # Check file size
-            file_size = file_path.stat().st_size
-            if file_size > self.max_file_size_bytes:
-                errors.append(f"File too large: {file_size} bytes (max: {self.max_file_size_bytes})")
-                return None
-            
-            if file_size == 0:
-                errors.append("File is empty")
-                return None
+            file_stat = file_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            self.logger.debug(f"File does not exist: {file_path}")
+            return _LoadedFile(0, None, start_time)
+        
+        file_size = file_stat.st_size
+        fingerprint = (str(file_path), file_size, getattr(file_stat, 'st_mtime_ns', None))
+        
+        if file_size > self.max_file_size_bytes:
+            self.logger.warning(
+                f"File too large: {file_path} is {file_size} bytes (max: {self.max_file_size_bytes})"
+            )
+            return _LoadedFile(file_size, fingerprint, start_time)
+        
+        if file_size == 0:
+            self.logger.debug(f"File is empty: {file_path}")
+            return _LoadedFile(file_size, fingerprint, start_time)
+        
+        if file_size > self.stream_threshold_bytes:
+            return _LoadedFile(file_size, fingerprint, start_time, stream=True)
+        
+        return _LoadedFile(file_size, fingerprint, start_time, raw=self._read_file_bytes(file_path))
+    
+    def _build_content(self, file_path: Path, raw: bytes, start_time: float,
+                       encoding_hint: Optional[str] = None) -> Optional[ProcessedContent]:
+        """
+        Decode, sanitize and validate raw file bytes.
+        
+        This is the CPU-bound half of processing and runs in a worker process
+        when use_process_pool is enabled.
+        
+        Args:
+            file_path: Path the bytes were read from
+            raw: File contents
+            start_time: When processing of this file started
+            encoding_hint: Encoding previously detected for this exact file version
             
-            # Detect encoding
-            encoding = self._detect_encoding(file_path)
+        Returns:
+            ProcessedContent object if successful, None if failed
+        """
+        errors = []
+        
+        try:
+            content, encoding = self._decode_bytes(file_path, raw, encoding_hint)
             if not encoding:
                 errors.append("Could not detect file encoding")
                 encoding = 'utf-8'  # Fallback
+                content = self._decode_content(raw, encoding)
             
-            # Read file content
-            content = self._read_file_content(file_path, encoding)
             if not content:
-                errors.append("File content is empty or unreadable")
+                self.logger.debug(f"File content is empty or unreadable: {file_path}")
                 return None
             
-            # Sanitize content
-            sanitized_content = self._sanitize_content(content)
-            
-            # Validate content
-            if not self._validate_content(sanitized_content):
-                errors.append("Content validation failed - no meaningful content")
+            # Sanitize, validate and count in one pass
+            sanitized = self._sanitize_and_measure(content)
+            if not sanitized.is_meaningful:
+                self.logger.debug(f"Content validation failed - no meaningful content: {file_path}")
                 return None
             
-            # Calculate statistics
-            word_count = len(sanitized_content.split())
-            line_count = len([line for line in sanitized_content.split('\n') if line.strip()])
-            
             # Extract date from filename
             file_date = self._extract_date_from_filename(file_path)
             
@@ -227,9 +651,9 @@ class ContentProcessor:
             return ProcessedContent(
                 file_path=file_path,
                 date=file_date,
-                content=sanitized_content,
-                word_count=word_count,
-                line_count=line_count,
+                content=sanitized.text,
+                word_count=sanitized.word_count,
+                line_count=sanitized.line_count,
                 encoding=encoding,
                 processing_time=processing_time,
                 errors=errors
@@ -239,22 +663,175 @@ class ContentProcessor:
             self.logger.error(f"Error processing file {file_path}: {e}")
             return None
     
-    def _detect_encoding(self, file_path: Path) -> str:
+    def _stream_content(self, file_path: Path, file_size: int, start_time: float,
+                        encoding_hint: Optional[str] = None) -> Optional[ProcessedContent]:
+        """
+        Process a large file in STREAM_CHUNK_SIZE pieces with bounded memory.
+        
+        Decoding follows _decode_bytes(): a BOM wins, then the cached
+        encoding or strict UTF-8; if that fails part-way the file is read
+        again with the chardet result. Word and line counts cover the whole
+        file, while the content keeps only analysis_budget_chars characters
+        chosen by analysis_sampling.
+        
+        Args:
+            file_path: Path to the file to process
+            file_size: Size in bytes, used to place sampled excerpts
+            start_time: When processing of this file started
+            encoding_hint: Encoding previously detected for this exact file version
+            
+        Returns:
+            ProcessedContent object if successful, None if failed
+        """
+        errors = []
+        
+        try:
+            with open(file_path, 'rb') as f:
+                sample = f.read(ENCODING_SAMPLE_SIZE)
+            
+            encoding = next((enc for bom, enc in _BOMS if sample.startswith(bom)), None)
+            if encoding:
+                sanitized = self._stream_sanitize(file_path, file_size, encoding, 'replace')
+            else:
+                try:
+                    encoding = encoding_hint or 'utf-8'
+                    sanitized = self._stream_sanitize(file_path, file_size, encoding, 'strict')
+                except (UnicodeDecodeError, LookupError):
+                    encoding = self._detect_encoding(file_path, sample)
+                    try:
+                        codecs.lookup(encoding)
+                    except LookupError:
+                        errors.append(f"Unknown encoding {encoding}; decoded as utf-8")
+                        encoding = 'utf-8'
+                    sanitized = self._stream_sanitize(file_path, file_size, encoding, 'replace')
+            
+            if not sanitized.is_meaningful:
+                self.logger.debug(f"Content validation failed - no meaningful content: {file_path}")
+                return None
+            
+            if sanitized.truncated:
+                self.logger.info(
+                    f"Streamed {file_path} ({file_size} bytes): kept {len(sanitized.text)} "
+                    f"characters ({self.analysis_sampling}) for analysis"
+                )
+            
+            return ProcessedContent(
+                file_path=file_path,
+                date=self._extract_date_from_filename(file_path),
+                content=sanitized.text,
+                word_count=sanitized.word_count,
+                line_count=sanitized.line_count,
+                encoding=encoding,
+                processing_time=time.time() - start_time,
+                errors=errors,
+                truncated=sanitized.truncated
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Error streaming file {file_path}: {e}")
+            return None
+    
+    def _stream_sanitize(self, file_path: Path, file_size: int, encoding: str,
+                         errors: str) -> SanitizedContent:
+        """
+        Decode and sanitize a file chunk by chunk.
+        
+        Raises:
+            UnicodeDecodeError: If errors is 'strict' and the file does not decode
+            LookupError: If the encoding is unknown
+        """
+        decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+        retainer = _ContentRetainer(self.analysis_sampling, self.analysis_budget_chars, file_size)
+        sanitizer = _StreamingSanitizer(retainer)
+        
+        offset = 0
+        with open(file_path, 'rb') as f:
+            while True:
+                chunk = f.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                sanitizer.feed(decoder.decode(chunk), offset)
+                offset += len(chunk)
+        sanitizer.feed(decoder.decode(b'', final=True), offset)
+        
+        return sanitizer.finish()
+    
+    def _decode_bytes(self, file_path: Path, raw: bytes,
+                      encoding_hint: Optional[str] = None) -> Tuple[str, Optional[str]]:
+        """
+        Decode file bytes with a single pass in the common case.
+        
+        Order: byte order mark → cached encoding for this file version →
+        strict UTF-8 → chardet detection. Only files that are not valid
+        UTF-8 (and have no BOM or cache entry) pay for chardet.
+        
+        Args:
+            file_path: Path the bytes were read from (for logging)
+            raw: File contents
+            encoding_hint: Encoding previously detected for this file version
+            
+        Returns:
+            Tuple of (decoded text, encoding used); encoding is None if
+            detection failed
+        """
+        for bom, bom_encoding in _BOMS:
+            if raw.startswith(bom):
+                return raw.decode(bom_encoding, errors='replace'), bom_encoding
+        
+        for candidate in (encoding_hint, 'utf-8'):
+            if not candidate:
+                continue
+            try:
+                return raw.decode(candidate), candidate
+            except (UnicodeDecodeError, LookupError):
+                continue
+        
+        encoding = self._detect_encoding(file_path, raw)
+        if not encoding:
+            return "", None
+        return self._decode_content(raw, encoding), encoding
+    
+    def _cached_encoding(self, fingerprint: Optional[Tuple]) -> Optional[str]:
+        """Look up the encoding detected for this file version, if any."""
+        if fingerprint is None:
+            return None
+        with _encoding_cache_lock:
+            encoding = _encoding_cache.get(fingerprint)
+            if encoding is not None:
+                _encoding_cache.move_to_end(fingerprint)
+            return encoding
+    
+    def _remember_encoding(self, fingerprint: Optional[Tuple], encoding: str) -> None:
+        """Cache the encoding used for this file version (bounded LRU)."""
+        if fingerprint is None:
+            return
+        with _encoding_cache_lock:
+            _encoding_cache[fingerprint] = encoding
+            _encoding_cache.move_to_end(fingerprint)
+            while len(_encoding_cache) > ENCODING_CACHE_SIZE:
+                _encoding_cache.popitem(last=False)
+    
+    def _detect_encoding(self, file_path: Path, raw: Optional[bytes] = None) -> str:
         """
         Detect file encoding using chardet with fallback strategies.
         
-        Fallback sequence: chardet detection → utf-8 → latin-1 → cp1252
+        This is the slow path used by _decode_bytes() when a file is not
+        valid UTF-8. Fallback sequence: chardet detection → utf-8 → latin-1 → cp1252
         
         Args:
             file_path: Path to the file to analyze
+            raw: File contents if already read; avoids a second read
             
         Returns:
             Detected encoding string
         """
         try:
-            # Read a sample of the file for encoding detection
-            with open(file_path, 'rb') as f:
-                raw_data = f.read(min(32768, file_path.stat().st_size))  # Read up to 32KB
+            if raw is not None:
+                raw_data = raw[:32768]
+            else:
+                # Read a sample of the file for encoding detection
+                with open(file_path, 'rb') as f:
+                    raw_data = f.read(min(32768, file_path.stat().st_size))  # Read up to 32KB
             
             # Use chardet for detection
             detection_result = chardet.detect(raw_data)
@@ -294,18 +871,45 @@ class ContentProcessor:
             
         Raises:
             IOError: If file cannot be read
-            UnicodeDecodeError: If encoding is incorrect
         """
-        if not encoding:
-            encoding = self._detect_encoding(file_path)
+        raw = self._read_file_bytes(file_path)
+        if encoding:
+            return self._decode_content(raw, encoding)
         
+        content, detected = self._decode_bytes(file_path, raw)
+        return content if detected else self._decode_content(raw, 'utf-8')
+    
+    def _read_file_bytes(self, file_path: Path) -> bytes:
+        """
+        Read the raw bytes of a file in a single call.
+        
+        Args:
+            file_path: Path to the file to read
+            
+        Returns:
+            File contents as bytes
+            
+        Raises:
+            IOError: If file cannot be read
+        """
+        with open(file_path, 'rb') as f:
+            return f.read()
+    
+    def _decode_content(self, raw: bytes, encoding: str) -> str:
+        """
+        Decode raw bytes, replacing undecodable sequences.
+        
+        Args:
+            raw: Bytes to decode
+            encoding: Encoding to use; unknown names fall back to utf-8
+            
+        Returns:
+            Decoded string
+        """
         try:
-            with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-                return f.read()
-        except UnicodeDecodeError:
-            # Try with error replacement
-            with open(file_path, 'r', encoding=encoding, errors='ignore') as f:
-                return f.read()
+            return raw.decode(encoding, errors='replace')
+        except LookupError:
+            return raw.decode('utf-8', errors='replace')
     
     def _sanitize_content(self, content: str) -> str:
         """
@@ -323,40 +927,72 @@ class ContentProcessor:
         Returns:
             Sanitized content string
         """
-        if not content:
-            return ""
+        return self._normalize(content)[0]
+    
+    def _sanitize_and_measure(self, content: str) -> SanitizedContent:
+        """
+        Sanitize content and compute its statistics in the same pass.
         
-        # Normalize line endings
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
+        Args:
+            content: Raw content to sanitize
+            
+        Returns:
+            SanitizedContent with text, word count, non-empty line count and
+            whether the text passes the alphanumeric threshold
+        """
+        text, line_count = self._normalize(content)
+        if not text:
+            return SanitizedContent(text="", word_count=0, line_count=0, is_meaningful=False)
         
-        # Split into lines for processing
-        lines = content.split('\n')
+        return SanitizedContent(
+            text=text,
+            word_count=len(text.split()),
+            line_count=line_count,
+            is_meaningful=self._has_min_alnum(text)
+        )
+    
+    def _normalize(self, content: str) -> Tuple[str, int]:
+        """
+        Normalize line endings, trailing whitespace and blank-line runs.
         
-        # Process each line
-        processed_lines = []
-        consecutive_empty = 0
+        All per-line work happens in C (regex substitution, split, map of
+        str.rstrip, join); there is no Python-level loop over lines or
+        characters. A line is non-empty after rstrip exactly when it has
+        visible content, so the non-empty line count falls out of the same
+        split, and collapsing blank lines or stripping the ends cannot change it.
         
-        for line in lines:
-            # Strip trailing whitespace but preserve leading whitespace for structure
-            cleaned_line = line.rstrip()
+        Args:
+            content: Raw content to sanitize
             
-            # Track consecutive empty lines
-            if not cleaned_line.strip():
-                consecutive_empty += 1
-                # Allow maximum 2 consecutive empty lines
-                if consecutive_empty <= 2:
-                    processed_lines.append(cleaned_line)
-            else:
-                consecutive_empty = 0
-                processed_lines.append(cleaned_line)
+        Returns:
+            Tuple of (sanitized text, number of non-empty lines)
+        """
+        if not content:
+            return "", 0
         
-        # Join lines back together
-        sanitized = '\n'.join(processed_lines)
+        # Normalize line endings
+        content = _LINE_ENDINGS.sub('\n', content)
         
-        # Remove leading and trailing whitespace from entire content
-        sanitized = sanitized.strip()
+        # Strip trailing whitespace but preserve leading whitespace for structure
+        lines = list(map(str.rstrip, content.split('\n')))
+        non_empty_lines = len(lines) - lines.count('')
+        content = '\n'.join(lines)
+        
+        # Allow maximum 2 consecutive empty lines
+        if '\n\n\n\n' in content:
+            content = _EXCESS_BLANK_LINES.sub('\n\n\n', content)
         
-        return sanitized
+        # Remove leading and trailing whitespace from entire content
+        return content.strip(), non_empty_lines
+    
+    def _has_min_alnum(self, content: str) -> bool:
+        """Return True once MIN_ALNUM_CHARS alphanumeric characters are found."""
+        found = 0
+        for _ in _ALNUM_CHAR.finditer(content):
+            found += 1
+            if found >= MIN_ALNUM_CHARS:
+                return True
+        return False
     
     def _validate_content(self, content: str) -> bool:
         """
@@ -376,11 +1012,7 @@ class ContentProcessor:
             return False
         
         # Check if content has meaningful text (at least some alphanumeric characters)
-        alphanumeric_chars = sum(1 for char in content if char.isalnum())
-        if alphanumeric_chars < 3:  # Require at least 3 alphanumeric characters
-            return False
-        
-        return True
+        return self._has_min_alnum(content)
     
     def _extract_date_from_filename(self, file_path: Path) -> date:
         """
@@ -199,6 +199,8 @@ class DesktopApp:
         
         self.log_info(f"Waiting for server to be ready at {url}")
         
+        # Poll quickly at first: a warm start is ready well under a second
+        retry_delay = 0.05
         while time.time() - start_time < timeout:
             try:
                 response = requests.get(url, timeout=1.0)
@@ -208,7 +210,8 @@ class DesktopApp:
             except RequestException:
                 pass
             
-            time.sleep(0.5)  # Wait before retry
+            time.sleep(retry_delay)  # Wait before retry
+            retry_delay = min(retry_delay * 2, 0.5)
         
         self.log_error(f"Server not ready after {timeout} seconds")
         return False
@@ -8,14 +8,18 @@ This module implements the Google GenAI API client that provides content
 analysis functionality using Google's Gemini models through the Vertex AI
 platform. Shared analysis logic (prompt building, JSON parsing, deduplication,
 stats) is inherited from BaseLLMClient.
+
+With prompt_caching enabled, each distinct system prompt is uploaded once as
+cached content and later requests reference it instead of resending it.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Tuple
 from pathlib import Path
 import json
 import time
 import logging
 import random
+import threading
 
 try:
     import google.genai as genai
@@ -24,10 +28,22 @@ except ImportError:
     genai = None
     genai_errors = None
 
-from base_llm_client import BaseLLMClient
+from base_llm_client import BaseLLMClient, ENTITY_SCHEMA
+from cancellation import cancellable_sleep
 from config_manager import GoogleGenAIConfig
 from llm_data_structures import AnalysisResult, APIStats
 
+# Recreate cached content this long before it expires, so requests in flight
+# never reference an expired cache
+PROMPT_CACHE_REFRESH_MARGIN = 60
+
+# Wait after a transient cache-creation failure; doubles per failure up to the max
+PROMPT_CACHE_RETRY_SECONDS = 30
+PROMPT_CACHE_MAX_RETRY_SECONDS = 900
+
+# Phrases of cache refusals that will not change on retry
+PROMPT_CACHE_REFUSAL_INDICATORS = ("too small", "not supported", "unsupported", "minimum")
+
 
 class GoogleGenAIClient(BaseLLMClient):
     """
@@ -57,6 +73,17 @@ class GoogleGenAIClient(BaseLLMClient):
         self.config = config
         self.client = self._create_genai_client()
         super().__init__()
+        self._init_rate_limiter("google_genai", config.model, config)
+
+        # System prompt -> (cached content name, expiry); prompts the service
+        # refused to cache (e.g. below the model's minimum size) are not retried,
+        # transient failures are retried after a backoff (retry time, failures).
+        # The lock only guards this state; caches are created outside it.
+        self._prompt_caches: Dict[str, Tuple[str, float]] = {}
+        self._uncacheable_prompts: Set[str] = set()
+        self._prompt_cache_retry: Dict[str, Tuple[float, int]] = {}
+        self._prompt_caches_creating: Set[str] = set()
+        self._prompt_cache_lock = threading.Lock()
 
         self.logger.info(f"Initialized Google GenAI client with model: {config.model}")
         self.logger.info(f"Project: {config.project}, Location: {config.location}")
@@ -102,10 +129,12 @@ class GoogleGenAIClient(BaseLLMClient):
         Raises:
             Exception: If all retry attempts fail
         """
-        return self._make_api_call_with_retry(system=system, user=user)
+        return self._make_api_call_with_retry(
+            system=system, user=user, structured=self.structured_output
+        )
 
     def _make_api_call_with_retry(self, system: str = "", user: str = "",
-                                   max_retries: int = 3) -> str:
+                                   max_retries: int = 3, structured: bool = False) -> str:
         """
         Make API call to Google GenAI with exponential backoff retry logic.
 
@@ -113,6 +142,7 @@ class GoogleGenAIClient(BaseLLMClient):
             system: Trusted system instructions for Gemini.
             user: Untrusted user content to analyze.
             max_retries: Maximum number of retry attempts
+            structured: Constrain the response to JSON matching ENTITY_SCHEMA
 
         Returns:
             str: Response text from the API
@@ -127,13 +157,24 @@ class GoogleGenAIClient(BaseLLMClient):
                     'temperature': 0.1,  # Low temperature for consistent extraction
                     'top_p': 0.9,
                     'max_output_tokens': 8192,
-                    'system_instruction': system,
                 }
-                response = self.client.models.generate_content(
-                    model=self.config.model,
-                    contents=user,
-                    config=config,
-                )
+                if structured:
+                    config['response_mime_type'] = 'application/json'
+                    config['response_schema'] = ENTITY_SCHEMA
+                cached_content = self._cached_system_prompt(system)
+                if cached_content:
+                    config['cached_content'] = cached_content
+                else:
+                    config['system_instruction'] = system
+                with self._request_slot(system, user):
+                    response = self.client.models.generate_content(
+                        model=self.config.model,
+                        contents=user,
+                        config=config,
+                    )
+                self._record_request_success()
+                usage = getattr(response, 'usage_metadata', None)
+                self._record_cache_usage(getattr(usage, 'cached_content_token_count', None))
 
                 # Extract text from response, skipping thought parts
                 # from thinking models (e.g., Gemini 2.5 Flash)
@@ -149,12 +190,12 @@ class GoogleGenAIClient(BaseLLMClient):
 
                 # Handle different types of Google GenAI API errors
                 if self._is_rate_limit_error(e):
-                    self.stats.rate_limit_hits += 1
+                    self._record_rate_limit()
                     if attempt < max_retries:
                         # Exponential backoff with jitter for rate limiting
                         wait_time = (2 ** attempt) + random.uniform(0, 1)
                         self.logger.warning(f"Rate limited, waiting {wait_time:.1f}s before retry {attempt + 1}")
-                        time.sleep(wait_time)
+                        cancellable_sleep(wait_time)
                         continue
                     else:
                         self.logger.error(f"Rate limit exceeded after {max_retries + 1} attempts")
@@ -170,7 +211,7 @@ class GoogleGenAIClient(BaseLLMClient):
                         # Network errors should be retried with exponential backoff
                         wait_time = (2 ** attempt) + random.uniform(0, 1)
                         self.logger.warning(f"Network error, retrying in {wait_time:.1f}s: {error_message}")
-                        time.sleep(wait_time)
+                        cancellable_sleep(wait_time)
                         continue
                     else:
                         self.logger.error(f"Network error after {max_retries + 1} attempts: {error_message}")
@@ -186,7 +227,7 @@ class GoogleGenAIClient(BaseLLMClient):
                         # Timeout errors should be retried
                         wait_time = (2 ** attempt) + random.uniform(0, 1)
                         self.logger.warning(f"Timeout error, retrying in {wait_time:.1f}s: {error_message}")
-                        time.sleep(wait_time)
+                        cancellable_sleep(wait_time)
                         continue
                     else:
                         self.logger.error(f"Timeout error after {max_retries + 1} attempts: {error_message}")
@@ -199,6 +240,83 @@ class GoogleGenAIClient(BaseLLMClient):
 
         raise Exception(f"Failed to complete API call after {max_retries + 1} attempts")
 
+    def _cached_system_prompt(self, system: str) -> Optional[str]:
+        """
+        Return the cached content name holding system, creating it if needed.
+
+        Only one request creates the cache for a prompt; concurrent requests
+        keep using the previous cache while it is still valid, or send the
+        prompt inline, rather than waiting on the network call.
+
+        Returns:
+            Optional[str]: Cache name, or None when caching is disabled, the
+            cache is being created or retried later, or the service declined
+            to cache this prompt (sent inline instead).
+        """
+        if not self.config.prompt_caching or not system:
+            return None
+
+        now = time.time()
+        with self._prompt_cache_lock:
+            if system in self._uncacheable_prompts:
+                return None
+            cached = self._prompt_caches.get(system)
+            if cached and now < cached[1] - PROMPT_CACHE_REFRESH_MARGIN:
+                return cached[0]
+            still_valid = cached[0] if cached and now < cached[1] else None
+            retry_at, failures = self._prompt_cache_retry.get(system, (0.0, 0))
+            if system in self._prompt_caches_creating or now < retry_at:
+                return still_valid
+            self._prompt_caches_creating.add(system)
+
+        ttl = self.config.prompt_cache_ttl_seconds
+        try:
+            cache = self.client.caches.create(
+                model=self.config.model,
+                config={'system_instruction': system, 'ttl': f"{ttl}s"},
+            )
+        except Exception as e:
+            with self._prompt_cache_lock:
+                self._prompt_caches_creating.discard(system)
+                if self._is_permanent_cache_refusal(e):
+                    self.logger.info(f"Prompt caching unavailable, sending system prompt inline: {e}")
+                    self._uncacheable_prompts.add(system)
+                    return None
+                delay = min(PROMPT_CACHE_RETRY_SECONDS * (2 ** failures), PROMPT_CACHE_MAX_RETRY_SECONDS)
+                self._prompt_cache_retry[system] = (time.time() + delay, failures + 1)
+            self.logger.warning(f"Prompt cache creation failed, retrying in {delay}s: {e}")
+            return still_valid
+
+        with self._prompt_cache_lock:
+            self._prompt_caches_creating.discard(system)
+            self._prompt_cache_retry.pop(system, None)
+            self._prompt_caches[system] = (cache.name, time.time() + ttl)
+        self.logger.debug(f"Created prompt cache {cache.name} (ttl {ttl}s)")
+        return cache.name
+
+    def _is_permanent_cache_refusal(self, error: Exception) -> bool:
+        """
+        Check if the service will never cache this prompt.
+
+        Client errors (4xx other than timeouts and throttling) and refusals
+        such as a prompt below the model's minimum size are permanent; server
+        errors, timeouts and network failures are transient.
+
+        Args:
+            error: Exception raised by caches.create
+
+        Returns:
+            bool: True if the prompt should not be offered for caching again
+        """
+        if self._is_rate_limit_error(error) or self._is_timeout_error(error):
+            return False
+        code = getattr(error, 'code', None)
+        if isinstance(code, int):
+            return 400 <= code < 500 and code not in (408, 429)
+        error_message = str(error).lower()
+        return (self._is_invalid_request_error(error) or
+                any(indicator in error_message for indicator in PROMPT_CACHE_REFUSAL_INDICATORS))
+
     def _extract_response_text(self, response) -> str:
         """
         Extract non-thought text from an API response.
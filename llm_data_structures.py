@@ -63,6 +63,11 @@ class AnalysisResult:
     confidence_score: Optional[float] = None
     raw_response: Optional[str] = None
 
+    @property
+    def is_error(self) -> bool:
+        """True for the empty result a client returns after a failed analysis."""
+        return isinstance(self.raw_response, str) and self.raw_response.startswith("ERROR")
+
 
 @dataclass
 class APIStats:
@@ -82,6 +87,11 @@ class APIStats:
             in seconds, calculated as total_time / successful_calls
         rate_limit_hits (int): Number of times the client hit rate limits and
             had to retry with backoff
+        cache_hits (int): Calls whose prompt prefix was served from the
+            provider's prompt cache
+        cached_input_tokens (int): Input tokens read from the prompt cache
+        parse_failures (int): Responses that did not match the entity schema,
+            including failed repair retries
     
     Properties:
         - Success rate can be calculated as: successful_calls / total_calls
@@ -105,6 +115,9 @@ class APIStats:
     total_time: float
     average_response_time: float
     rate_limit_hits: int
+    cache_hits: int = 0
+    cached_input_tokens: int = 0
+    parse_failures: int = 0
 
 
 @runtime_checkable
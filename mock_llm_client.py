@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# ABOUTME: Offline LLM provider with simulated latency, injected failures and deterministic output.
+# ABOUTME: Lets concurrency, caching and throughput be measured without live provider access.
+"""
+Mock LLM Client - Deterministic offline provider for load and performance tests.
+
+Selected with llm.provider: mock (or WJS_LLM_PROVIDER=mock). Each request
+sleeps for a latency drawn from a log-normal distribution around
+MockConfig.latency_ms, fails with a simulated server error or 429 at the
+configured rates, and otherwise returns entities derived from a hash of the
+request content, so the same entry always yields the same analysis.
+
+Failures go through the same retry, rate-limit and stats paths as the real
+providers. Latency and failure draws come from a generator seeded with
+MockConfig.seed, so a single-threaded run is reproducible end to end.
+"""
+
+import hashlib
+import json
+import math
+import random
+import threading
+from typing import Any, Dict, List
+
+from base_llm_client import BaseLLMClient
+from cancellation import cancellable_sleep
+from config_manager import MockConfig
+
+# Entity vocabularies the mock picks from
+PROJECTS = ("Atlas", "Beacon", "Cascade", "Delta", "Ember", "Falcon", "Granite", "Harbor",
+            "Ion", "Juniper", "Keystone", "Lumen")
+PARTICIPANTS = ("Alice", "Bob", "Carmen", "Dmitri", "Esther", "Farid", "Grace", "Hiro",
+                "Ines", "Jonas", "Kemi", "Lars")
+TASKS = ("code review", "deployment", "incident follow-up", "sprint planning", "design review",
+         "database migration", "customer call", "performance tuning", "documentation",
+         "on-call handoff", "release notes", "test automation")
+THEMES = ("reliability", "collaboration", "delivery", "technical debt", "mentoring",
+          "observability", "security", "cost")
+
+
+class MockProviderError(Exception):
+    """Simulated provider failure; the message mirrors a real HTTP error."""
+
+
+class MockLLMClient(BaseLLMClient):
+    """
+    Offline LLM client with configurable latency and failure injection.
+
+    Provides the same interface as the real provider clients so it can be
+    used anywhere in the UnifiedLLMClient fallback chain.
+    """
+
+    def __init__(self, config: MockConfig):
+        """
+        Initialize the mock client.
+
+        Args:
+            config: Mock provider configuration
+        """
+        self.config = config
+        super().__init__()
+        self._init_rate_limiter("mock", config.model, config)
+        self._rng = random.Random(config.seed)
+        self._rng_lock = threading.Lock()
+
+        self.logger.info(
+            f"Initialized mock LLM client: {config.latency_ms}ms median latency, "
+            f"{config.error_rate:.1%} errors, {config.rate_limit_rate:.1%} rate limited"
+        )
+
+    def _make_api_call(self, system: str, user: str) -> str:
+        """
+        Simulate a provider call with retries and return the response text.
+
+        Args:
+            system: Trusted system instructions for the model.
+            user: Untrusted user content to analyze.
+
+        Returns:
+            str: JSON entities derived from the user content
+
+        Raises:
+            MockProviderError: If the injected failures outlast the retries
+        """
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                with self._request_slot(system, user):
+                    response = self._simulate_request(user)
+                self._record_request_success()
+                return response
+
+            except MockProviderError as e:
+                if "429" in str(e):
+                    self._record_rate_limit()
+                if attempt < self.config.max_retries:
+                    wait_time = self.config.rate_limit_delay * (2 ** attempt)
+                    self.logger.warning(f"{e}, waiting {wait_time}s before retry {attempt + 1}")
+                    cancellable_sleep(wait_time)
+                    continue
+                self.logger.error(f"Mock API error: {e}")
+                raise
+
+        raise MockProviderError(
+            f"Failed to complete API call after {self.config.max_retries + 1} attempts"
+        )
+
+    def _simulate_request(self, user: str) -> str:
+        """Wait out one simulated response time, then fail or answer."""
+        with self._rng_lock:
+            latency = self._sample_latency()
+            roll = self._rng.random()
+        cancellable_sleep(latency)
+
+        if roll < self.config.rate_limit_rate:
+            raise MockProviderError("429 Too Many Requests: simulated rate limit")
+        if roll < self.config.rate_limit_rate + self.config.error_rate:
+            raise MockProviderError("503 Service Unavailable: simulated server error")
+        return json.dumps(self.entities_for(user))
+
+    def _sample_latency(self) -> float:
+        """Log-normal latency in seconds with median latency_ms."""
+        median = self.config.latency_ms / 1000
+        if median <= 0 or self.config.latency_sigma <= 0:
+            return median
+        return median * math.exp(self._rng.gauss(0.0, self.config.latency_sigma))
+
+    @staticmethod
+    def entities_for(content: str) -> Dict[str, List[str]]:
+        """
+        Deterministic entities for content.
+
+        Args:
+            content: Text the entities are derived from
+
+        Returns:
+            Dict[str, List[str]]: Entities in the ENTITY_SCHEMA format
+        """
+        rng = random.Random(hashlib.sha256(content.encode("utf-8")).digest())
+        return {
+            "projects": rng.sample(PROJECTS, rng.randint(1, 3)),
+            "participants": rng.sample(PARTICIPANTS, rng.randint(1, 4)),
+            "tasks": rng.sample(TASKS, rng.randint(2, 5)),
+            "themes": rng.sample(THEMES, rng.randint(1, 2)),
+        }
+
+    def test_connection(self) -> bool:
+        """
+        The mock provider is always reachable.
+
+        Returns:
+            bool: Always True
+        """
+        return True
+
+    def get_provider_info(self) -> Dict[str, Any]:
+        """
+        Get provider-specific configuration information.
+
+        Returns:
+            Dict[str, Any]: Mock latency and failure settings
+        """
+        return {
+            "provider": "mock",
+            "model": self.config.model,
+            "latency_ms": self.config.latency_ms,
+            "error_rate": self.config.error_rate,
+            "rate_limit_rate": self.config.rate_limit_rate,
+        }
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# ABOUTME: Client-side rate limiting shared by all LLM clients of the same provider and model.
+# ABOUTME: Token buckets for requests/tokens per minute plus an AIMD concurrency limit driven by 429s.
+"""
+Rate Limiter - Proactive, provider-aware request pacing for LLM clients.
+
+Provider clients used to discover their quota by hitting it and sleeping
+after each 429. A ProviderRateLimiter is acquired before every request
+instead:
+
+- Token buckets enforce the configured requests/minute and tokens/minute.
+- A concurrency limit grows by one after a window of successful requests
+  and halves on a rate-limit response (AIMD). Concurrent analysis settles
+  just under the provider's ceiling instead of retrying in lockstep.
+
+Limiters are shared through get_rate_limiter(), so every client, thread
+and summarization task talking to the same provider and model in this
+process draws from one budget.
+"""
+
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Tuple
+import threading
+import time
+
+from cancellation import check_cancelled
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+# 429s reported within this window of a decrease describe the same overload
+# (requests already in flight), so they do not halve the limit again.
+DECREASE_COOLDOWN_SECONDS = 2.0
+
+# Longest a blocked acquire() waits before checking for task cancellation
+CANCEL_CHECK_SECONDS = 0.25
+
+
+class _TokenBucket:
+    """Token bucket holding up to one minute's allowance, refilled continuously."""
+
+    def __init__(self, per_minute: float, now: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount can be taken (requests above capacity wait for a full bucket)."""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def take(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.level -= min(amount, self.capacity)
+
+    def drain(self, now: float) -> None:
+        """Empty the bucket so callers wait for a fresh allowance."""
+        self._refill(now)
+        self.level = min(self.level, 0.0)
+
+
+class ProviderRateLimiter:
+    """
+    Request pacing and adaptive concurrency for one provider and model.
+
+    Usage:
+        with limiter.request(estimated_tokens):
+            response = sdk_call(...)
+        limiter.record_success()    # or limiter.record_rate_limit() on a 429
+    """
+
+    def __init__(self, name: str, requests_per_minute: Optional[int] = None,
+                 tokens_per_minute: Optional[int] = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            name: Provider/model label used in logs and stats.
+            requests_per_minute: Request quota; None for no limit.
+            tokens_per_minute: Estimated input token quota; None for no limit.
+            max_concurrency: Ceiling for the adaptive concurrency limit.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.name = name
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._requests: Optional[_TokenBucket] = None
+        self._tokens: Optional[_TokenBucket] = None
+        self._in_flight = 0
+        self._successes = 0
+        self._last_decrease = float("-inf")
+        self.requests_per_minute: Optional[int] = None
+        self.tokens_per_minute: Optional[int] = None
+        self.max_concurrency = max_concurrency
+        self.concurrency_limit = max_concurrency
+        self.configure(requests_per_minute, tokens_per_minute, max_concurrency)
+
+    def configure(self, requests_per_minute: Optional[int], tokens_per_minute: Optional[int],
+                  max_concurrency: int) -> None:
+        """Apply new quotas; buckets are only reset when their rate changes."""
+        with self._cond:
+            now = self._clock()
+            if requests_per_minute != self.requests_per_minute:
+                self._requests = _TokenBucket(requests_per_minute, now) if requests_per_minute else None
+                self.requests_per_minute = requests_per_minute
+            if tokens_per_minute != self.tokens_per_minute:
+                self._tokens = _TokenBucket(tokens_per_minute, now) if tokens_per_minute else None
+                self.tokens_per_minute = tokens_per_minute
+            self.max_concurrency = max_concurrency
+            self.concurrency_limit = min(self.concurrency_limit, max_concurrency)
+            self._cond.notify_all()
+
+    @contextmanager
+    def request(self, tokens: int = 0) -> Iterator[None]:
+        """Hold a request slot for the duration of one API call."""
+        self.acquire(tokens)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self, tokens: int = 0) -> None:
+        """
+        Block until a concurrency slot and enough request/token budget are available.
+
+        Raises:
+            TaskCancelledError: If the current task is cancelled while waiting.
+        """
+        with self._cond:
+            while True:
+                wait = CANCEL_CHECK_SECONDS
+                if self._in_flight < self.concurrency_limit:
+                    now = self._clock()
+                    budget_wait = max(self._bucket_wait(self._requests, 1, now),
+                                      self._bucket_wait(self._tokens, tokens, now))
+                    if budget_wait <= 0:
+                        if self._requests:
+                            self._requests.take(1, now)
+                        if self._tokens:
+                            self._tokens.take(tokens, now)
+                        self._in_flight += 1
+                        return
+                    wait = min(budget_wait, CANCEL_CHECK_SECONDS)
+                # Wait in short slices so a cancelled task stops promptly
+                check_cancelled()
+                self._cond.wait(wait)
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def record_success(self) -> None:
+        """Additive increase: +1 slot after a full window of successful requests."""
+        with self._cond:
+            if self.concurrency_limit >= self.max_concurrency:
+                return
+            self._successes += 1
+            if self._successes >= self.concurrency_limit:
+                self.concurrency_limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    def record_rate_limit(self) -> None:
+        """Multiplicative decrease: halve the limit and empty the buckets."""
+        with self._cond:
+            now = self._clock()
+            self._successes = 0
+            for bucket in (self._requests, self._tokens):
+                if bucket:
+                    bucket.drain(now)
+            if now - self._last_decrease >= DECREASE_COOLDOWN_SECONDS:
+                self.concurrency_limit = max(1, self.concurrency_limit // 2)
+                self._last_decrease = now
+
+    def snapshot(self) -> Dict[str, Optional[int]]:
+        """Current limits and load, for logging and stats endpoints."""
+        with self._cond:
+            return {
+                "concurrency_limit": self.concurrency_limit,
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self._in_flight,
+                "requests_per_minute": self.requests_per_minute,
+                "tokens_per_minute": self.tokens_per_minute,
+            }
+
+    @staticmethod
+    def _bucket_wait(bucket: Optional[_TokenBucket], amount: float, now: float) -> float:
+        return bucket.wait_time(amount, now) if bucket else 0.0
+
+
+_limiters: Dict[Tuple[str, str], ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model: str, requests_per_minute: Optional[int] = None,
+                     tokens_per_minute: Optional[int] = None,
+                     max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> ProviderRateLimiter:
+    """
+    Return the process-wide limiter for a provider and model.
+
+    Quotas are per model at every supported provider, so clients for the
+    same model share state. An existing limiter picks up changed settings.
+    """
+    key = (provider, model)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = ProviderRateLimiter(f"{provider}:{model}", requests_per_minute,
+                                          tokens_per_minute, max_concurrency)
+            _limiters[key] = limiter
+            return limiter
+    limiter.configure(requests_per_minute, tokens_per_minute, max_concurrency)
+    return limiter
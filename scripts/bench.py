@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# ABOUTME: Benchmark harness for the summarization hot paths over a synthetic worklog tree.
+# ABOUTME: Times discovery, content processing, database sync and the full pipeline, emitting JSON.
+"""
+Pipeline Benchmark - discovery, processing, sync and summarization
+
+Generates a synthetic worklogs_YYYY/worklogs_YYYY-MM/week_ending_*/worklog_*.txt
+tree covering the last --days days (weekdays only) and times:
+
+    discover_files      FileDiscovery.discover_files over the whole range
+    process_files       ContentProcessor.process_files on the discovered files
+    full_sync           DatabaseSyncService.full_sync into a fresh database
+    full_sync_unchanged a second full_sync over the same, unchanged tree
+    pipeline            discovery, processing, analysis and weekly summaries
+                        against the mock LLM provider, with --llm-latency-ms
+                        per call and --llm-error-rate injected failures
+
+Each benchmark runs --repeat times; results are written as JSON so runs
+from different commits can be compared with --compare.
+
+Usage:
+    python scripts/bench.py
+    python scripts/bench.py --days 730 --lines 40 --output bench.json
+    python scripts/bench.py --output new.json --compare bench.json --max-regression 20
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from config_manager import AppConfig  # noqa: E402
+from content_processor import ContentProcessor  # noqa: E402
+from file_discovery import FileDiscovery  # noqa: E402
+from logger import JournalSummarizerLogger, LogConfig, LogLevel  # noqa: E402
+from summarization_pipeline import analyze_content, generate_summaries  # noqa: E402
+
+# Bumped when the layout of the JSON results changes
+RESULTS_SCHEMA = 1
+
+PROJECTS = ("Atlas", "Beacon", "Cascade", "Delta", "Ember", "Falcon", "Granite", "Harbor")
+PEOPLE = ("Alice", "Bob", "Carmen", "Dmitri", "Esther", "Farid", "Grace", "Hiro")
+WORDS = ("deployed", "reviewed", "meeting", "pipeline", "sync", "refactor", "incident",
+         "notes", "planning", "database", "customer", "release", "migration", "tests")
+
+
+def build_corpus(base_path: Path, days: int, lines: int, seed: int = 7,
+                 end_date: Optional[date] = None) -> List[Path]:
+    """Write one worklog per weekday in the last days days and return their paths."""
+    rng = random.Random(seed)
+    end_date = end_date or date.today()
+    layout = FileDiscovery(str(base_path))
+    paths = []
+    for offset in range(days - 1, -1, -1):
+        entry_date = end_date - timedelta(days=offset)
+        if entry_date.weekday() >= 5:
+            continue
+        week_ending = entry_date + timedelta(days=4 - entry_date.weekday())
+
+        body = [f"# Worklog {entry_date.isoformat()}", ""]
+        for _ in range(rng.randint(max(1, lines // 2), max(1, lines * 3 // 2))):
+            body.append(f"- {rng.choice(PROJECTS)}: {' '.join(rng.choices(WORDS, k=rng.randint(4, 12)))}"
+                        f" with {rng.choice(PEOPLE)}")
+
+        path = layout._construct_file_path(entry_date, week_ending)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("\n".join(body) + "\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def time_runs(repeat: int, run: Callable[[], int]) -> Tuple[List[float], int]:
+    """Call run repeat times; run returns the number of items it handled."""
+    timings = []
+    items = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        items = run()
+        timings.append(time.perf_counter() - start)
+    return timings, items
+
+
+def summarize(label: str, timings: List[float], items: int) -> Dict[str, Any]:
+    """Reduce one benchmark's timings to its JSON record and print a table row."""
+    median = statistics.median(timings)
+    result = {
+        "runs_s": [round(seconds, 6) for seconds in timings],
+        "min_s": round(min(timings), 6),
+        "median_s": round(median, 6),
+        "items": items,
+        "items_per_s": round(items / median, 2) if median > 0 else None,
+    }
+    print(f"{label:<22}{result['median_s']:>10.3f}{result['min_s']:>10.3f}{items:>8}"
+          f"{result['items_per_s'] or 0:>12.1f}")
+    return result
+
+
+def make_logger(log_dir: Path) -> JournalSummarizerLogger:
+    return JournalSummarizerLogger(LogConfig(level=LogLevel.WARNING, console_output=False,
+                                             file_output=False, log_dir=str(log_dir)))
+
+
+async def run_full_sync(config: AppConfig, logger: JournalSummarizerLogger, db_path: Path,
+                        days: int, passes: int) -> List[float]:
+    """Run passes full syncs into the database at db_path, returning each duration."""
+    from web.database import DatabaseManager
+    from web.services.sync_service import DatabaseSyncService
+
+    db_manager = DatabaseManager(str(db_path))
+    await db_manager.initialize()
+    try:
+        sync_service = DatabaseSyncService(config, logger, db_manager)
+        timings = []
+        for _ in range(passes):
+            start = time.perf_counter()
+            result = await sync_service.full_sync(date_range_days=days)
+            timings.append(time.perf_counter() - start)
+            if not result.success:
+                raise RuntimeError(f"full_sync failed: {result.errors}")
+        return timings
+    finally:
+        await db_manager.engine.dispose()
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(args: argparse.Namespace, work_dir: Path) -> Dict[str, Any]:
+    base_path = work_dir / "worklogs"
+    paths = build_corpus(base_path, args.days, args.lines, args.seed)
+    corpus_bytes = sum(path.stat().st_size for path in paths)
+    print(f"Corpus: {len(paths)} files, {corpus_bytes / (1024 * 1024):.1f} MB over {args.days} days")
+
+    end_date = date.today()
+    start_date = end_date - timedelta(days=args.days)
+    config = AppConfig()
+    config.processing.base_path = str(base_path)
+    config.llm.provider = "mock"
+    config.mock.latency_ms = args.llm_latency_ms
+    config.mock.latency_sigma = 0.0
+    config.mock.error_rate = args.llm_error_rate
+    config.mock.rate_limit_delay = 0.0
+    # Injected failures are expected; keep their retry warnings out of the table
+    logging.getLogger("mock_llm_client").setLevel(logging.ERROR)
+    logger = make_logger(work_dir / "logs")
+
+    print(f"{'benchmark':<22}{'median s':>10}{'min s':>10}{'items':>8}{'items/s':>12}")
+    results = {}
+    discovery = FileDiscovery(str(base_path))
+    found = discovery.discover_files(start_date, end_date).found_files
+    results["discover_files"] = summarize("discover_files", *time_runs(args.repeat, lambda: len(
+        discovery.discover_files(start_date, end_date).found_files)))
+
+    results["process_files"] = summarize("process_files", *time_runs(args.repeat, lambda: len(
+        ContentProcessor().process_files(found)[0])))
+
+    # Each repetition syncs into a fresh database, then once more over the unchanged tree
+    sync_runs = [asyncio.run(run_full_sync(config, logger, work_dir / f"bench_{index}.db",
+                                           args.days, passes=2))
+                 for index in range(args.repeat)]
+    results["full_sync"] = summarize("full_sync", [run[0] for run in sync_runs], len(found))
+    results["full_sync_unchanged"] = summarize("full_sync_unchanged",
+                                               [run[1] for run in sync_runs], len(found))
+
+    def pipeline() -> int:
+        discovered = FileDiscovery(str(base_path)).discover_files(start_date, end_date)
+        processed, _ = ContentProcessor().process_files(discovered.found_files)
+        analysis, _, client = analyze_content(processed, config)
+        generate_summaries(analysis, client, "weekly", start_date, end_date)
+        return len(processed)
+
+    results["pipeline"] = summarize("pipeline", *time_runs(args.repeat, pipeline))
+
+    return {
+        "schema": RESULTS_SCHEMA,
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "days": args.days, "lines": args.lines, "seed": args.seed,
+            "repeat": args.repeat, "llm_latency_ms": args.llm_latency_ms,
+            "llm_error_rate": args.llm_error_rate,
+        },
+        "corpus": {"files": len(paths), "bytes": corpus_bytes},
+        "results": results,
+    }
+
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, float]:
+    """Percentage change in median time per benchmark present in both results."""
+    changes = {}
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous and previous.get("median_s"):
+            changes[name] = (result["median_s"] - previous["median_s"]) / previous["median_s"] * 100
+    return changes
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--days", type=int, default=365, help="Days of worklogs to generate, ending today")
+    parser.add_argument("--lines", type=int, default=30, help="Average lines per worklog")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for the corpus generator")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0,
+                        help="Mock LLM latency per call in the pipeline benchmark")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0,
+                        help="Fraction of mock LLM calls failing (and retried) in the pipeline benchmark")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="JSON results of an earlier run to compare against")
+    parser.add_argument("--max-regression", type=float,
+                        help="With --compare, exit 1 if any median is this many percent slower")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        report = run_benchmarks(args, Path(temp_dir))
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if baseline.get("parameters") != report["parameters"]:
+            print("Warning: baseline was run with different parameters")
+        changes = compare(report, baseline)
+        print(f"Compared with {baseline.get('commit') or args.compare}:")
+        for name, change in changes.items():
+            print(f"  {name:<22}{change:>+8.1f}%")
+        if args.max_regression is not None and any(
+                change > args.max_regression for change in changes.values()):
+            print(f"Regression above {args.max_regression:.0f}%")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# ABOUTME: Benchmark for ContentProcessor decoding over a synthetic worklog corpus.
+# ABOUTME: Compares chardet-first detection with the single-read UTF-8 fast path and the encoding cache.
+"""
+Encoding Benchmark - ContentProcessor decode paths
+
+Generates a synthetic corpus of worklog files (mostly UTF-8, with a few
+cp1252 and BOM-prefixed files) and times three ways of turning them into
+text:
+
+    chardet-first   chardet on a 32KB sample, then decode (the old path)
+    fast path       BOM sniff, strict UTF-8, chardet only on failure
+    fast + cache    fast path with encodings cached per file fingerprint
+
+Usage:
+    python scripts/bench_encoding.py
+    python scripts/bench_encoding.py --files 5000 --non-utf8-ratio 0.02
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from content_processor import ContentProcessor  # noqa: E402
+
+WORDS = ("deployed", "reviewed", "meeting", "pipeline", "résumé", "café", "sync",
+         "refactor", "incident", "notes", "planning", "database", "customer", "naïve")
+
+
+def build_corpus(directory: Path, file_count: int, non_utf8_ratio: float, seed: int = 7) -> list:
+    """Write file_count synthetic worklogs and return their paths."""
+    rng = random.Random(seed)
+    paths = []
+    for index in range(file_count):
+        lines = []
+        for _ in range(rng.randint(10, 60)):
+            lines.append("- " + " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 14))))
+        text = "\n".join(lines) + "\n"
+
+        roll = rng.random()
+        if roll < non_utf8_ratio:
+            data = text.encode("cp1252", errors="replace")
+        elif roll < non_utf8_ratio * 2:
+            data = b"\xef\xbb\xbf" + text.encode("utf-8")
+        else:
+            data = text.encode("utf-8")
+
+        path = directory / f"worklog_{index:05d}.txt"
+        path.write_bytes(data)
+        paths.append(path)
+    return paths
+
+
+def time_chardet_first(processor: ContentProcessor, corpus: list) -> float:
+    start = time.perf_counter()
+    for path, raw in corpus:
+        encoding = processor._detect_encoding(path, raw)
+        processor._decode_content(raw, encoding)
+    return time.perf_counter() - start
+
+
+def time_fast_path(processor: ContentProcessor, corpus: list, use_cache: bool) -> float:
+    start = time.perf_counter()
+    for path, raw in corpus:
+        fingerprint = (str(path), len(raw), 0)
+        hint = processor._cached_encoding(fingerprint) if use_cache else None
+        _, encoding = processor._decode_bytes(path, raw, hint)
+        if use_cache:
+            processor._remember_encoding(fingerprint, encoding)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=5000, help="Number of synthetic files")
+    parser.add_argument("--non-utf8-ratio", type=float, default=0.02,
+                        help="Fraction of files written as cp1252 (the same fraction gets a UTF-8 BOM)")
+    args = parser.parse_args()
+
+    processor = ContentProcessor()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = build_corpus(Path(temp_dir), args.files, args.non_utf8_ratio)
+        corpus = [(path, path.read_bytes()) for path in paths]
+        total_mb = sum(len(raw) for _, raw in corpus) / (1024 * 1024)
+
+        print(f"Corpus: {len(corpus)} files, {total_mb:.1f} MB")
+
+        baseline = time_chardet_first(processor, corpus)
+        fast = time_fast_path(processor, corpus, use_cache=False)
+        time_fast_path(processor, corpus, use_cache=True)  # warm the cache
+        cached = time_fast_path(processor, corpus, use_cache=True)
+
+        print(f"{'path':<16}{'seconds':>10}{'files/s':>12}{'speedup':>10}")
+        for label, seconds in (("chardet-first", baseline), ("fast path", fast), ("fast + cache", cached)):
+            print(f"{label:<16}{seconds:>10.3f}{len(corpus) / seconds:>12.0f}{baseline / seconds:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,12 +14,15 @@ from datetime import date
 from pathlib import Path
 from typing import Callable, List, Optional, Tuple
 
-from config_manager import AppConfig
+from base_llm_client import track_task_stats
+from cancellation import CancellationToken, TaskCancelledError, cancellation_scope, check_cancelled
+from circuit_breaker import ProviderUnavailableError
+from config_manager import AppConfig, ProcessingConfig
 from content_processor import ContentProcessor, ProcessedContent, ProcessingStats
 from file_discovery import FileDiscovery, FileDiscoveryResult
 from llm_data_structures import AnalysisResult, APIStats
 from summary_generator import PeriodSummary, SummaryGenerator, SummaryStats
-from unified_llm_client import UnifiedLLMClient
+from unified_llm_client import UnifiedLLMClient, fallback_notifications, get_llm_client
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +46,9 @@ def discover_files(
 
 
 def process_content(
-    file_paths: List[Path], max_file_size_mb: int = 50
+    file_paths: List[Path],
+    max_file_size_mb: int = 50,
+    processing_config: Optional[ProcessingConfig] = None,
 ) -> Tuple[List[ProcessedContent], ProcessingStats]:
     """
     Phase 2: Read and sanitize journal file content.
@@ -51,11 +56,21 @@ def process_content(
     Args:
         file_paths: Paths to journal files discovered in phase 1.
         max_file_size_mb: Maximum individual file size to process.
+        processing_config: Optional settings for streaming large files
+            (threshold, analysis budget and sampling strategy).
 
     Returns:
         Tuple of (processed content list, processing statistics).
     """
-    content_processor = ContentProcessor(max_file_size_mb=max_file_size_mb)
+    if processing_config is None:
+        content_processor = ContentProcessor(max_file_size_mb=max_file_size_mb)
+    else:
+        content_processor = ContentProcessor(
+            max_file_size_mb=max_file_size_mb,
+            stream_threshold_mb=processing_config.stream_threshold_mb,
+            analysis_budget_chars=processing_config.analysis_budget_chars,
+            analysis_sampling=processing_config.analysis_sampling,
+        )
     return content_processor.process_files(file_paths)
 
 
@@ -63,6 +78,9 @@ def analyze_content(
     processed_content: List[ProcessedContent],
     config: AppConfig,
     on_fallback: Optional[Callable[[str], None]] = None,
+    llm_client: Optional[UnifiedLLMClient] = None,
+    cancel_token: Optional[CancellationToken] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
 ) -> Tuple[List[AnalysisResult], APIStats, UnifiedLLMClient]:
     """
     Phase 3: Analyze processed content with LLM for entity extraction.
@@ -70,30 +88,76 @@ def analyze_content(
     Args:
         processed_content: Content items from phase 2.
         config: Application configuration (selects LLM provider).
-        on_fallback: Optional callback for provider fallback notifications.
+        on_fallback: Optional callback for provider fallback notifications
+            raised while analyzing these files.
+        llm_client: Client to use; defaults to the shared client for config.
+        cancel_token: Optional token checked before each file, each LLM
+            request and during retry backoff.
+        on_progress: Optional callback invoked with (files analyzed, total
+            files) after each file.
 
     Returns:
-        Tuple of (analysis results, API statistics, LLM client instance).
-        The client is returned so it can be reused in phase 4.
+        Tuple of (analysis results, API statistics for this call only,
+        LLM client instance). The client is returned so it can be reused
+        in phase 4.
+
+    Files analyzed while every provider's circuit is open get an error
+    AnalysisResult, like any other failed analysis, instead of ending the run.
+
+    Raises:
+        TaskCancelledError: If cancel_token is cancelled; its api_stats
+            hold the calls made before cancellation.
     """
-    llm_client = UnifiedLLMClient(config, on_fallback=on_fallback)
+    if llm_client is None:
+        llm_client = get_llm_client(config)
 
     analysis_results: List[AnalysisResult] = []
-    for content in processed_content:
-        logger.debug("Analyzing %s", content.file_path.name)
-        result = llm_client.analyze_content(content.content, content.file_path)
-        analysis_results.append(result)
-
-    api_stats = llm_client.get_stats()
+    with cancellation_scope(cancel_token), track_task_stats() as task_stats, \
+            fallback_notifications(on_fallback):
+        try:
+            for content in processed_content:
+                check_cancelled()
+                logger.debug("Analyzing %s", content.file_path.name)
+                try:
+                    result = llm_client.analyze_content(content.content, content.file_path)
+                except ProviderUnavailableError as e:
+                    # Every circuit is open; record the file as failed and keep going
+                    logger.warning("Skipping analysis of %s: %s", content.file_path.name, e)
+                    result = _unavailable_result(content.file_path, e)
+                analysis_results.append(result)
+                if on_progress is not None:
+                    on_progress(len(analysis_results), len(processed_content))
+        except TaskCancelledError as e:
+            logger.info("Analysis cancelled after %d of %d files",
+                        len(analysis_results), len(processed_content))
+            e.api_stats = task_stats
+            raise
+
+        api_stats = llm_client.get_stats()
     return analysis_results, api_stats, llm_client
 
 
+def _unavailable_result(file_path: Path, error: ProviderUnavailableError) -> AnalysisResult:
+    """Empty error result for a file no provider was available to analyze."""
+    return AnalysisResult(
+        file_path=file_path,
+        projects=[],
+        participants=[],
+        tasks=[],
+        themes=[],
+        api_call_time=0.0,
+        raw_response=f"ERROR ({type(error).__name__})",
+    )
+
+
 def generate_summaries(
     analysis_results: List[AnalysisResult],
     llm_client: UnifiedLLMClient,
     summary_type: str,
     start_date: date,
     end_date: date,
+    cancel_token: Optional[CancellationToken] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
 ) -> Tuple[List[PeriodSummary], SummaryStats]:
     """
     Phase 4: Generate period summaries from LLM analysis results.
@@ -104,11 +168,18 @@ def generate_summaries(
         summary_type: Either "weekly" or "monthly".
         start_date: Inclusive start of the summary range.
         end_date: Inclusive end of the summary range.
+        cancel_token: Optional token checked before each period.
+        on_progress: Optional callback invoked with (periods done, total
+            periods) after each period.
 
     Returns:
         Tuple of (period summaries, generation statistics).
+
+    Raises:
+        TaskCancelledError: If cancel_token is cancelled.
     """
     summary_generator = SummaryGenerator(llm_client)
     return summary_generator.generate_summaries(
-        analysis_results, summary_type, start_date, end_date
+        analysis_results, summary_type, start_date, end_date,
+        cancel_token=cancel_token, on_progress=on_progress,
     )
@@ -11,7 +11,7 @@ Version: Phase 5 - Summary Generation System
 
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from collections import defaultdict
 import calendar
 import logging
@@ -20,6 +20,7 @@ import re
 from pathlib import Path
 
 from llm_data_structures import AnalysisResult, LLMClientProtocol
+from cancellation import CancellationToken, TaskCancelledError, cancellation_scope, check_cancelled
 
 
 @dataclass
@@ -121,7 +122,10 @@ Generate only the summary paragraph, no additional text.
         return sanitized
 
     def generate_summaries(self, analysis_results: List[AnalysisResult], 
-                          summary_type: str, start_date: date, end_date: date) -> Tuple[List[PeriodSummary], SummaryStats]:
+                          summary_type: str, start_date: date, end_date: date,
+                          cancel_token: Optional[CancellationToken] = None,
+                          on_progress: Optional[Callable[[int, int], None]] = None
+                          ) -> Tuple[List[PeriodSummary], SummaryStats]:
         """
         Generate weekly or monthly summaries from analysis results.
         
@@ -130,10 +134,22 @@ Generate only the summary paragraph, no additional text.
             summary_type: Either "weekly" or "monthly"
             start_date: Start date of the range
             end_date: End date of the range
+            cancel_token: Optional token checked before each period and LLM request
+            on_progress: Optional callback invoked with (periods done, total periods)
+                after each period, successful or not
             
         Returns:
             Tuple of (list of period summaries, generation statistics)
+
+        Raises:
+            TaskCancelledError: If cancel_token is cancelled
         """
+        with cancellation_scope(cancel_token):
+            return self._generate_summaries(analysis_results, summary_type, on_progress)
+
+    def _generate_summaries(self, analysis_results: List[AnalysisResult], summary_type: str,
+                            on_progress: Optional[Callable[[int, int], None]]
+                            ) -> Tuple[List[PeriodSummary], SummaryStats]:
         start_time = time.time()
         
         # Initialize statistics
@@ -161,6 +177,7 @@ Generate only the summary paragraph, no additional text.
         
         # Generate summary for each period
         for period_name, period_results in grouped_results.items():
+            check_cancelled()
             try:
                 self.logger.info(f"Generating summary for {period_name} ({len(period_results)} entries)")
                 
@@ -217,10 +234,15 @@ Generate only the summary paragraph, no additional text.
                 summaries.append(period_summary)
                 stats.successful_summaries += 1
                 
+            except TaskCancelledError:
+                raise
             except Exception as e:
                 self.logger.error(f"Failed to generate summary for {period_name}: {e}")
                 stats.failed_summaries += 1
-                continue
+
+            if on_progress is not None:
+                on_progress(stats.successful_summaries + stats.failed_summaries,
+                            stats.total_periods)
         
         # Calculate final statistics
         stats.total_generation_time = time.time() - start_time
@@ -402,6 +424,8 @@ Generate only the summary paragraph, no additional text.
             # Fallback: generate basic summary from entities
             return self._generate_fallback_summary(period_name, aggregated_entities, entry_count)
             
+        except TaskCancelledError:
+            raise
         except Exception as e:
             self.logger.error(f"Failed to generate LLM summary for {period_name}: {e}")
             # Return fallback summary
@@ -0,0 +1,199 @@
+# ABOUTME: Tests for the write-behind entry access statistics buffer.
+# ABOUTME: Verifies coalescing, batched flush, and that entry reads no longer write to the DB.
+
+"""
+Tests for AccessStatsBuffer and its use in EntryManager.
+
+Verifies that:
+- Repeated accesses to the same date are coalesced in memory
+- A flush applies all pending increments in one batch
+- Flushing does not bump modified_at
+- EntryManager reads only touch the buffer until a flush happens
+- Flushing access stats leaves the entry's ETag version unchanged
+- A failed or cancelled flush keeps the counts and logs a database error
+"""
+
+import asyncio
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from config_manager import AppConfig
+from logger import ErrorCategory
+from web.database import DatabaseManager, JournalEntryIndex
+from web.services.access_stats import AccessStatsBuffer
+from web.services.entry_manager import EntryManager
+
+
+@pytest_asyncio.fixture
+async def temp_db():
+    """Create a temporary database with two indexed entries."""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+        db_path = f.name
+
+    db_manager = DatabaseManager(db_path)
+    await db_manager.initialize()
+
+    modified = datetime(2024, 1, 1, 12, 0, 0)
+    async with db_manager.get_session() as session:
+        for day in (date(2024, 1, 15), date(2024, 1, 16)):
+            session.add(JournalEntryIndex(
+                date=day,
+                file_path=f"/tmp/worklog_{day.isoformat()}.txt",
+                week_ending_date=day + timedelta(days=4),
+                access_count=0,
+                modified_at=modified,
+            ))
+        await session.commit()
+
+    yield db_manager
+
+    await db_manager.engine.dispose()
+    os.unlink(db_path)
+
+
+async def _get_row(db_manager, entry_date):
+    async with db_manager.get_session() as session:
+        return await session.scalar(
+            select(JournalEntryIndex).where(JournalEntryIndex.date == entry_date)
+        )
+
+
+class TestAccessStatsBuffer:
+    """Test in-memory coalescing and batched flush."""
+
+    def test_record_coalesces_per_date(self):
+        buffer = AccessStatsBuffer()
+        buffer.record(date(2024, 1, 15))
+        buffer.record(date(2024, 1, 15))
+        buffer.record(date(2024, 1, 16))
+
+        assert buffer.pending_count == 2
+        rows = {row["entry_date"]: row for row in buffer.drain()}
+        assert rows[date(2024, 1, 15)]["increment"] == 2
+        assert rows[date(2024, 1, 16)]["increment"] == 1
+        assert buffer.pending_count == 0
+
+    def test_record_keeps_latest_access_time(self):
+        buffer = AccessStatsBuffer()
+        later = datetime(2024, 1, 15, 18, 0, 0)
+        earlier = datetime(2024, 1, 15, 9, 0, 0)
+        buffer.record(date(2024, 1, 15), accessed_at=later)
+        buffer.record(date(2024, 1, 15), accessed_at=earlier)
+
+        assert buffer.drain()[0]["accessed_at"] == later
+
+    @pytest.mark.asyncio
+    async def test_flush_applies_increments_in_one_batch(self, temp_db):
+        buffer = AccessStatsBuffer()
+        for _ in range(3):
+            buffer.record(date(2024, 1, 15))
+        buffer.record(date(2024, 1, 16))
+        buffer.record(date(2024, 2, 1))  # not indexed; must be harmless
+
+        flushed = await buffer.flush(temp_db)
+
+        assert flushed == 3
+        assert buffer.pending_count == 0
+        assert (await _get_row(temp_db, date(2024, 1, 15))).access_count == 3
+        assert (await _get_row(temp_db, date(2024, 1, 16))).access_count == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_does_not_bump_modified_at(self, temp_db):
+        buffer = AccessStatsBuffer()
+        buffer.record(date(2024, 1, 15))
+        await buffer.flush(temp_db)
+
+        row = await _get_row(temp_db, date(2024, 1, 15))
+        assert row.modified_at == datetime(2024, 1, 1, 12, 0, 0)
+        assert row.last_accessed_at is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_restores_pending(self):
+        buffer = AccessStatsBuffer()
+        buffer.record(date(2024, 1, 15))
+        broken_db = Mock()
+        broken_db.get_session.side_effect = RuntimeError("database locked")
+
+        with pytest.raises(RuntimeError):
+            await buffer.flush(broken_db)
+
+        assert buffer.pending_count == 1
+
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_restores_pending(self):
+        buffer = AccessStatsBuffer()
+        buffer.record(date(2024, 1, 15))
+
+        @asynccontextmanager
+        async def hanging_session():
+            await asyncio.Event().wait()
+            yield
+
+        hanging_db = Mock(get_session=hanging_session)
+
+        task = asyncio.create_task(buffer.flush(hanging_db))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert buffer.pending_count == 1
+
+class TestEntryManagerAccessStats:
+    """Test that EntryManager reads go through the buffer."""
+
+    @pytest.mark.asyncio
+    async def test_entry_access_is_buffered_until_flush(self, temp_db):
+        manager = EntryManager(AppConfig(), Mock(), temp_db, work_week_service=Mock())
+
+        await manager._update_entry_access(date(2024, 1, 15), None)
+        await manager._update_entry_access(date(2024, 1, 15), None)
+
+        assert (await _get_row(temp_db, date(2024, 1, 15))).access_count == 0
+
+        assert await manager.flush_access_stats() == 1
+        assert (await _get_row(temp_db, date(2024, 1, 15))).access_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending_stats(self, temp_db):
+        manager = EntryManager(AppConfig(), Mock(), temp_db, work_week_service=Mock())
+        manager.start_access_stats_flush()
+        await manager._update_entry_access(date(2024, 1, 16), None)
+
+        await manager.stop_access_stats_flush()
+
+        assert (await _get_row(temp_db, date(2024, 1, 16))).access_count == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_keeps_entry_version(self, temp_db):
+        manager = EntryManager(AppConfig(), Mock(), temp_db, work_week_service=Mock())
+        before = await manager.get_entry_version(date(2024, 1, 15))
+
+        manager.record_entry_access(date(2024, 1, 15))
+        await manager.flush_access_stats()
+
+        assert (await _get_row(temp_db, date(2024, 1, 15))).last_accessed_at is not None
+        assert await manager.get_entry_version(date(2024, 1, 15)) == before
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_logged_and_retried(self, temp_db):
+        logger = Mock()
+        manager = EntryManager(AppConfig(), logger, temp_db, work_week_service=Mock())
+        manager.record_entry_access(date(2024, 1, 15))
+        working_db, manager.db_manager = manager.db_manager, Mock()
+        manager.db_manager.get_session.side_effect = RuntimeError("database locked")
+
+        assert await manager.flush_access_stats() == 0
+
+        assert logger.log_error_with_category.call_args.args[0] == ErrorCategory.DATABASE_ERROR
+        manager.db_manager = working_db
+        assert await manager.flush_access_stats() == 1
+        assert (await _get_row(temp_db, date(2024, 1, 15))).access_count == 1
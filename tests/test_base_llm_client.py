@@ -10,9 +10,10 @@ test subclass that stubs the abstract methods.
 
 import pytest
 import json
+import re
 from pathlib import Path
 
-from base_llm_client import BaseLLMClient
+from base_llm_client import BaseLLMClient, estimate_tokens, track_task_stats
 from llm_data_structures import AnalysisResult, APIStats
 
 
@@ -381,6 +382,127 @@ class TestBaseLLMClientAnalyzeContent:
         assert result.raw_response is not None
 
 
+class ChunkEchoClient(StubLLMClient):
+    """Stub that reports every "Project-N" token in the content it receives."""
+
+    def __init__(self, fail_marker=None):
+        super().__init__()
+        self.requests = []
+        self._fail_marker = fail_marker
+
+    def _make_api_call(self, system: str, user: str) -> str:
+        self.requests.append(user)
+        if self._fail_marker and self._fail_marker in user:
+            raise RuntimeError("chunk rejected")
+        projects = sorted(set(re.findall(r"Project-\d+", user)))
+        return json.dumps({"projects": projects, "participants": ["Alice"],
+                           "tasks": [], "themes": []})
+
+
+class TestBaseLLMClientChunking:
+    """Tests for token-budgeted chunking and merged chunk analysis."""
+
+    def _long_entry(self, sections=12):
+        return "\n\n".join(
+            f"## Section {i}\nWorked on Project-{i} with the team. " + "More notes here. " * 60
+            for i in range(sections)
+        )
+
+    def test_short_content_is_one_request(self):
+        client = ChunkEchoClient()
+        result = client.analyze_content("Worked on Project-1", Path("/t.txt"))
+        assert len(client.requests) == 1
+        assert result.projects == ["Project-1"]
+
+    def test_long_content_is_fully_covered(self):
+        """Every section reaches the model and entities are merged and deduplicated."""
+        client = ChunkEchoClient()
+        content = self._long_entry()
+
+        result = client.analyze_content(content, Path("/t.txt"))
+
+        assert len(client.requests) > 1
+        assert sorted(result.projects) == sorted(f"Project-{i}" for i in range(12))
+        assert result.participants == ["Alice"]
+        assert all("[Content truncated for analysis]" not in r for r in client.requests)
+        assert client.get_stats().total_calls == len(client.requests)
+        assert client.get_stats().successful_calls == len(client.requests)
+
+    def test_chunks_respect_budget_and_boundaries(self):
+        client = ChunkEchoClient()
+        client.configure_chunking(chunk_token_budget=300, max_concurrent_chunks=2)
+        content = self._long_entry()
+
+        chunks = client._chunk_content(content)
+
+        assert all(estimate_tokens(chunk) <= 300 for chunk in chunks)
+        assert all(chunk.startswith("## Section") for chunk in chunks)
+        assert "".join(chunks).split() == content.split()
+
+    def test_oversized_line_split_at_whitespace(self):
+        client = ChunkEchoClient()
+        client.configure_chunking(chunk_token_budget=50, max_concurrent_chunks=1)
+        content = "word " * 400 + "naïve 日本語" * 30
+
+        chunks = client._chunk_content(content)
+
+        assert all(estimate_tokens(chunk) <= 50 for chunk in chunks)
+        assert " ".join(chunks).split() == content.split()
+
+    def test_partial_failure_keeps_other_chunks(self):
+        client = ChunkEchoClient(fail_marker="Project-11 ")
+        result = client.analyze_content(self._long_entry(), Path("/t.txt"))
+
+        assert "Project-0" in result.projects
+        assert "Project-11" not in result.projects
+        assert client.get_stats().failed_calls == 1
+
+    def test_all_chunks_failing_returns_error_result(self):
+        client = StubLLMClient(should_fail=True)
+        result = client.analyze_content(self._long_entry(), Path("/t.txt"))
+
+        assert result.projects == []
+        assert result.raw_response.startswith("ERROR")
+        assert client.get_stats().successful_calls == 0
+
+
+class TestTaskStats:
+    """Tests for per-task statistics on shared clients."""
+
+    def test_task_stats_count_only_calls_in_block(self):
+        client = StubLLMClient(api_response_text='{"projects": ["A"]}')
+        client.analyze_content("before", Path("/a.txt"))
+
+        with track_task_stats() as task_stats:
+            client.analyze_content("during", Path("/b.txt"))
+
+        client.analyze_content("after", Path("/c.txt"))
+        assert task_stats.total_calls == 1
+        assert task_stats.successful_calls == 1
+        assert client.get_stats().total_calls == 3
+
+    def test_task_stats_include_concurrent_chunks(self):
+        client = ChunkEchoClient()
+        entry = "\n\n".join(f"Project-{i} " + "notes " * 600 for i in range(6))
+
+        with track_task_stats() as task_stats:
+            client.analyze_content(entry, Path("/t.txt"))
+
+        assert task_stats.total_calls == len(client.requests) > 1
+        assert task_stats.successful_calls == task_stats.total_calls
+
+    def test_task_stats_span_clients(self):
+        first = StubLLMClient(api_response_text='{"projects": ["A"]}')
+        second = StubLLMClient(should_fail=True)
+
+        with track_task_stats() as task_stats:
+            first.analyze_content("one", Path("/a.txt"))
+            second.analyze_content("two", Path("/b.txt"))
+
+        assert task_stats.total_calls == 2
+        assert task_stats.failed_calls == 1
+
+
 class TestBaseLLMClientIsAbstract:
     """Tests verifying BaseLLMClient cannot be instantiated directly."""
 
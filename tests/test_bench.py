@@ -0,0 +1,58 @@
+"""
+Tests for the Pipeline Benchmark Harness
+
+This module smoke-tests scripts/bench.py:
+- The synthetic corpus lands where FileDiscovery looks for it
+- A small run writes comparable JSON results
+- --max-regression fails the run when a benchmark got slower
+"""
+
+import json
+from datetime import date
+
+from file_discovery import FileDiscovery
+from scripts import bench
+
+
+class TestBuildCorpus:
+    """Test the synthetic worklog tree."""
+
+    def test_corpus_discoverable(self, tmp_path):
+        paths = bench.build_corpus(tmp_path, days=14, lines=5, end_date=date(2024, 3, 15))
+
+        result = FileDiscovery(str(tmp_path)).discover_files(date(2024, 3, 2), date(2024, 3, 15))
+
+        assert len(paths) == 10
+        assert sorted(result.found_files) == sorted(paths)
+        assert paths[-1].parent.name == "week_ending_2024-03-15"
+
+    def test_corpus_deterministic(self, tmp_path):
+        first = bench.build_corpus(tmp_path / "a", days=7, lines=5, seed=3, end_date=date(2024, 3, 15))
+        second = bench.build_corpus(tmp_path / "b", days=7, lines=5, seed=3, end_date=date(2024, 3, 15))
+
+        assert [p.read_text() for p in first] == [p.read_text() for p in second]
+
+
+class TestBenchRun:
+    """Test a complete small benchmark run."""
+
+    def test_writes_json_results(self, tmp_path):
+        output = tmp_path / "bench.json"
+
+        assert bench.main(["--days", "10", "--lines", "3", "--repeat", "1",
+                           "--output", str(output)]) == 0
+
+        report = json.loads(output.read_text())
+        assert report["schema"] == bench.RESULTS_SCHEMA
+        assert set(report["results"]) == {
+            "discover_files", "process_files", "full_sync", "full_sync_unchanged", "pipeline"
+        }
+        assert all(result["items"] == report["corpus"]["files"]
+                   for result in report["results"].values())
+
+    def test_regression_fails_run(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps({"results": {"discover_files": {"median_s": 1e-9}}}))
+
+        assert bench.main(["--days", "3", "--lines", "3", "--repeat", "1",
+                           "--compare", str(baseline), "--max-regression", "10"]) == 1
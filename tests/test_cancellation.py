@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# ABOUTME: Tests for cooperative cancellation of summarization pipeline phases.
+# ABOUTME: Covers tokens, cancellable backoff, partial stats and provider fallback on cancel.
+"""
+Tests for cancellation.
+
+Verifies that:
+- A cancelled token interrupts cancellable_sleep immediately
+- Provider retry backoff stops when the task is cancelled
+- Pipeline analysis stops at the next file and reports partial APIStats
+- UnifiedLLMClient neither falls back nor opens a circuit on cancellation
+- Summary generation stops at the next period
+"""
+
+import json
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+import summarization_pipeline
+from base_llm_client import BaseLLMClient
+from bedrock_client import BedrockClient
+from cancellation import (CancellationToken, TaskCancelledError, cancellable_sleep,
+                          cancellation_scope, check_cancelled)
+from circuit_breaker import CircuitBreaker
+from config_manager import AppConfig, BedrockConfig, CBORGConfig, GoogleGenAIConfig, LLMConfig
+from content_processor import ProcessedContent
+from llm_data_structures import AnalysisResult
+from summary_generator import SummaryGenerator
+from unified_llm_client import UnifiedLLMClient
+
+VALID = json.dumps({"projects": ["Alpha"], "participants": [], "tasks": [], "themes": []})
+
+
+class CancellingClient(BaseLLMClient):
+    """Answers every request and cancels the token after a fixed number of calls."""
+
+    def __init__(self, token, cancel_after):
+        super().__init__()
+        self.token = token
+        self.cancel_after = cancel_after
+        self.calls = 0
+
+    def _make_api_call(self, system: str, user: str) -> str:
+        self.calls += 1
+        if self.calls == self.cancel_after:
+            self.token.cancel()
+        return VALID
+
+    def test_connection(self) -> bool:
+        return True
+
+    def get_provider_info(self):
+        return {"provider": "cancelling"}
+
+
+def make_content(name):
+    return ProcessedContent(
+        file_path=Path(f"/journal/{name}"), date=date(2024, 1, 1), content="Worked on Alpha.",
+        word_count=3, line_count=1, encoding="utf-8", processing_time=0.0, errors=[]
+    )
+
+
+class TestCancellationToken:
+    """Test the token and its context-scoped helpers."""
+
+    def test_check_outside_scope_is_noop(self):
+        check_cancelled()
+
+    def test_check_raises_once_cancelled(self):
+        token = CancellationToken()
+        with cancellation_scope(token):
+            check_cancelled()
+            token.cancel()
+            with pytest.raises(TaskCancelledError):
+                check_cancelled()
+
+    def test_cancel_interrupts_sleep(self):
+        token = CancellationToken()
+        threading.Timer(0.05, token.cancel).start()
+
+        start = time.monotonic()
+        with cancellation_scope(token), pytest.raises(TaskCancelledError):
+            cancellable_sleep(10)
+
+        assert time.monotonic() - start < 5
+
+
+class TestProviderBackoff:
+    """Test that retry loops give up on cancellation instead of sleeping it out."""
+
+    def test_bedrock_throttling_backoff_cancelled(self):
+        config = BedrockConfig(region="us-west-2", model_id="test-model", max_retries=3,
+                               rate_limit_delay=30.0)
+        with patch.dict("os.environ", {"AWS_ACCESS_KEY_ID": "k", "AWS_SECRET_ACCESS_KEY": "s"}):
+            client = BedrockClient(config)
+        client.client = MagicMock()
+        client.client.invoke_model.side_effect = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "slow down"}}, "InvokeModel")
+
+        token = CancellationToken()
+        token.cancel()
+        with cancellation_scope(token), pytest.raises(TaskCancelledError):
+            client._make_api_call_with_retry({"messages": []})
+
+        assert client.client.invoke_model.call_count == 1
+
+
+class TestPipelineCancellation:
+    """Test cancellation of phase 3 in summarization_pipeline."""
+
+    def test_analysis_stops_with_partial_stats(self):
+        token = CancellationToken()
+        llm_client = CancellingClient(token, cancel_after=2)
+        files = [make_content(f"{day}.txt") for day in range(5)]
+
+        with pytest.raises(TaskCancelledError) as excinfo:
+            summarization_pipeline.analyze_content(
+                files, Mock(), llm_client=llm_client, cancel_token=token)
+
+        assert llm_client.calls == 2
+        assert excinfo.value.api_stats.total_calls == 2
+        assert excinfo.value.api_stats.successful_calls == 2
+
+    def test_uncancelled_token_runs_to_completion(self):
+        token = CancellationToken()
+        llm_client = CancellingClient(token, cancel_after=0)
+        files = [make_content(f"{day}.txt") for day in range(3)]
+
+        results, api_stats, _ = summarization_pipeline.analyze_content(
+            files, Mock(), llm_client=llm_client, cancel_token=token)
+
+        assert len(results) == 3
+        assert api_stats.total_calls == 3
+
+
+@patch('unified_llm_client.CBORGClient')
+@patch('unified_llm_client.BedrockClient')
+@patch('unified_llm_client.GoogleGenAIClient')
+class TestUnifiedClientCancellation:
+    """Test that cancellation is not mistaken for a provider failure."""
+
+    @pytest.fixture
+    def config(self):
+        return AppConfig(
+            llm=LLMConfig(provider="google_genai", fallback_providers=["bedrock"],
+                          circuit_failure_threshold=1),
+            bedrock=BedrockConfig(region="us-east-1", model_id="test-model"),
+            google_genai=GoogleGenAIConfig(project="test-project", model="test-model"),
+            cborg=CBORGConfig()
+        )
+
+    def test_cancel_does_not_fall_back(self, mock_google, mock_bedrock, mock_cborg, config):
+        mock_google.return_value.analyze_content.side_effect = TaskCancelledError()
+        callback = Mock()
+
+        client = UnifiedLLMClient(config, on_fallback=callback)
+        with pytest.raises(TaskCancelledError):
+            client.analyze_content("text", Path("a.txt"))
+
+        mock_bedrock.return_value.analyze_content.assert_not_called()
+        callback.assert_not_called()
+        assert client.get_provider_health()["google_genai"]["circuit"] == CircuitBreaker.CLOSED
+
+    def test_cancelled_probe_releases_half_open_circuit(self, mock_google, mock_bedrock,
+                                                        mock_cborg, config):
+        client = UnifiedLLMClient(config, on_fallback=Mock())
+        breaker = client._breakers["google_genai"]
+        breaker.reset_timeout = 0.0
+        breaker.record_failure()
+
+        mock_google.return_value.analyze_content.side_effect = TaskCancelledError()
+        with pytest.raises(TaskCancelledError):
+            client.analyze_content("text", Path("a.txt"))
+
+        assert breaker.allow_request()
+
+
+class TestSummaryGeneratorCancellation:
+    """Test cancellation between summary periods."""
+
+    def test_stops_before_next_period(self):
+        token = CancellationToken()
+        llm_client = Mock()
+
+        def analyze(prompt, file_path):
+            token.cancel()
+            return AnalysisResult(file_path=file_path, projects=[], participants=[], tasks=[],
+                                  themes=[], api_call_time=0.1, raw_response="Summary text.")
+
+        llm_client.analyze_content.side_effect = analyze
+        results = [
+            AnalysisResult(file_path=Path(f"/journal/2024-01-{day:02d}.txt"), projects=["Alpha"],
+                           participants=[], tasks=[], themes=[], api_call_time=0.1)
+            for day in (1, 15)
+        ]
+
+        with pytest.raises(TaskCancelledError):
+            SummaryGenerator(llm_client).generate_summaries(
+                results, "weekly", date(2024, 1, 1), date(2024, 1, 31), cancel_token=token)
+
+        assert llm_client.analyze_content.call_count == 1
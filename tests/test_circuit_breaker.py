@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# ABOUTME: Tests for provider circuit breakers, latency tracking and hedged requests.
+# ABOUTME: Covers the breaker state machine and its use by UnifiedLLMClient's fallback chain.
+"""
+Tests for circuit_breaker and its integration with UnifiedLLMClient.
+
+Verifies that:
+- A breaker opens after consecutive failures and admits one half-open probe
+- LatencyTracker reports p95 only once enough samples exist
+- Providers with open circuits are skipped and the primary is retried after reset
+- Error results trigger fallback just like exceptions
+- A slow provider is hedged against the next one and the first answer wins
+"""
+
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from circuit_breaker import CircuitBreaker, LatencyTracker, ProviderUnavailableError
+from config_manager import AppConfig, BedrockConfig, CBORGConfig, GoogleGenAIConfig, LLMConfig
+from llm_data_structures import AnalysisResult
+from unified_llm_client import UnifiedLLMClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_result(project="Alpha", raw_response='{"projects": ["Alpha"]}'):
+    return AnalysisResult(
+        file_path=Path("test.md"), projects=[project], participants=[], tasks=[],
+        themes=[], api_call_time=0.1, raw_response=raw_response
+    )
+
+
+@pytest.fixture
+def fallback_config():
+    return AppConfig(
+        llm=LLMConfig(provider="google_genai", fallback_providers=["bedrock", "cborg"],
+                      circuit_failure_threshold=2, circuit_reset_seconds=30.0),
+        bedrock=BedrockConfig(region="us-east-1", model_id="test-model"),
+        google_genai=GoogleGenAIConfig(project="test-project", model="test-model"),
+        cborg=CBORGConfig()
+    )
+
+
+class TestCircuitBreaker:
+    """Test the closed/open/half-open state machine."""
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker("p", failure_threshold=2, clock=FakeClock())
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker("p", failure_threshold=2, clock=FakeClock())
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_admits_single_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("p", failure_threshold=1, reset_timeout=10.0, clock=clock)
+        breaker.record_failure()
+
+        clock.now += 10.0
+        assert breaker.allow_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("p", failure_threshold=3, reset_timeout=10.0, clock=clock)
+        for _ in range(3):
+            breaker.record_failure()
+
+        clock.now += 10.0
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+
+class TestLatencyTracker:
+    """Test the sliding p95 window."""
+
+    def test_percentile_requires_min_samples(self):
+        tracker = LatencyTracker(min_samples=5)
+        for _ in range(4):
+            tracker.record(1.0)
+        assert tracker.percentile() is None
+        tracker.record(1.0)
+        assert tracker.percentile() == 1.0
+
+    def test_p95_of_window(self):
+        tracker = LatencyTracker(window=100, min_samples=1)
+        for value in range(1, 101):
+            tracker.record(float(value))
+        assert tracker.percentile(0.95) == 95.0
+
+
+@patch('unified_llm_client.CBORGClient')
+@patch('unified_llm_client.BedrockClient')
+@patch('unified_llm_client.GoogleGenAIClient')
+class TestUnifiedClientHealth:
+    """Test breaker-aware fallback and hedging in UnifiedLLMClient."""
+
+    def test_open_circuit_skips_primary(self, mock_google, mock_bedrock, mock_cborg, fallback_config):
+        mock_google.return_value.analyze_content.side_effect = Exception("Google down")
+        mock_bedrock.return_value.analyze_content.return_value = make_result("Beta")
+
+        client = UnifiedLLMClient(fallback_config, on_fallback=Mock())
+        for _ in range(3):
+            assert client.analyze_content("text", Path("a.txt")).projects == ["Beta"]
+
+        # Two failures opened the circuit; the third call went straight to bedrock
+        assert mock_google.return_value.analyze_content.call_count == 2
+        assert client.get_provider_health()["google_genai"]["circuit"] == CircuitBreaker.OPEN
+
+    def test_primary_used_again_after_reset(self, mock_google, mock_bedrock, mock_cborg, fallback_config):
+        primary = mock_google.return_value
+        primary.analyze_content.side_effect = [Exception("down"), Exception("down"), make_result("Alpha")]
+        mock_bedrock.return_value.analyze_content.return_value = make_result("Beta")
+
+        client = UnifiedLLMClient(fallback_config, on_fallback=Mock())
+        clock = FakeClock()
+        client._breakers["google_genai"]._clock = clock
+        client.analyze_content("text", Path("a.txt"))
+        client.analyze_content("text", Path("b.txt"))
+        assert client.active_provider_name == "bedrock"
+
+        clock.now += fallback_config.llm.circuit_reset_seconds
+        result = client.analyze_content("text", Path("c.txt"))
+
+        assert result.projects == ["Alpha"]
+        assert client.active_provider_name == "google_genai"
+
+    def test_error_result_triggers_fallback(self, mock_google, mock_bedrock, mock_cborg, fallback_config):
+        mock_google.return_value.analyze_content.return_value = make_result(
+            "", raw_response="ERROR (ConnectionError)")
+        mock_bedrock.return_value.analyze_content.return_value = make_result("Beta")
+        callback = Mock()
+
+        client = UnifiedLLMClient(fallback_config, on_fallback=callback)
+        result = client.analyze_content("text", Path("a.txt"))
+
+        assert result.projects == ["Beta"]
+        assert "ERROR (ConnectionError)" in callback.call_args[0][0]
+
+    def test_all_error_results_returns_last(self, mock_google, mock_bedrock, mock_cborg, fallback_config):
+        for mock_cls in (mock_google, mock_bedrock, mock_cborg):
+            mock_cls.return_value.analyze_content.return_value = make_result(
+                "", raw_response="ERROR (Timeout)")
+
+        client = UnifiedLLMClient(fallback_config, on_fallback=Mock())
+        assert client.analyze_content("text", Path("a.txt")).is_error
+
+    def test_all_circuits_open_raises(self, mock_google, mock_bedrock, mock_cborg, fallback_config):
+        for mock_cls in (mock_google, mock_bedrock, mock_cborg):
+            mock_cls.return_value.analyze_content.side_effect = Exception("down")
+
+        client = UnifiedLLMClient(fallback_config, on_fallback=Mock())
+        for _ in range(2):
+            with pytest.raises(Exception, match="down"):
+                client.analyze_content("text", Path("a.txt"))
+
+        with pytest.raises(ProviderUnavailableError):
+            client.analyze_content("text", Path("a.txt"))
+
+    def test_slow_provider_is_hedged(self, mock_google, mock_bedrock, mock_cborg, fallback_config,
+                                     monkeypatch):
+        monkeypatch.setattr('unified_llm_client.HEDGE_MIN_DELAY_SECONDS', 0.01)
+        release = threading.Event()
+
+        def slow_analyze(content, file_path):
+            release.wait(5)
+            return make_result("Slow")
+
+        mock_google.return_value.analyze_content.side_effect = slow_analyze
+        mock_bedrock.return_value.analyze_content.return_value = make_result("Fast")
+        callback = Mock()
+
+        client = UnifiedLLMClient(fallback_config, on_fallback=callback, hedge_requests=True)
+        for _ in range(20):
+            client._latency["google_genai"].record(0.01)
+
+        try:
+            result = client.analyze_content("text", Path("a.txt"))
+        finally:
+            release.set()
+
+        assert result.projects == ["Fast"]
+        assert client.active_provider_name == "bedrock"
+        assert "Also trying 'bedrock'" in callback.call_args[0][0]
+
+    def test_no_hedge_without_latency_history(self, mock_google, mock_bedrock, mock_cborg,
+                                              fallback_config):
+        mock_google.return_value.analyze_content.return_value = make_result("Alpha")
+
+        client = UnifiedLLMClient(fallback_config, hedge_requests=True)
+        assert client.analyze_content("text", Path("a.txt")).projects == ["Alpha"]
+        mock_bedrock.assert_not_called()
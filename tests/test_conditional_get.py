@@ -0,0 +1,133 @@
+# ABOUTME: Tests for ETag / If-None-Match handling on entry and calendar endpoints.
+# ABOUTME: Verifies 304 on unchanged data and a new validator after an entry is saved.
+
+"""
+Tests for conditional GET support.
+
+Verifies that:
+- Entry, calendar month and today responses carry a strong ETag
+- Repeating the request with If-None-Match returns an empty 304
+- Saving an entry changes the validators of the affected resources
+- The If-None-Match parser handles lists, weak prefixes and '*'
+"""
+
+from datetime import date
+from unittest.mock import Mock
+
+import pytest
+
+from web.utils.etag_utils import make_etag, etag_matches
+
+
+@pytest.fixture
+def client_with_entry(isolated_app_client):
+    """Create an entry for today and return (client, date)."""
+    today = date.today()
+    response = isolated_app_client.post(
+        f"/api/entries/{today.isoformat()}",
+        json={"date": today.isoformat(), "content": "Reviewed the sync PR"}
+    )
+    assert response.status_code == 200
+    return isolated_app_client, today
+
+
+def _revalidate(client, url, etag):
+    return client.get(url, headers={"If-None-Match": etag})
+
+
+class TestEntryConditionalGet:
+    """Test conditional GET on /api/entries/{date}."""
+
+    def test_entry_not_modified(self, client_with_entry):
+        client, today = client_with_entry
+        url = f"/api/entries/{today.isoformat()}"
+
+        first = client.get(url)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert not etag.startswith("W/")
+
+        second = _revalidate(client, url, etag)
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+
+    def test_entry_etag_changes_after_save(self, client_with_entry):
+        client, today = client_with_entry
+        url = f"/api/entries/{today.isoformat()}?include_content=true"
+        etag = client.get(url).headers["ETag"]
+
+        client.post(
+            f"/api/entries/{today.isoformat()}",
+            json={"date": today.isoformat(), "content": "Merged the sync PR"}
+        )
+
+        response = _revalidate(client, url, etag)
+        assert response.status_code == 200
+        assert response.json()["content"] == "Merged the sync PR"
+        assert response.headers["ETag"] != etag
+
+    def test_content_flag_is_part_of_etag(self, client_with_entry):
+        client, today = client_with_entry
+        base = f"/api/entries/{today.isoformat()}"
+
+        assert client.get(base).headers["ETag"] != \
+            client.get(base + "?include_content=true").headers["ETag"]
+
+    def test_missing_entry_has_no_etag(self, isolated_app_client):
+        response = isolated_app_client.get("/api/entries/2001-01-01")
+        assert response.status_code == 404
+        assert "ETag" not in response.headers
+
+
+class TestCalendarConditionalGet:
+    """Test conditional GET on calendar month and today endpoints."""
+
+    def test_month_not_modified_until_entry_saved(self, client_with_entry):
+        client, today = client_with_entry
+        url = f"/api/calendar/{today.year}/{today.month}"
+
+        etag = client.get(url).headers["ETag"]
+        assert _revalidate(client, url, etag).status_code == 304
+
+        client.post(
+            f"/api/entries/{today.isoformat()}",
+            json={"date": today.isoformat(), "content": "Reviewed the sync PR twice over"}
+        )
+
+        response = _revalidate(client, url, etag)
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_today_not_modified(self, client_with_entry):
+        client, _ = client_with_entry
+
+        first = client.get("/api/calendar/today")
+        assert first.status_code == 200
+
+        second = _revalidate(client, "/api/calendar/today", first.headers["ETag"])
+        assert second.status_code == 304
+
+
+class TestEtagMatching:
+    """Test If-None-Match parsing."""
+
+    @pytest.mark.parametrize("header,expected", [
+        (None, False),
+        ('"other"', False),
+        ('"other", "current"', True),
+        ('W/"current"', True),
+        ('*', True),
+    ])
+    def test_if_none_match(self, header, expected):
+        request = Mock()
+        request.headers = {"if-none-match": header} if header else {}
+
+        assert etag_matches(request, '"current"') is expected
+
+    def test_make_etag_is_stable_and_quoted(self):
+        etag = make_etag(date(2024, 1, 15), None, 3)
+
+        assert etag == make_etag(date(2024, 1, 15), None, 3)
+        assert etag != make_etag(date(2024, 1, 15), None, 4)
+        assert etag.startswith('"') and etag.endswith('"')
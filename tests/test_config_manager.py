@@ -234,6 +234,29 @@ class TestConfigManager:
         finally:
             config_path.unlink()
     
+    def test_invalid_analysis_sampling(self):
+        """Test validation of the streaming analysis sampling strategy."""
+        yaml_config = {
+            'processing': {
+                'stream_threshold_mb': 8,
+                'analysis_sampling': 'middle'
+            }
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(yaml_config, f)
+            config_path = Path(f.name)
+        
+        try:
+            with patch.dict(os.environ, {
+                'AWS_ACCESS_KEY_ID': 'test-key',
+                'AWS_SECRET_ACCESS_KEY': 'test-secret'
+            }):
+                with pytest.raises(ValueError, match="Invalid analysis_sampling 'middle'"):
+                    ConfigManager(config_path)
+        finally:
+            config_path.unlink()
+    
     def test_save_example_config_yaml(self):
         """Test saving example configuration as YAML."""
         with tempfile.NamedTemporaryFile(suffix='.yaml', delete=False) as f:
@@ -14,6 +14,7 @@ import os
 from datetime import date
 
 # Import the modules we'll be testing
+import content_processor
 from content_processor import ContentProcessor, ProcessedContent, ProcessingStats
 
 
@@ -124,8 +125,8 @@ class TestContentProcessor:
         """Test handling of empty files."""
         empty_files = [Path("empty1.txt"), Path("empty2.txt")]
         
-        with patch.object(self.processor, '_read_file_content') as mock_read:
-            mock_read.return_value = ""
+        with patch.object(self.processor, '_read_file_bytes') as mock_read:
+            mock_read.return_value = b""
             with patch('pathlib.Path.stat') as mock_stat:
                 mock_stat.return_value.st_size = 0
                 
@@ -153,7 +154,7 @@ class TestContentProcessor:
         """Test handling of binary/corrupted files."""
         corrupted_file = Path("corrupted.txt")
         
-        with patch.object(self.processor, '_read_file_content') as mock_read:
+        with patch.object(self.processor, '_read_file_bytes') as mock_read:
             mock_read.side_effect = UnicodeDecodeError('utf-8', b'', 0, 1, 'invalid start byte')
             with patch('pathlib.Path.stat') as mock_stat:
                 mock_stat.return_value.st_size = 100
@@ -187,13 +188,13 @@ class TestContentProcessor:
             Path("fail2.txt")
         ]
         
-        def mock_read_side_effect(file_path, encoding=None):
+        def mock_read_side_effect(file_path):
             if "success" in str(file_path):
-                return "Valid content for processing"
+                return b"Valid content for processing"
             else:
                 raise IOError("File read error")
         
-        with patch.object(self.processor, '_read_file_content', side_effect=mock_read_side_effect):
+        with patch.object(self.processor, '_read_file_bytes', side_effect=mock_read_side_effect):
             with patch('pathlib.Path.exists', return_value=True):
                 with patch('pathlib.Path.stat') as mock_stat:
                     mock_stat.return_value.st_size = 100
@@ -211,7 +212,7 @@ class TestContentProcessor:
         test_file = Path("test.txt")
         test_content = "This is test content for validation."
         
-        with patch.object(self.processor, '_read_file_content', return_value=test_content):
+        with patch.object(self.processor, '_read_file_bytes', return_value=test_content.encode()):
             with patch('pathlib.Path.stat') as mock_stat:
                 mock_stat.return_value.st_size = len(test_content)
                 
@@ -233,7 +234,7 @@ class TestContentProcessor:
         """Test word count calculation accuracy."""
         test_content = "This is a test sentence with exactly ten words here."
         
-        with patch.object(self.processor, '_read_file_content', return_value=test_content):
+        with patch.object(self.processor, '_read_file_bytes', return_value=test_content.encode()):
             with patch('pathlib.Path.stat') as mock_stat:
                 mock_stat.return_value.st_size = len(test_content)
                 
@@ -247,7 +248,7 @@ class TestContentProcessor:
         """Test line count calculation accuracy."""
         test_content = "Line 1\nLine 2\nLine 3\n"
         
-        with patch.object(self.processor, '_read_file_content', return_value=test_content):
+        with patch.object(self.processor, '_read_file_bytes', return_value=test_content.encode()):
             with patch('pathlib.Path.stat') as mock_stat:
                 mock_stat.return_value.st_size = len(test_content)
                 
@@ -265,7 +266,7 @@ class TestContentProcessor:
             Path("worklog_2024-04-02.txt")
         ]
         
-        with patch.object(self.processor, '_read_file_content', return_value="test content"):
+        with patch.object(self.processor, '_read_file_bytes', return_value=b"test content"):
             with patch('pathlib.Path.stat') as mock_stat:
                 mock_stat.return_value.st_size = 100
                 
@@ -283,7 +284,7 @@ class TestContentProcessor:
         
         # Mock a scenario where encoding detection has issues but processing continues
         with patch.object(self.processor, '_detect_encoding', return_value='utf-8'):
-            with patch.object(self.processor, '_read_file_content', return_value="test content"):
+            with patch.object(self.processor, '_read_file_bytes', return_value=b"test content"):
                 with patch('pathlib.Path.stat') as mock_stat:
                     mock_stat.return_value.st_size = 100
                     
@@ -297,7 +298,7 @@ class TestContentProcessor:
         # Create 10 mock files
         files = [Path(f"test_{i}.txt") for i in range(10)]
         
-        with patch.object(self.processor, '_read_file_content', return_value="test content"):
+        with patch.object(self.processor, '_read_file_bytes', return_value=b"test content"):
             with patch('pathlib.Path.stat') as mock_stat:
                 mock_stat.return_value.st_size = 100
                 
@@ -313,6 +314,330 @@ class TestContentProcessor:
                 assert stats.processing_time < 5.0  # Should complete within 5 seconds
 
 
+class TestParallelProcessing:
+    """Test suite for concurrent file processing."""
+    
+    def _write_worklogs(self, directory, count=12):
+        """Write worklog files with distinct content and return their paths shuffled."""
+        paths = []
+        for day in range(1, count + 1):
+            path = Path(directory) / f"worklog_2024-04-{day:02d}.txt"
+            path.write_text(f"Day {day} notes\r\nShipped feature number {day}\n\n\n\n", encoding="utf-8")
+            paths.append(path)
+        return list(reversed(paths))
+    
+    def _summary(self, results, stats):
+        return ([(r.file_path.name, r.content, r.word_count, r.line_count, r.encoding) for r in results],
+                (stats.total_files, stats.successful, stats.failed, stats.total_size_bytes, stats.total_words))
+    
+    def test_thread_pool_matches_serial(self, tmp_path):
+        """Threaded processing returns the same results in chronological order."""
+        paths = self._write_worklogs(tmp_path)
+        
+        serial = self._summary(*ContentProcessor(max_workers=1).process_files(paths))
+        threaded = self._summary(*ContentProcessor(max_workers=4).process_files(paths))
+        
+        assert threaded == serial
+        assert [name for name, *_ in threaded[0]] == sorted(p.name for p in paths)
+        assert threaded[1][3] == sum(p.stat().st_size for p in paths)
+    
+    def test_process_pool_matches_serial(self, tmp_path):
+        """Process-pool sanitization returns the same results as serial processing."""
+        paths = self._write_worklogs(tmp_path, count=4)
+        
+        serial = self._summary(*ContentProcessor(max_workers=1).process_files(paths))
+        pooled = self._summary(*ContentProcessor(max_workers=2, use_process_pool=True).process_files(paths))
+        
+        assert pooled == serial
+    
+    def test_process_pool_unreadable_file_counted_as_failure(self, tmp_path):
+        """An unreadable file fails on its own in process-pool mode instead of aborting the run."""
+        paths = self._write_worklogs(tmp_path, count=4)
+        unreadable = tmp_path / "worklog_2024-04-02.txt"
+        original_read = ContentProcessor._read_file_bytes
+        
+        def read_file_bytes(processor, file_path):
+            if file_path == unreadable:
+                raise PermissionError(13, "Permission denied", str(file_path))
+            return original_read(processor, file_path)
+        
+        with patch.object(ContentProcessor, '_read_file_bytes', autospec=True, side_effect=read_file_bytes):
+            results, stats = ContentProcessor(max_workers=2, use_process_pool=True).process_files(paths)
+        
+        assert [r.file_path.name for r in results] == sorted(p.name for p in paths if p != unreadable)
+        assert (stats.total_files, stats.successful, stats.failed) == (4, 3, 1)
+    
+    def test_single_stat_and_read_per_file(self, tmp_path):
+        """Each file is stat'ed once and opened once."""
+        paths = self._write_worklogs(tmp_path, count=5)
+        original_stat = Path.stat
+        original_open = open
+        opened = []
+        
+        def counting_open(file, *args, **kwargs):
+            opened.append(str(file))
+            return original_open(file, *args, **kwargs)
+        
+        with patch.object(Path, 'stat', autospec=True, side_effect=original_stat) as mock_stat:
+            with patch('builtins.open', side_effect=counting_open):
+                results, stats = ContentProcessor(max_workers=3).process_files(paths)
+        
+        assert stats.successful == 5
+        assert mock_stat.call_count == 5
+        assert sorted(opened) == sorted(str(p) for p in paths)
+    
+    def test_failures_do_not_disturb_order(self, tmp_path):
+        """Missing and empty files are counted as failures without reordering results."""
+        paths = self._write_worklogs(tmp_path, count=6)
+        empty = tmp_path / "worklog_2024-04-03.txt"
+        empty.write_text("")
+        missing = tmp_path / "worklog_2024-04-30.txt"
+        
+        results, stats = ContentProcessor(max_workers=4).process_files(paths + [missing])
+        
+        assert stats.total_files == 7
+        assert stats.failed == 2
+        assert [r.date.day for r in results] == [1, 2, 4, 5, 6]
+
+
+class TestSingleReadDecoding:
+    """Test suite for the UTF-8 fast path and the encoding cache."""
+    
+    def setup_method(self):
+        content_processor._encoding_cache.clear()
+        self.processor = ContentProcessor(max_workers=1)
+    
+    def test_utf8_skips_chardet(self, tmp_path):
+        """Valid UTF-8 is decoded without running chardet."""
+        path = tmp_path / "worklog_2024-04-15.txt"
+        path.write_bytes("Café standup 🚀 notes".encode('utf-8'))
+        
+        with patch('chardet.detect') as mock_detect:
+            results, _ = self.processor.process_files([path])
+        
+        mock_detect.assert_not_called()
+        assert results[0].encoding == 'utf-8'
+        assert results[0].content == "Café standup 🚀 notes"
+    
+    @pytest.mark.parametrize("encoding,expected", [
+        ('utf-8-sig', 'utf-8-sig'),
+        ('utf-16', 'utf-16'),
+    ])
+    def test_bom_sniffing(self, tmp_path, encoding, expected):
+        """Byte order marks select the codec and are stripped from the content."""
+        path = tmp_path / "worklog_2024-04-15.txt"
+        path.write_bytes("Résumé review notes".encode(encoding))
+        
+        results, _ = self.processor.process_files([path])
+        
+        assert results[0].encoding == expected
+        assert results[0].content == "Résumé review notes"
+    
+    def test_non_utf8_falls_back_and_is_cached(self, tmp_path):
+        """Non-UTF-8 files use chardet once, then the cached encoding."""
+        path = tmp_path / "worklog_2024-04-15.txt"
+        path.write_bytes("Café résumé notes for the week".encode('cp1252'))
+        
+        with patch('chardet.detect', return_value={'encoding': 'windows-1252', 'confidence': 0.9}) as mock_detect:
+            first, _ = self.processor.process_files([path])
+            second, _ = ContentProcessor(max_workers=1).process_files([path])
+        
+        assert mock_detect.call_count == 1
+        assert first[0].content == second[0].content == "Café résumé notes for the week"
+        assert second[0].encoding == 'windows-1252'
+    
+    def test_cache_invalidated_when_file_changes(self, tmp_path):
+        """A rewritten file is fingerprinted again rather than trusting the old encoding."""
+        path = tmp_path / "worklog_2024-04-15.txt"
+        path.write_bytes("résumé draft".encode('latin-1'))
+        self.processor.process_files([path])
+        
+        path.write_bytes("résumé final version".encode('utf-8'))
+        results, _ = self.processor.process_files([path])
+        
+        assert results[0].content == "résumé final version"
+        assert results[0].encoding == 'utf-8'
+
+
+def _legacy_sanitize(content):
+    """Line-by-line sanitizer the regex implementation must match exactly."""
+    if not content:
+        return ""
+    content = content.replace('\r\n', '\n').replace('\r', '\n')
+    processed_lines = []
+    consecutive_empty = 0
+    for line in content.split('\n'):
+        cleaned_line = line.rstrip()
+        if not cleaned_line.strip():
+            consecutive_empty += 1
+            if consecutive_empty <= 2:
+                processed_lines.append(cleaned_line)
+        else:
+            consecutive_empty = 0
+            processed_lines.append(cleaned_line)
+    return '\n'.join(processed_lines).strip()
+
+
+class TestSinglePassSanitizer:
+    """Test suite for the regex sanitizer and its combined statistics."""
+    
+    def setup_method(self):
+        self.processor = ContentProcessor()
+    
+    def test_matches_line_by_line_sanitizer(self):
+        """Randomized documents sanitize and count exactly like the old multi-pass code."""
+        import random
+        rng = random.Random(42)
+        alphabet = ['a', 'Z', '7', 'é', '_', '-', ' ', '\t', '\u3000', '\x0c', '\n', '\r', '\r\n']
+        
+        for _ in range(5000):
+            raw = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            expected = _legacy_sanitize(raw)
+            result = self.processor._sanitize_and_measure(raw)
+            
+            assert result.text == expected, repr(raw)
+            assert result.word_count == len(expected.split()), repr(raw)
+            assert result.line_count == len([l for l in expected.split('\n') if l.strip()]), repr(raw)
+            assert result.is_meaningful == (sum(1 for c in expected if c.isalnum()) >= 3), repr(raw)
+    
+    def test_statistics_for_structured_entry(self):
+        """Headers, bullets and blank-line runs are counted correctly."""
+        raw = "# Monday\r\n\r\n\r\n\r\n  - fixed login bug   \n  - paired on sync\n\n\nNotes_only"
+        
+        result = self.processor._sanitize_and_measure(raw)
+        
+        assert result.text == "# Monday\n\n\n  - fixed login bug\n  - paired on sync\n\n\nNotes_only"
+        assert result.word_count == 11
+        assert result.line_count == 4
+        assert result.is_meaningful is True
+    
+    def test_underscores_are_not_alphanumeric(self):
+        """The threshold counts str.isalnum() characters only."""
+        assert self.processor._sanitize_and_measure("__ -- ab").is_meaningful is False
+        assert self.processor._validate_content("a_b_c") is True
+
+
+class TestStreamingLargeFiles:
+    """Test suite for bounded-memory processing of files above the stream threshold."""
+    
+    def _write(self, tmp_path, data, name="worklog_2024-03-05.txt"):
+        path = tmp_path / name
+        path.write_bytes(data)
+        return path
+    
+    def _streaming_processor(self, **kwargs):
+        processor = ContentProcessor(max_workers=1, **kwargs)
+        processor.stream_threshold_bytes = 0  # stream every file
+        return processor
+    
+    def test_streaming_sanitizer_matches_whole_document(self):
+        """Arbitrary chunk splits and long-line flushes give the _normalize() result."""
+        import random
+        rng = random.Random(7)
+        alphabet = ['a', 'é', '_', ' ', '\t', '\u3000', '\n', '\r', '\r\n', '\n\n\n\n', 'x y']
+        processor = ContentProcessor()
+        
+        for _ in range(3000):
+            raw = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 50)))
+            expected = processor._sanitize_and_measure(raw)
+            
+            retainer = content_processor._ContentRetainer("head", 10 ** 9, len(raw))
+            sanitizer = content_processor._StreamingSanitizer(retainer, max_line_chars=rng.randint(1, 6))
+            offset = 0
+            while offset < len(raw):
+                size = rng.randint(1, 6)
+                sanitizer.feed(raw[offset:offset + size], offset)
+                offset += size
+            result = sanitizer.finish()
+            
+            assert (result.text, result.word_count, result.line_count, result.is_meaningful) == \
+                (expected.text, expected.word_count, expected.line_count, expected.is_meaningful), repr(raw)
+    
+    def test_streamed_file_keeps_full_statistics(self, tmp_path):
+        """A streamed file under the budget matches the whole-file path exactly."""
+        text = "".join(f"- item {i} café\r\n\r\n\r\n\r\n" for i in range(2000))
+        path = self._write(tmp_path, text.encode("utf-8"))
+        
+        [streamed], _ = self._streaming_processor().process_files([path])
+        [whole], _ = ContentProcessor(max_workers=1).process_files([path])
+        
+        assert streamed.content == whole.content
+        assert streamed.word_count == whole.word_count == 8000
+        assert streamed.line_count == whole.line_count == 2000
+        assert streamed.encoding == "utf-8"
+        assert streamed.truncated is False
+    
+    @pytest.mark.parametrize("sampling", ["head", "tail", "sample"])
+    def test_budget_retention(self, tmp_path, sampling):
+        """Only the budget is kept, from the part selected by analysis_sampling."""
+        lines = [f"entry {i:06d}" for i in range(200000)]
+        path = self._write(tmp_path, "\n".join(lines).encode("utf-8"))
+        processor = self._streaming_processor(analysis_budget_chars=2000, analysis_sampling=sampling)
+        
+        [result], stats = processor.process_files([path])
+        
+        assert result.truncated is True
+        assert result.word_count == 400000
+        assert result.line_count == 200000
+        assert stats.total_words == 400000
+        assert len(result.content) < 2100
+        assert "[...]" in result.content
+        if sampling == "head":
+            assert result.content.startswith("entry 000000\n")
+        elif sampling == "tail":
+            assert result.content.endswith("entry 199999")
+        else:
+            assert "entry 000000" in result.content
+            assert "entry 1" in result.content  # excerpts from later in the file
+            assert result.content.count("[...]") == 8
+    
+    def test_crlf_split_across_chunks(self, tmp_path, monkeypatch):
+        """A CRLF straddling a chunk boundary is one line break, not two."""
+        monkeypatch.setattr(content_processor, "STREAM_CHUNK_SIZE", 5)
+        path = self._write(tmp_path, b"abcd\r\nefgh\r\r\nij")
+        
+        [result], _ = self._streaming_processor().process_files([path])
+        
+        assert result.content == "abcd\nefgh\n\nij"
+        assert result.line_count == 3
+    
+    def test_non_utf8_file_restarts_with_detected_encoding(self, tmp_path, monkeypatch):
+        """Invalid UTF-8 late in the file triggers one re-read with chardet's encoding."""
+        monkeypatch.setattr(content_processor, "STREAM_CHUNK_SIZE", 64)
+        data = ("plain ascii notes " * 20 + "Café résumé naïve").encode("cp1252")
+        path = self._write(tmp_path, data)
+        
+        with patch.object(ContentProcessor, "_detect_encoding", return_value="cp1252") as detect:
+            [result], _ = self._streaming_processor().process_files([path])
+        
+        detect.assert_called_once()
+        assert result.encoding == "cp1252"
+        assert result.content.endswith("Café résumé naïve")
+    
+    def test_peak_memory_is_bounded(self, tmp_path):
+        """Streaming a large file allocates far less than the file size."""
+        import tracemalloc
+        line = "- Reviewed the café sync pipeline and résumé notes\r\n"
+        path = self._write(tmp_path, (line * 200000).encode("utf-8"))
+        file_size = path.stat().st_size
+        processor = ContentProcessor(max_workers=1, stream_threshold_mb=1,
+                                     analysis_budget_chars=10000)
+        
+        tracemalloc.start()
+        try:
+            [result], _ = processor.process_files([path])
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        
+        assert result.line_count == 200000
+        assert result.truncated is True
+        assert peak < file_size / 4
+    
+    def test_unknown_sampling_strategy_rejected(self):
+        with pytest.raises(ValueError, match="analysis_sampling"):
+            ContentProcessor(analysis_sampling="middle")
+
 class TestProcessingStats:
     """Test suite for ProcessingStats dataclass."""
     
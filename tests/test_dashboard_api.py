@@ -0,0 +1,149 @@
+"""
+Tests for the Dashboard Bootstrap Endpoint
+
+This module tests DashboardService and /api/dashboard:
+- One payload combining today's info, recent entries and database stats
+- Optional calendar month when year and month are given
+- Short-lived caching and invalidation on entry saves
+- Expired and excess cached payloads are evicted
+"""
+
+import pytest
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from web.app import app
+from web.models.journal import CalendarMonth, DashboardResponse, RecentEntriesResponse
+from web.services.dashboard_service import DASHBOARD_CACHE_MAX_ENTRIES, DashboardService
+
+
+def today_info():
+    today = date.today()
+    return {
+        "today": today,
+        "day_name": today.strftime("%A"),
+        "formatted_date": today.strftime("%B %d, %Y"),
+        "has_entry": False,
+        "entry_metadata": None,
+        "week_ending_date": today + timedelta(days=2),
+        "current_month": today.month,
+        "current_year": today.year,
+    }
+
+
+@pytest.fixture
+def services():
+    """Mocked dependencies for DashboardService."""
+    entry_manager = MagicMock()
+    entry_manager.get_recent_entries = AsyncMock(return_value=RecentEntriesResponse(
+        entries=[], total_count=0, has_more=False, pagination={}))
+    calendar_service = MagicMock()
+    calendar_service.get_today_info = AsyncMock(side_effect=lambda: today_info())
+    calendar_service.get_calendar_month = AsyncMock(return_value=CalendarMonth(
+        year=2024, month=1, month_name="January", entries=[], today=date.today()))
+    db_manager = MagicMock()
+    db_manager.get_database_stats = AsyncMock(return_value={
+        "total_entries": 12, "entries_with_content": 10,
+        "date_range": {"start": "2024-01-01", "end": "2024-01-31"},
+        "last_sync": None, "database_size_mb": 0.5,
+    })
+    return entry_manager, calendar_service, db_manager
+
+
+@pytest.fixture
+def dashboard_service(services):
+    entry_manager, calendar_service, db_manager = services
+    return DashboardService(MagicMock(), MagicMock(), db_manager, entry_manager, calendar_service)
+
+
+class TestDashboardService:
+    """Test payload assembly and caching."""
+
+    @pytest.mark.asyncio
+    async def test_combines_all_panels(self, dashboard_service):
+        payload = await dashboard_service.get_dashboard()
+
+        assert payload.today.today == date.today()
+        assert payload.recent_entries.total_count == 0
+        assert payload.stats.total_entries == 12
+        assert payload.calendar is None
+
+    @pytest.mark.asyncio
+    async def test_includes_requested_month(self, dashboard_service, services):
+        payload = await dashboard_service.get_dashboard(year=2024, month=1)
+
+        assert payload.calendar.month_name == "January"
+        services[1].get_calendar_month.assert_awaited_once_with(2024, 1)
+
+    @pytest.mark.asyncio
+    async def test_payload_cached(self, dashboard_service, services):
+        await dashboard_service.get_dashboard()
+        await dashboard_service.get_dashboard()
+
+        assert services[2].get_database_stats.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_entry_change_invalidates_cache(self, dashboard_service, services):
+        entry_manager = services[0]
+        listener = entry_manager.add_change_listener.call_args[0][0]
+
+        await dashboard_service.get_dashboard()
+        listener(date.today())
+        await dashboard_service.get_dashboard()
+
+        assert services[2].get_database_stats.await_count == 2
+
+
+    @pytest.mark.asyncio
+    async def test_expired_payloads_evicted(self, dashboard_service):
+        with patch('web.services.dashboard_service.time.monotonic', return_value=100.0):
+            await dashboard_service.get_dashboard(year=2024, month=1)
+        with patch('web.services.dashboard_service.time.monotonic', return_value=200.0):
+            await dashboard_service.get_dashboard(year=2024, month=2)
+
+        assert [key[2:] for key in dashboard_service._cache] == [(2024, 2)]
+
+    @pytest.mark.asyncio
+    async def test_cache_bounded(self, dashboard_service):
+        for month in range(DASHBOARD_CACHE_MAX_ENTRIES + 5):
+            await dashboard_service.get_dashboard(year=2000 + month // 12, month=month % 12 + 1)
+
+        assert len(dashboard_service._cache) == DASHBOARD_CACHE_MAX_ENTRIES
+        assert (2000, 1) not in {key[2:] for key in dashboard_service._cache}
+
+class TestDashboardEndpoint:
+    """Test the /api/dashboard route."""
+
+    @pytest.fixture
+    def client(self, isolated_app_client):
+        return isolated_app_client
+
+    def test_returns_payload(self, client, dashboard_service):
+        with patch.object(app.state, 'dashboard_service', dashboard_service):
+            response = client.get("/api/dashboard?year=2024&month=1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {"today", "recent_entries", "stats", "calendar"}
+        assert data["calendar"]["year"] == 2024
+
+    def test_year_without_month_rejected(self, client, dashboard_service):
+        with patch.object(app.state, 'dashboard_service', dashboard_service):
+            response = client.get("/api/dashboard?year=2024")
+
+        assert response.status_code == 400
+
+    def test_service_error_returns_500(self, client):
+        failing = MagicMock()
+        failing.get_dashboard = AsyncMock(side_effect=Exception("boom"))
+        with patch.object(app.state, 'dashboard_service', failing):
+            response = client.get("/api/dashboard")
+
+        assert response.status_code == 500
+
+    def test_real_service_wired_at_startup(self, client):
+        response = client.get("/api/dashboard")
+
+        assert response.status_code == 200
+        assert isinstance(app.state.dashboard_service, DashboardService)
+        DashboardResponse(**response.json())
@@ -0,0 +1,114 @@
+# ABOUTME: Tests for the SQLite performance profile applied by DatabaseManager.
+# ABOUTME: Verifies pragmas on both pools, read-only pool behaviour, and config parsing.
+
+"""
+Tests for the SQLite performance profile.
+
+Verifies that:
+- Every pooled connection gets WAL, synchronous, mmap, cache, temp_store and busy_timeout
+- The read-only pool rejects writes and falls back cleanly when not initialized
+- The database section of config.yaml is parsed and validated
+"""
+
+import os
+import tempfile
+
+import pytest
+import pytest_asyncio
+import yaml
+from sqlalchemy import text
+
+from config_manager import ConfigManager, DatabaseConfig
+from web.database import DatabaseManager
+
+
+@pytest_asyncio.fixture
+async def temp_db():
+    """Create a temporary database with a custom performance profile."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = DatabaseManager(os.path.join(temp_dir, "profile.db"))
+        await db_manager.initialize(db_config=DatabaseConfig(
+            mmap_size_mb=8, cache_size_mb=4, busy_timeout_ms=2500, read_pool_size=2
+        ))
+        yield db_manager
+        await db_manager.dispose()
+
+
+class TestPerformancePragmas:
+    """Test that the configured pragmas are applied to each connection."""
+
+    @pytest.mark.asyncio
+    async def test_write_pool_pragmas(self, temp_db):
+        profile = await temp_db.get_performance_profile()
+        pragmas = profile["pragmas"]
+
+        assert pragmas["journal_mode"].lower() == "wal"
+        assert pragmas["synchronous"] == 1  # NORMAL
+        assert pragmas["mmap_size"] == 8 * 1024 * 1024
+        assert pragmas["cache_size"] == -4 * 1024
+        assert pragmas["temp_store"] == 2  # MEMORY
+        assert pragmas["busy_timeout"] == 2500
+
+    @pytest.mark.asyncio
+    async def test_read_pool_is_query_only(self, temp_db):
+        profile = await temp_db.get_performance_profile()
+
+        assert profile["read_only_pragmas"]["query_only"] == 1
+        assert profile["pool"]["read_pool_size"] == 2
+
+        async with temp_db.get_session(read_only=True) as session:
+            with pytest.raises(Exception):
+                await session.execute(text("DELETE FROM web_settings"))
+
+    @pytest.mark.asyncio
+    async def test_read_session_sees_committed_writes(self, temp_db):
+        assert await temp_db.set_setting("theme", "dark", "string")
+
+        async with temp_db.get_session(read_only=True) as session:
+            result = await session.execute(
+                text("SELECT value FROM web_settings WHERE key = 'theme'")
+            )
+            assert result.scalar() == "dark"
+
+    @pytest.mark.asyncio
+    async def test_read_session_falls_back_without_read_pool(self, temp_db):
+        temp_db.ReadSessionLocal = None
+
+        async with temp_db.get_session(read_only=True) as session:
+            await session.execute(text("UPDATE web_settings SET value = value"))
+            await session.commit()
+
+
+class TestDatabaseConfigParsing:
+    """Test the database section of the configuration file."""
+
+    def test_defaults(self):
+        config = DatabaseConfig()
+        assert config.journal_mode == "WAL"
+        assert config.synchronous == "NORMAL"
+        assert config.temp_store == "MEMORY"
+
+    def test_yaml_overrides(self, tmp_path):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump({
+            "llm": {"provider": "cborg"},
+            "processing": {"output_path": str(tmp_path / "out")},
+            "database": {"synchronous": "FULL", "pool_size": 10},
+        }))
+
+        config = ConfigManager(config_path).get_config()
+
+        assert config.database.synchronous == "FULL"
+        assert config.database.pool_size == 10
+        assert config.database.journal_mode == "WAL"
+
+    def test_invalid_journal_mode_rejected(self, tmp_path):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump({
+            "llm": {"provider": "cborg"},
+            "processing": {"output_path": str(tmp_path / "out")},
+            "database": {"journal_mode": "BOGUS"},
+        }))
+
+        with pytest.raises(ValueError, match="journal_mode"):
+            ConfigManager(config_path)
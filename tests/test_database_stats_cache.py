@@ -0,0 +1,170 @@
+"""
+Tests for Cached Database Statistics
+
+This module tests DatabaseManager.get_database_stats() caching:
+- Committed upserts and removals update the cached counts without a rescan
+- Rolled-back writes leave the cache untouched
+- Removing the first or last entry, invalidation and the reconcile interval force a recount
+"""
+
+import os
+import tempfile
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete
+
+import web.database
+from web.database import DatabaseManager, JournalEntryIndex
+
+
+def make_entry(entry_date, has_content=True):
+    return JournalEntryIndex(
+        date=entry_date,
+        file_path=f"/journal/{entry_date.isoformat()}.txt",
+        week_ending_date=entry_date,
+        has_content=has_content,
+        created_at=datetime.utcnow(),
+        modified_at=datetime.utcnow(),
+    )
+
+
+@pytest_asyncio.fixture
+async def db_manager():
+    """Initialized DatabaseManager backed by a temporary file."""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+        db_path = f.name
+
+    manager = DatabaseManager(db_path)
+    await manager.initialize()
+
+    yield manager
+
+    await manager.engine.dispose()
+    os.unlink(db_path)
+
+
+async def add_entry(manager, entry_date, has_content=True):
+    async with manager.get_session() as session:
+        session.add(make_entry(entry_date, has_content))
+        manager.record_entry_upsert(session, entry_date, None, has_content)
+        await session.commit()
+
+
+async def remove_entry(manager, entry_date, had_content=True):
+    async with manager.get_session() as session:
+        await session.execute(delete(JournalEntryIndex).where(JournalEntryIndex.date == entry_date))
+        manager.record_entry_removal(session, entry_date, had_content)
+        await session.commit()
+
+
+class TestDatabaseStatsCache:
+    """Test incremental maintenance of cached statistics."""
+
+    @pytest.mark.asyncio
+    async def test_committed_upsert_updates_cache_without_rescan(self, db_manager):
+        await add_entry(db_manager, date(2024, 1, 10))
+        await db_manager.get_database_stats()
+
+        with patch.object(db_manager, '_load_entry_stats', wraps=db_manager._load_entry_stats) as load:
+            await add_entry(db_manager, date(2024, 1, 20), has_content=False)
+            stats = await db_manager.get_database_stats()
+
+        load.assert_not_called()
+        assert stats["total_entries"] == 2
+        assert stats["entries_with_content"] == 1
+        assert stats["date_range"] == {"start": "2024-01-10", "end": "2024-01-20"}
+
+    @pytest.mark.asyncio
+    async def test_content_change_adjusts_count(self, db_manager):
+        await add_entry(db_manager, date(2024, 1, 10), has_content=False)
+        await db_manager.get_database_stats()
+
+        async with db_manager.get_session() as session:
+            db_manager.record_entry_upsert(session, date(2024, 1, 10), False, True)
+            await session.commit()
+        stats = await db_manager.get_database_stats()
+
+        assert stats["total_entries"] == 1
+        assert stats["entries_with_content"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards_delta(self, db_manager):
+        await db_manager.get_database_stats()
+
+        async with db_manager.get_session() as session:
+            session.add(make_entry(date(2024, 1, 10)))
+            db_manager.record_entry_upsert(session, date(2024, 1, 10), None, True)
+            await session.rollback()
+        stats = await db_manager.get_database_stats()
+
+        assert stats["total_entries"] == 0
+        assert stats["date_range"] is None
+
+    @pytest.mark.asyncio
+    async def test_removing_interior_entry_keeps_cache(self, db_manager):
+        for day in (1, 15, 31):
+            await add_entry(db_manager, date(2024, 1, day))
+        await db_manager.get_database_stats()
+
+        with patch.object(db_manager, '_load_entry_stats', wraps=db_manager._load_entry_stats) as load:
+            await remove_entry(db_manager, date(2024, 1, 15))
+            stats = await db_manager.get_database_stats()
+
+        load.assert_not_called()
+        assert stats["total_entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_removing_range_endpoint_forces_recount(self, db_manager):
+        for day in (1, 15, 31):
+            await add_entry(db_manager, date(2024, 1, day))
+        await db_manager.get_database_stats()
+
+        await remove_entry(db_manager, date(2024, 1, 31))
+        stats = await db_manager.get_database_stats()
+
+        assert stats["total_entries"] == 2
+        assert stats["date_range"] == {"start": "2024-01-01", "end": "2024-01-15"}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_recount(self, db_manager):
+        await db_manager.get_database_stats()
+
+        # Written without record_entry_upsert(), so only a recount sees it
+        async with db_manager.get_session() as session:
+            session.add(make_entry(date(2024, 1, 10)))
+            await session.commit()
+        assert (await db_manager.get_database_stats())["total_entries"] == 0
+
+        db_manager.invalidate_entry_stats()
+        assert (await db_manager.get_database_stats())["total_entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_reconciled(self, db_manager):
+        await db_manager.get_database_stats()
+
+        async with db_manager.get_session() as session:
+            session.add(make_entry(date(2024, 1, 10)))
+            await session.commit()
+
+        with patch.object(web.database, 'ENTRY_STATS_RECONCILE_SECONDS', 0.0):
+            stats = await db_manager.get_database_stats()
+
+        assert stats["total_entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_recount_overlapping_commit_not_cached(self, db_manager):
+        original_load = db_manager._load_entry_stats
+
+        async def load_then_commit():
+            stats = await original_load()
+            await add_entry(db_manager, date(2024, 1, 10))
+            return stats
+
+        with patch.object(db_manager, '_load_entry_stats', side_effect=load_then_commit):
+            await db_manager.get_database_stats()
+        stats = await db_manager.get_database_stats()
+
+        assert stats["total_entries"] == 1
@@ -0,0 +1,216 @@
+# ABOUTME: Tests for the conditional diff/patch autosave endpoint.
+# ABOUTME: Verifies unchanged saves skip the write, patches apply, and stale bases get 409.
+
+"""
+Tests for PATCH /api/entries/{date}/content.
+
+Verifies that:
+- A save whose content_hash matches the stored content writes nothing
+- Edits against the current base are applied and persisted
+- A stale base version is rejected with 409
+- Edits that do not reproduce content_hash are rejected with 422
+- Patched content longer than full saves allow is rejected with 422
+- Concurrent patches from the same base cannot both be applied
+- A full save cannot land between a patch's base check and its write
+"""
+
+import asyncio
+import hashlib
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from web.app import app
+from web.models.journal import MAX_ENTRY_CONTENT_LENGTH, EntryContentEdit
+from web.services.entry_manager import EntryConflictError
+
+
+def _sha(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+@pytest.fixture
+def saved_entry(isolated_app_client):
+    """Create an entry for today and return (client, date string, content)."""
+    today = date.today().isoformat()
+    content = "Morning standup\nFixed the sync bug\n"
+    response = isolated_app_client.post(
+        f"/api/entries/{today}", json={"date": today, "content": content}
+    )
+    assert response.status_code == 200
+    return isolated_app_client, today, content
+
+
+class TestEntryContentPatch:
+    """Test the conditional save protocol."""
+
+    def test_unchanged_content_skips_write(self, saved_entry):
+        client, today, content = saved_entry
+
+        with patch('web.services.entry_manager.os.replace') as mock_replace:
+            response = client.patch(f"/api/entries/{today}/content", json={
+                "base_hash": _sha(content),
+                "content_hash": _sha(content),
+                "edits": []
+            })
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "unchanged"
+        mock_replace.assert_not_called()
+
+    def test_patch_applies_edit(self, saved_entry):
+        client, today, content = saved_entry
+        new_content = content.replace("Fixed", "Shipped")
+        start = content.index("Fixed")
+
+        response = client.patch(f"/api/entries/{today}/content", json={
+            "base_hash": _sha(content),
+            "content_hash": _sha(new_content),
+            "edits": [{"start": start, "end": start + len("Fixed"), "text": "Shipped"}]
+        })
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "saved"
+        assert body["content_hash"] == _sha(new_content)
+
+        stored = client.get(f"/api/entries/{today}/content").json()["content"]
+        assert stored == new_content
+
+    def test_stale_base_returns_conflict(self, saved_entry):
+        client, today, content = saved_entry
+
+        response = client.patch(f"/api/entries/{today}/content", json={
+            "base_hash": _sha("an older version"),
+            "content_hash": _sha("something new"),
+            "edits": [{"start": 0, "end": 0, "text": "x"}]
+        })
+
+        assert response.status_code == 409
+        assert response.json()["detail"]["current_hash"] == _sha(content)
+
+    def test_hash_mismatch_returns_422(self, saved_entry):
+        client, today, content = saved_entry
+
+        response = client.patch(f"/api/entries/{today}/content", json={
+            "base_hash": _sha(content),
+            "content_hash": _sha("not what the edit produces"),
+            "edits": [{"start": 0, "end": 0, "text": "Prefix "}]
+        })
+
+        assert response.status_code == 422
+        stored = client.get(f"/api/entries/{today}/content").json()["content"]
+        assert stored == content
+
+    def test_out_of_range_edit_returns_422(self, saved_entry):
+        client, today, content = saved_entry
+
+        response = client.patch(f"/api/entries/{today}/content", json={
+            "base_hash": _sha(content),
+            "content_hash": _sha("whatever"),
+            "edits": [{"start": 0, "end": len(content) + 10, "text": ""}]
+        })
+
+        assert response.status_code == 422
+
+    def test_new_entry_without_base(self, isolated_app_client):
+        today = date.today().isoformat()
+        content = "First line of a new entry"
+
+        response = isolated_app_client.patch(f"/api/entries/{today}/content", json={
+            "base_hash": None,
+            "content_hash": _sha(content),
+            "edits": [{"start": 0, "end": 0, "text": content}]
+        })
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "saved"
+        stored = isolated_app_client.get(f"/api/entries/{today}/content").json()["content"]
+        assert stored == content
+
+    def test_non_ascii_offsets_are_code_points(self, saved_entry):
+        client, today, _ = saved_entry
+        base = "Deployed 🚀 release\n"
+        client.post(f"/api/entries/{today}", json={"date": today, "content": base})
+        new_content = "Deployed 🚀 hotfix\n"
+        start = base.index("release")
+
+        response = client.patch(f"/api/entries/{today}/content", json={
+            "base_hash": _sha(base),
+            "content_hash": _sha(new_content),
+            "edits": [{"start": start, "end": start + len("release"), "text": "hotfix"}]
+        })
+
+        assert response.status_code == 200
+        assert client.get(f"/api/entries/{today}/content").json()["content"] == new_content
+
+    def test_oversized_result_returns_422(self, saved_entry):
+        client, today, content = saved_entry
+        chunk = "x" * (MAX_ENTRY_CONTENT_LENGTH // 2 + 1)
+        new_content = chunk + content + chunk
+
+        response = client.patch(f"/api/entries/{today}/content", json={
+            "base_hash": _sha(content),
+            "content_hash": _sha(new_content),
+            "edits": [{"start": 0, "end": 0, "text": chunk},
+                      {"start": len(content), "end": len(content), "text": chunk}]
+        })
+
+        assert response.status_code == 422
+        assert client.get(f"/api/entries/{today}/content").json()["content"] == content
+
+    def test_concurrent_patches_from_same_base(self, saved_entry):
+        client, today, content = saved_entry
+        entry_date = date.fromisoformat(today)
+        entry_manager = app.state.entry_manager
+
+        def edit(text):
+            return {"start": 0, "end": 0, "text": text}
+
+        async def patch_twice():
+            return await asyncio.gather(*(
+                entry_manager.patch_entry_content(
+                    entry_date, _sha(content), _sha(prefix + content),
+                    [EntryContentEdit(**edit(prefix))]
+                )
+                for prefix in ("A ", "B ")
+            ), return_exceptions=True)
+
+        results = client.portal.call(patch_twice)
+
+        assert sum(isinstance(r, EntryConflictError) for r in results) == 1
+        saved = [r for r in results if isinstance(r, dict)]
+        assert len(saved) == 1
+        stored = client.get(f"/api/entries/{today}/content").json()["content"]
+        assert _sha(stored) == saved[0]["content_hash"]
+
+    def test_full_save_waits_for_patch_in_progress(self, saved_entry):
+        client, today, content = saved_entry
+        entry_date = date.fromisoformat(today)
+        entry_manager = app.state.entry_manager
+        read_entry_file = entry_manager._read_entry_file
+        saves = []
+
+        async def read_then_save_from_other_tab(file_path):
+            # The patch has checked its base version; another tab saves now
+            if not saves:
+                saves.append(asyncio.create_task(
+                    entry_manager.save_entry_content(entry_date, "Other tab\n")))
+                await asyncio.sleep(0.05)
+            return await read_entry_file(file_path)
+
+        async def patch_while_saving():
+            result = await entry_manager.patch_entry_content(
+                entry_date, _sha(content), _sha("A " + content),
+                [EntryContentEdit(start=0, end=0, text="A ")]
+            )
+            assert await asyncio.gather(*saves) == [True]
+            return result
+
+        with patch.object(entry_manager, "_read_entry_file", side_effect=read_then_save_from_other_tab):
+            result = client.portal.call(patch_while_saving)
+
+        assert result["status"] == "saved"
+        stored = client.get(f"/api/entries/{today}/content").json()["content"]
+        assert stored == "Other tab\n"
@@ -0,0 +1,191 @@
+# ABOUTME: Tests for the streaming bulk export endpoint and EntryExporter.
+# ABOUTME: Verifies every format, gzip/zip compression, chunked reads and request validation.
+
+"""
+Tests for GET /api/entries/export.
+
+Verifies that:
+- json, csv, txt and markdown exports contain every entry in date order
+- Content is escaped correctly even when files are read in small chunks
+- An unreadable entry file is logged without aborting the export
+- gzip and zip compression produce valid archives
+- Invalid formats and inverted ranges are rejected before streaming starts
+"""
+
+import csv
+import gzip
+import io
+import json
+import zipfile
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from web.models.journal import EntryExportRequest
+
+
+ENTRIES = {
+    0: 'Line one\nHe said "ship it", then left',
+    1: "Café notes 🚀 with a comma, and\nmultiple lines",
+    2: "",
+}
+
+
+@pytest.fixture
+def client_with_entries(isolated_app_client):
+    """Create three consecutive entries ending today; the last one is empty."""
+    today = date.today()
+    dates = {}
+    for offset, content in ENTRIES.items():
+        entry_date = today - timedelta(days=2 - offset)
+        response = isolated_app_client.post(
+            f"/api/entries/{entry_date.isoformat()}",
+            json={"date": entry_date.isoformat(), "content": content}
+        )
+        assert response.status_code == 200
+        dates[offset] = entry_date
+    return isolated_app_client, dates
+
+
+class TestExportFormats:
+    """Test the body of each export format."""
+
+    def test_json_export(self, client_with_entries):
+        client, dates = client_with_entries
+
+        response = client.get("/api/entries/export?format=json")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/json")
+        assert "attachment" in response.headers["content-disposition"]
+        records = response.json()
+        assert [r["date"] for r in records] == [dates[0].isoformat(), dates[1].isoformat()]
+        assert records[0]["content"] == ENTRIES[0]
+        assert records[1]["content"] == ENTRIES[1]
+        assert records[1]["metadata"]["word_count"] == len(ENTRIES[1].split())
+
+    def test_json_export_includes_empty_entries_on_request(self, client_with_entries):
+        client, dates = client_with_entries
+
+        records = client.get(
+            "/api/entries/export?include_empty_entries=true&include_metadata=false"
+        ).json()
+
+        assert len(records) == 3
+        assert records[2] == {"date": dates[2].isoformat(), "content": ""}
+
+    def test_csv_export(self, client_with_entries):
+        client, dates = client_with_entries
+
+        response = client.get("/api/entries/export?format=csv")
+
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows[0] == ["date", "week_ending_date", "word_count",
+                           "character_count", "line_count", "content"]
+        assert rows[1][0] == dates[0].isoformat()
+        assert rows[1][-1] == ENTRIES[0]
+        assert rows[2][-1] == ENTRIES[1]
+
+    def test_txt_and_markdown_exports(self, client_with_entries):
+        client, dates = client_with_entries
+
+        text = client.get("/api/entries/export?format=txt").text
+        markdown = client.get("/api/entries/export?format=markdown").text
+
+        assert f"===== {dates[0].isoformat()} =====" in text
+        assert ENTRIES[1] in text
+        assert f"## {dates[1].strftime('%A, %B %d, %Y')}" in markdown
+        assert ENTRIES[0] in markdown
+
+    def test_date_range_filter(self, client_with_entries):
+        client, dates = client_with_entries
+        day = dates[1].isoformat()
+
+        records = client.get(f"/api/entries/export?start_date={day}&end_date={day}").json()
+
+        assert [r["date"] for r in records] == [day]
+
+
+class TestExportCompression:
+    """Test gzip and zip output."""
+
+    def test_gzip_export(self, client_with_entries):
+        client, _ = client_with_entries
+
+        response = client.get("/api/entries/export?format=json&compression=gzip")
+
+        assert response.headers["content-type"] == "application/gzip"
+        assert response.headers["content-disposition"].endswith('.json.gz"')
+        records = json.loads(gzip.decompress(response.content))
+        assert records[0]["content"] == ENTRIES[0]
+
+    def test_zip_export(self, client_with_entries):
+        client, _ = client_with_entries
+
+        response = client.get("/api/entries/export?format=markdown&compression=zip")
+
+        assert response.headers["content-type"] == "application/zip"
+        archive = zipfile.ZipFile(io.BytesIO(response.content))
+        assert archive.testzip() is None
+        [name] = archive.namelist()
+        assert name.endswith(".md")
+        assert ENTRIES[1] in archive.read(name).decode("utf-8")
+
+
+class TestExportValidation:
+    """Test request validation."""
+
+    def test_invalid_format_rejected(self, isolated_app_client):
+        response = isolated_app_client.get("/api/entries/export?format=xml")
+        assert response.status_code == 400
+
+    def test_inverted_range_rejected(self, isolated_app_client):
+        response = isolated_app_client.get(
+            "/api/entries/export?start_date=2024-02-01&end_date=2024-01-01"
+        )
+        assert response.status_code == 400
+
+    def test_request_model_validator(self):
+        with pytest.raises(ValueError, match="start_date"):
+            EntryExportRequest(start_date=date(2024, 2, 1), end_date=date(2024, 1, 1))
+
+        assert EntryExportRequest(start_date=date(2024, 1, 1)).format == "json"
+
+
+class TestChunkedReads:
+    """Test that escaping survives chunk boundaries."""
+
+    @pytest.mark.asyncio
+    async def test_small_chunks_produce_identical_output(self, client_with_entries):
+        from web.app import app
+        from web.services.entry_export import EntryExporter
+
+        request = EntryExportRequest(format="csv")
+        entry_manager = app.state.entry_manager
+
+        async def collect(chunk_size):
+            exporter = EntryExporter(entry_manager, request, chunk_size=chunk_size)
+            return b"".join([chunk async for chunk in exporter.stream()])
+
+        assert await collect(3) == await collect(64 * 1024)
+
+
+class TestUnreadableEntries:
+    """Test that one bad entry file does not break the export."""
+
+    def test_undecodable_file_exported_as_empty(self, client_with_entries):
+        from web.app import app
+
+        client, dates = client_with_entries
+        entry_manager = app.state.entry_manager
+        file_path = client.portal.call(entry_manager._construct_file_path_async, dates[0])
+        file_path.write_bytes(b"\xff\xfe not utf-8 \xff")
+
+        with patch.object(entry_manager.logger, "log_error_with_category") as log_error:
+            response = client.get("/api/entries/export?format=json")
+
+        assert response.status_code == 200
+        records = response.json()
+        assert [r["content"] for r in records] == ["", ENTRIES[1]]
+        assert log_error.call_args.kwargs["file_path"] == file_path
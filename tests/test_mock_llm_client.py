@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# ABOUTME: Tests for the offline mock LLM provider used in load and performance testing.
+# ABOUTME: Covers deterministic output, latency, failure injection, retries and provider selection.
+"""
+Tests for MockLLMClient — the deterministic offline provider.
+
+Latency is kept at zero (or cancellable_sleep is patched) so the tests
+exercise the simulated request path without waiting on it.
+"""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from config_manager import AppConfig, ConfigManager, MockConfig
+from mock_llm_client import MockLLMClient, MockProviderError
+from unified_llm_client import UnifiedLLMClient
+
+
+def make_client(**overrides):
+    settings = dict(latency_ms=0.0, rate_limit_delay=0.0)
+    settings.update(overrides)
+    return MockLLMClient(MockConfig(**settings))
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+class TestDeterministicOutput:
+    """Entities depend only on the content."""
+
+    def test_same_content_same_entities(self):
+        first = make_client(seed=1).analyze_content("Shipped the release", Path("a.txt"))
+        second = make_client(seed=2).analyze_content("Shipped the release", Path("b.txt"))
+
+        assert first.projects and first.tasks
+        assert (first.projects, first.participants, first.tasks, first.themes) == \
+            (second.projects, second.participants, second.tasks, second.themes)
+
+    def test_different_content_different_entities(self):
+        outputs = {json.dumps(MockLLMClient.entities_for(f"entry {i}"), sort_keys=True)
+                   for i in range(20)}
+
+        assert len(outputs) > 1
+
+    def test_response_is_valid_entity_json(self):
+        client = make_client()
+
+        response = json.loads(client._make_api_call("system", "Met with the team"))
+
+        assert set(response) == {"projects", "participants", "tasks", "themes"}
+        assert client.get_stats().parse_failures == 0
+
+
+# ---------------------------------------------------------------------------
+# Latency and failure injection
+# ---------------------------------------------------------------------------
+
+class TestLatency:
+    """Simulated response times."""
+
+    def test_fixed_latency_without_sigma(self):
+        client = make_client(latency_ms=250.0, latency_sigma=0.0)
+
+        assert client._sample_latency() == 0.25
+
+    def test_lognormal_latency_around_median(self):
+        client = make_client(latency_ms=100.0, latency_sigma=0.5, seed=3)
+
+        samples = sorted(client._sample_latency() for _ in range(2001))
+
+        assert samples[0] != samples[-1]
+        assert samples[1000] == pytest.approx(0.1, rel=0.1)
+
+    def test_seeded_latency_reproducible(self):
+        first = make_client(latency_ms=100.0, seed=5)
+        second = make_client(latency_ms=100.0, seed=5)
+
+        assert [first._sample_latency() for _ in range(5)] == \
+            [second._sample_latency() for _ in range(5)]
+
+
+class TestFailureInjection:
+    """Injected server errors and rate limits."""
+
+    def test_rate_limits_retried_and_counted(self):
+        client = make_client(rate_limit_rate=1.0, max_retries=2)
+
+        result = client.analyze_content("content", Path("entry.txt"))
+
+        stats = client.get_stats()
+        assert result.raw_response == "ERROR (MockProviderError)"
+        assert stats.rate_limit_hits == 3
+        assert stats.failed_calls == 1
+
+    def test_server_errors_not_counted_as_rate_limits(self):
+        client = make_client(error_rate=1.0, max_retries=0)
+
+        with pytest.raises(MockProviderError, match="503"):
+            client._make_api_call("system", "content")
+        assert client.get_stats().rate_limit_hits == 0
+
+    def test_error_rate_approximated(self):
+        client = make_client(error_rate=0.2, max_retries=0, seed=11)
+
+        failures = 0
+        for _ in range(1000):
+            try:
+                client._make_api_call("system", "content")
+            except MockProviderError:
+                failures += 1
+
+        assert 150 <= failures <= 250
+
+    def test_retry_backoff_doubles(self):
+        client = make_client(error_rate=1.0, max_retries=2, rate_limit_delay=0.5)
+
+        with patch('mock_llm_client.cancellable_sleep') as sleep:
+            with pytest.raises(MockProviderError):
+                client._make_api_call("system", "content")
+
+        retry_waits = [call.args[0] for call in sleep.call_args_list if call.args[0] > 0]
+        assert retry_waits == [0.5, 1.0]
+
+
+# ---------------------------------------------------------------------------
+# Provider selection
+# ---------------------------------------------------------------------------
+
+class TestProviderSelection:
+    """Selecting the mock through configuration."""
+
+    def test_unified_client_creates_mock(self):
+        config = AppConfig()
+        config.llm.provider = "mock"
+        config.mock.latency_ms = 0.0
+
+        client = UnifiedLLMClient(config)
+
+        assert isinstance(client.client, MockLLMClient)
+        assert client.get_provider_info()["provider"] == "mock"
+
+    def test_selected_from_config_file(self, tmp_path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "llm:\n  provider: mock\nmock:\n  latency_ms: 5\n  error_rate: 0.1\n"
+            f"processing:\n  output_path: {tmp_path}\n"
+        )
+
+        config = ConfigManager(config_file).get_config()
+
+        assert config.llm.provider == "mock"
+        assert config.mock.latency_ms == 5
+        assert config.mock.error_rate == 0.1
+
+    def test_selected_from_environment(self, tmp_path):
+        env = {"WJS_LLM_PROVIDER": "mock", "WJS_MOCK_LATENCY_MS": "12.5",
+               "WJS_MOCK_RATE_LIMIT_RATE": "0.05", "WJS_OUTPUT_PATH": str(tmp_path)}
+
+        with patch.dict(os.environ, env):
+            config = ConfigManager(tmp_path / "missing.yaml").get_config()
+
+        assert config.llm.provider == "mock"
+        assert config.mock.latency_ms == 12.5
+        assert config.mock.rate_limit_rate == 0.05
+
+    def test_invalid_rate_rejected(self, tmp_path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            f"llm:\n  provider: mock\nmock:\n  error_rate: 1.5\nprocessing:\n  output_path: {tmp_path}\n"
+        )
+
+        with pytest.raises(ValueError, match="error_rate"):
+            ConfigManager(config_file)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# ABOUTME: Tests for throttled web progress reporting and pipeline progress callbacks.
+# ABOUTME: Covers coalescing, phase mapping, ETA calculation and per-file/per-period callbacks.
+"""
+Tests for ProgressReporter and the pipeline's on_progress callbacks.
+
+Verifies that:
+- A phase start is published immediately at the phase's start percentage
+- Bursts of per-item reports are coalesced into one throttled update
+- Item counts map onto the phase's percentage range with throughput and ETA
+- analyze_content and generate_summaries report after every file and period
+"""
+
+import asyncio
+from datetime import date
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+import summarization_pipeline
+from content_processor import ProcessedContent
+from llm_data_structures import AnalysisResult
+from summary_generator import SummaryGenerator
+from web.services.progress_reporter import ProgressReporter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_result(name, raw_response=""):
+    return AnalysisResult(file_path=Path(f"/journal/{name}"), projects=["Alpha"], participants=[],
+                          tasks=[], themes=[], api_call_time=0.1, raw_response=raw_response)
+
+
+class TestProgressReporter:
+    """Test throttling, coalescing and ETA."""
+
+    @pytest.mark.asyncio
+    async def test_phase_start_published_immediately(self):
+        published = []
+
+        async def publish(snapshot):
+            published.append(snapshot)
+
+        reporter = ProgressReporter(asyncio.get_running_loop(), publish)
+        await reporter.start_phase("Analyzing", 50.0, 80.0, unit="files")
+
+        assert published[0].progress == 50.0
+        assert published[0].current_step == "Analyzing"
+
+    @pytest.mark.asyncio
+    async def test_burst_coalesced_into_latest(self):
+        published = []
+
+        async def publish(snapshot):
+            published.append(snapshot)
+
+        reporter = ProgressReporter(asyncio.get_running_loop(), publish, min_interval=0.05)
+        await reporter.start_phase("Analyzing", 50.0, 80.0, unit="files")
+        for done in range(1, 11):
+            reporter.report(done, 10)
+
+        await asyncio.sleep(0.2)
+
+        assert len(published) == 2
+        assert published[1].progress == 80.0
+        assert published[1].current_step == "Analyzing (10/10 files)"
+
+    @pytest.mark.asyncio
+    async def test_eta_from_measured_throughput(self):
+        published = []
+
+        async def publish(snapshot):
+            published.append(snapshot)
+
+        clock = FakeClock()
+        reporter = ProgressReporter(asyncio.get_running_loop(), publish, clock=clock)
+        await reporter.start_phase("Analyzing", 0.0, 100.0, unit="files")
+
+        clock.now += 10.0
+        reporter.report(5, 20)
+        await reporter.flush()
+
+        snapshot = published[-1]
+        assert snapshot.progress == 25.0
+        assert snapshot.items_per_second == 0.5
+        assert snapshot.eta_seconds == 30.0
+
+    @pytest.mark.asyncio
+    async def test_reports_from_worker_thread(self):
+        published = []
+
+        async def publish(snapshot):
+            published.append(snapshot)
+
+        loop = asyncio.get_running_loop()
+        reporter = ProgressReporter(loop, publish, min_interval=0.0)
+        await reporter.start_phase("Analyzing", 0.0, 100.0)
+
+        await loop.run_in_executor(None, reporter.report, 1, 2)
+        await asyncio.sleep(0.05)
+
+        assert published[-1].progress == 50.0
+
+
+class TestPipelineProgressCallbacks:
+    """Test per-file and per-period progress from the pipeline."""
+
+    def test_analyze_content_reports_each_file(self):
+        files = [
+            ProcessedContent(file_path=Path(f"/journal/{i}.txt"), date=date(2024, 1, 1),
+                             content="text", word_count=1, line_count=1, encoding="utf-8",
+                             processing_time=0.0, errors=[])
+            for i in range(3)
+        ]
+        llm_client = Mock()
+        llm_client.analyze_content.side_effect = lambda content, path: make_result(path.name)
+        on_progress = Mock()
+
+        summarization_pipeline.analyze_content(files, Mock(), llm_client=llm_client,
+                                               on_progress=on_progress)
+
+        assert [c.args for c in on_progress.call_args_list] == [(1, 3), (2, 3), (3, 3)]
+
+    def test_generate_summaries_reports_each_period(self):
+        llm_client = Mock()
+        llm_client.analyze_content.return_value = make_result("summary", "Summary text.")
+        results = [make_result(f"2024-01-{day:02d}.txt") for day in (1, 15)]
+        on_progress = Mock()
+
+        SummaryGenerator(llm_client).generate_summaries(
+            results, "weekly", date(2024, 1, 1), date(2024, 1, 31), on_progress=on_progress)
+
+        assert [c.args for c in on_progress.call_args_list] == [(1, 2), (2, 2)]
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# ABOUTME: Tests for provider prompt caching in the Bedrock and Google GenAI clients.
+# ABOUTME: Covers request formatting, cached content reuse and cache-hit statistics.
+"""
+Tests for prompt-prefix caching.
+
+Verifies that:
+- Bedrock marks the system block with cache_control only when enabled
+- Google GenAI uploads each system prompt once and references it afterwards
+- Prompts the service refuses to cache are sent inline without retrying
+- Transient cache failures back off and retry; creation happens outside the lock
+- Cached input tokens reported by providers are counted in APIStats
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bedrock_client import BedrockClient
+from config_manager import BedrockConfig, GoogleGenAIConfig
+from google_genai_client import GoogleGenAIClient
+
+
+@pytest.fixture
+def bedrock_factory():
+    def make(prompt_caching):
+        config = BedrockConfig(region="us-west-2", model_id="test-model",
+                               max_retries=0, prompt_caching=prompt_caching)
+        with patch.dict("os.environ", {"AWS_ACCESS_KEY_ID": "k", "AWS_SECRET_ACCESS_KEY": "s"}):
+            return BedrockClient(config)
+    return make
+
+
+@pytest.fixture
+def genai_client():
+    config = GoogleGenAIConfig(project="test-project", model="gemini-test",
+                               prompt_caching=True, prompt_cache_ttl_seconds=600)
+    with patch("google_genai_client.genai") as mock_genai:
+        inner = MagicMock()
+        mock_genai.Client.return_value = inner
+
+        response = MagicMock()
+        response.text = json.dumps({"projects": [], "participants": [], "tasks": [], "themes": []})
+        response.candidates = []
+        response.usage_metadata.cached_content_token_count = 1500
+        inner.models.generate_content.return_value = response
+        inner.caches.create.return_value.name = "cachedContents/abc"
+
+        yield GoogleGenAIClient(config), inner
+
+
+class TestBedrockPromptCaching:
+    """Test cache_control on the Bedrock system prompt."""
+
+    def test_plain_system_string_when_disabled(self, bedrock_factory):
+        request = bedrock_factory(False)._format_bedrock_request(system="Rules.", user="Entry")
+        assert request["system"] == "Rules."
+
+    def test_cache_control_block_when_enabled(self, bedrock_factory):
+        request = bedrock_factory(True)._format_bedrock_request(system="Rules.", user="Entry")
+        assert request["system"] == [
+            {"type": "text", "text": "Rules.", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert request["messages"] == [{"role": "user", "content": "Entry"}]
+
+    def test_cache_reads_counted_in_stats(self, bedrock_factory):
+        client = bedrock_factory(True)
+        response = {"content": [{"text": '{"projects": []}'}],
+                    "usage": {"input_tokens": 40, "cache_read_input_tokens": 1200}}
+
+        with patch.object(client, "_make_api_call_with_retry", return_value=response):
+            client._make_api_call("Rules.", "Entry one")
+            client._make_api_call("Rules.", "Entry two")
+
+        stats = client.get_stats()
+        assert stats.cache_hits == 2
+        assert stats.cached_input_tokens == 2400
+
+    def test_cache_miss_not_counted(self, bedrock_factory):
+        client = bedrock_factory(True)
+        response = {"content": [{"text": "{}"}],
+                    "usage": {"input_tokens": 1240, "cache_read_input_tokens": 0}}
+
+        with patch.object(client, "_make_api_call_with_retry", return_value=response):
+            client._make_api_call("Rules.", "Entry")
+
+        assert client.get_stats().cache_hits == 0
+
+
+class TestGoogleGenAIPromptCaching:
+    """Test cached content for the Gemini system instruction."""
+
+    def test_system_prompt_uploaded_once(self, genai_client):
+        client, inner = genai_client
+
+        client._make_api_call(system="Rules.", user="Entry one")
+        client._make_api_call(system="Rules.", user="Entry two")
+
+        inner.caches.create.assert_called_once()
+        assert inner.caches.create.call_args.kwargs["config"] == {
+            "system_instruction": "Rules.", "ttl": "600s"
+        }
+        config = inner.models.generate_content.call_args.kwargs["config"]
+        assert config["cached_content"] == "cachedContents/abc"
+        assert "system_instruction" not in config
+
+    def test_expiring_cache_is_recreated(self, genai_client):
+        client, inner = genai_client
+        client._make_api_call(system="Rules.", user="Entry")
+
+        name, _ = client._prompt_caches["Rules."]
+        client._prompt_caches["Rules."] = (name, 0.0)
+        client._make_api_call(system="Rules.", user="Entry")
+
+        assert inner.caches.create.call_count == 2
+
+    def test_refused_prompt_sent_inline_without_retry(self, genai_client):
+        client, inner = genai_client
+        inner.caches.create.side_effect = RuntimeError("content is too small to cache")
+
+        client._make_api_call(system="Rules.", user="Entry one")
+        client._make_api_call(system="Rules.", user="Entry two")
+
+        inner.caches.create.assert_called_once()
+        config = inner.models.generate_content.call_args.kwargs["config"]
+        assert config["system_instruction"] == "Rules."
+        assert "cached_content" not in config
+
+    def test_transient_failure_retried_after_backoff(self, genai_client):
+        client, inner = genai_client
+        inner.caches.create.side_effect = [RuntimeError("503 Service Unavailable"),
+                                           inner.caches.create.return_value]
+
+        assert client._cached_system_prompt("Rules.") is None
+        assert client._cached_system_prompt("Rules.") is None  # still backing off
+        assert inner.caches.create.call_count == 1
+        assert "Rules." not in client._uncacheable_prompts
+
+        retry_at, failures = client._prompt_cache_retry["Rules."]
+        assert failures == 1 and retry_at > 0
+        client._prompt_cache_retry["Rules."] = (0.0, failures)
+
+        assert client._cached_system_prompt("Rules.") == "cachedContents/abc"
+        assert inner.caches.create.call_count == 2
+
+    def test_client_error_code_is_permanent(self, genai_client):
+        client, inner = genai_client
+        error = RuntimeError("model does not accept cached content")
+        error.code = 400
+        inner.caches.create.side_effect = error
+
+        client._cached_system_prompt("Rules.")
+
+        assert "Rules." in client._uncacheable_prompts
+
+    def test_cache_created_outside_lock(self, genai_client):
+        client, inner = genai_client
+        concurrent = []
+
+        def create(**kwargs):
+            assert not client._prompt_cache_lock.locked()
+            # Another request meanwhile neither waits nor creates a second cache
+            concurrent.append(client._cached_system_prompt("Rules."))
+            return inner.caches.create.return_value
+
+        inner.caches.create.side_effect = create
+
+        assert client._cached_system_prompt("Rules.") == "cachedContents/abc"
+        assert concurrent == [None]
+        inner.caches.create.assert_called_once()
+
+    def test_cached_tokens_counted_in_stats(self, genai_client):
+        client, _ = genai_client
+        client._make_api_call(system="Rules.", user="Entry")
+
+        stats = client.get_stats()
+        assert stats.cache_hits == 1
+        assert stats.cached_input_tokens == 1500
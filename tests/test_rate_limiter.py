@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# ABOUTME: Tests for the shared provider rate limiter used by all LLM clients.
+# ABOUTME: Covers token buckets, AIMD concurrency, the per-model registry and client hooks.
+"""
+Tests for rate_limiter.ProviderRateLimiter.
+
+Verifies that:
+- Request and token buckets block once a minute's allowance is spent
+- The concurrency limit halves on rate limits and grows after successes
+- In-flight requests never exceed the current concurrency limit
+- A cancelled task stops waiting for the limiter promptly
+- Limiters are shared per provider and model
+- BaseLLMClient reports rate limits and successes to its limiter
+"""
+
+import threading
+import time
+
+import pytest
+
+from base_llm_client import BaseLLMClient
+from cancellation import CancellationToken, TaskCancelledError, cancellation_scope
+from rate_limiter import ProviderRateLimiter, get_rate_limiter, DECREASE_COOLDOWN_SECONDS
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class LimitedStubClient(BaseLLMClient):
+    """Stub client whose API call goes through the limiter like real providers."""
+
+    def __init__(self, limiter, responses):
+        super().__init__()
+        self.rate_limiter = limiter
+        self._responses = list(responses)
+
+    def _make_api_call(self, system: str, user: str) -> str:
+        with self._request_slot(system, user):
+            response = self._responses.pop(0)
+        if response == "429":
+            self._record_rate_limit()
+            raise RuntimeError("429 Too Many Requests")
+        self._record_request_success()
+        return response
+
+    def test_connection(self) -> bool:
+        return True
+
+    def get_provider_info(self):
+        return {"provider": "stub"}
+
+
+class TestTokenBuckets:
+    """Test requests/minute and tokens/minute enforcement."""
+
+    def test_requests_per_minute_allows_burst_then_waits(self):
+        clock = FakeClock()
+        limiter = ProviderRateLimiter("test", requests_per_minute=3, clock=clock)
+
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release()
+
+        assert limiter._requests.wait_time(1, clock.now) == pytest.approx(20.0)
+        clock.now += 20.0
+        assert limiter._requests.wait_time(1, clock.now) == 0.0
+
+    def test_tokens_per_minute_blocks_until_refilled(self):
+        limiter = ProviderRateLimiter("test", tokens_per_minute=6000)
+        limiter.acquire(6000)
+        limiter.release()
+
+        start = time.monotonic()
+        limiter.acquire(20)  # 0.2s at 100 tokens/second
+        limiter.release()
+
+        assert time.monotonic() - start >= 0.15
+
+    def test_oversized_request_does_not_deadlock(self):
+        limiter = ProviderRateLimiter("test", tokens_per_minute=100)
+        with limiter.request(10_000):
+            pass
+
+
+class TestAdaptiveConcurrency:
+    """Test AIMD behaviour of the concurrency limit."""
+
+    def test_rate_limit_halves_once_per_burst(self):
+        clock = FakeClock()
+        limiter = ProviderRateLimiter("test", max_concurrency=8, clock=clock)
+
+        limiter.record_rate_limit()
+        limiter.record_rate_limit()  # same burst
+        assert limiter.concurrency_limit == 4
+
+        clock.now += DECREASE_COOLDOWN_SECONDS
+        limiter.record_rate_limit()
+        assert limiter.concurrency_limit == 2
+
+    def test_limit_never_drops_below_one(self):
+        clock = FakeClock()
+        limiter = ProviderRateLimiter("test", max_concurrency=1, clock=clock)
+        limiter.record_rate_limit()
+        assert limiter.concurrency_limit == 1
+
+    def test_successes_grow_limit_to_ceiling(self):
+        clock = FakeClock()
+        limiter = ProviderRateLimiter("test", max_concurrency=4, clock=clock)
+        limiter.record_rate_limit()
+        assert limiter.concurrency_limit == 2
+
+        for _ in range(2):
+            limiter.record_success()
+        assert limiter.concurrency_limit == 3
+
+        for _ in range(10):
+            limiter.record_success()
+        assert limiter.concurrency_limit == 4
+
+    def test_in_flight_bounded_by_limit(self):
+        limiter = ProviderRateLimiter("test", max_concurrency=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def worker():
+            with limiter.request():
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.02)
+                with lock:
+                    active.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2
+        assert limiter.snapshot()["in_flight"] == 0
+
+    @pytest.mark.parametrize("limits", [{"requests_per_minute": 1}, {"max_concurrency": 1}])
+    def test_cancelled_waiter_stops_promptly(self, limits):
+        limiter = ProviderRateLimiter("test", **limits)
+        limiter.acquire()
+        token = CancellationToken()
+        outcome = []
+
+        def waiter():
+            with cancellation_scope(token):
+                try:
+                    limiter.acquire()
+                    outcome.append("acquired")
+                except TaskCancelledError:
+                    outcome.append("cancelled")
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.05)
+        token.cancel()
+        thread.join(timeout=2)
+
+        assert outcome == ["cancelled"]
+        assert limiter.snapshot()["in_flight"] == 1
+
+
+class TestRegistryAndClientHooks:
+    """Test limiter sharing and BaseLLMClient integration."""
+
+    def test_registry_shares_limiter_per_model(self):
+        first = get_rate_limiter("stub", "model-a", requests_per_minute=10)
+        again = get_rate_limiter("stub", "model-a", requests_per_minute=20)
+        other = get_rate_limiter("stub", "model-b")
+
+        assert first is again
+        assert first.requests_per_minute == 20
+        assert other is not first
+
+    def test_client_reports_rate_limits_and_successes(self):
+        clock = FakeClock()
+        limiter = ProviderRateLimiter("test", max_concurrency=4, clock=clock)
+        client = LimitedStubClient(limiter, ["429", '{"projects": ["Alpha"]}'])
+
+        client.analyze_content("first", "a.txt")
+        assert client.get_stats().rate_limit_hits == 1
+        assert limiter.concurrency_limit == 2
+
+        result = client.analyze_content("second", "b.txt")
+        assert result.projects == ["Alpha"]
+        assert limiter.snapshot()["in_flight"] == 0
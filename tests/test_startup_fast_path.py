@@ -0,0 +1,90 @@
+"""
+Tests for the Web Startup Fast Path
+
+This module tests that server startup avoids work it can defer:
+- WebSummarizationService builds its LLM client on first use, not in __init__
+- The bcrypt dummy hash is computed off the event loop after startup and reused
+- Startup records a per-stage timing breakdown
+"""
+
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import bcrypt
+
+from config_manager import AppConfig
+from logger import JournalSummarizerLogger
+from web.app import web_app
+from web.database import DatabaseManager
+from web.providers.local import LocalAuthProvider, _dummy_hash
+from web.services.web_summarizer import WebSummarizationService
+
+
+def make_service():
+    return WebSummarizationService(Mock(spec=AppConfig), Mock(spec=JournalSummarizerLogger),
+                                   Mock(spec=DatabaseManager))
+
+
+class TestLazyLLMClient:
+    """Test deferred LLM client construction."""
+
+    def test_client_not_built_at_construction(self):
+        with patch('web.services.web_summarizer.get_llm_client') as get_llm_client:
+            make_service()
+
+        get_llm_client.assert_not_called()
+
+    def test_client_built_once_on_first_use(self):
+        with patch('web.services.web_summarizer.get_llm_client') as get_llm_client:
+            service = make_service()
+            first = service.llm_client
+            second = service.llm_client
+
+        assert first is second
+        get_llm_client.assert_called_once()
+        assert get_llm_client.call_args.kwargs == {"hedge_requests": True}
+
+    def test_assigned_client_used(self):
+        with patch('web.services.web_summarizer.get_llm_client') as get_llm_client:
+            service = make_service()
+            client = Mock()
+            service.llm_client = client
+
+            assert service.llm_client is client
+        get_llm_client.assert_not_called()
+
+
+class TestDummyHash:
+    """Test the dummy password hash computed after startup."""
+
+    def test_valid_and_cached(self):
+        assert _dummy_hash() is _dummy_hash()
+        assert bcrypt.checkpw(b"dummy", _dummy_hash())
+
+    def test_warm_up_hashes_off_event_loop(self):
+        hashing_threads = []
+        real_hashpw = bcrypt.hashpw
+
+        def hashpw(*args):
+            hashing_threads.append(threading.get_ident())
+            return real_hashpw(*args)
+
+        _dummy_hash.cache_clear()
+        with patch('web.providers.local.bcrypt.hashpw', side_effect=hashpw):
+            asyncio.run(LocalAuthProvider(Mock(spec=DatabaseManager), Mock()).warm_up())
+            _dummy_hash()
+
+        assert len(hashing_threads) == 1
+        assert hashing_threads[0] != threading.get_ident()
+
+
+class TestStartupTimings:
+    """Test the per-stage startup breakdown."""
+
+    def test_stages_recorded(self, isolated_app_client):
+        assert list(web_app.startup_timings) == [
+            "imports", "config", "logging", "database", "services", "summarization", "scheduler"
+        ]
+        assert all(ms >= 0 for ms in web_app.startup_timings.values())
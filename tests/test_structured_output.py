@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# ABOUTME: Tests for provider-native structured output and the one-shot repair retry.
+# ABOUTME: Covers response validation, parse-failure stats and each provider's request format.
+"""
+Tests for structured entity output.
+
+Verifies that:
+- Plain JSON responses are parsed without the regex extraction fallback
+- An invalid response gets exactly one repair retry, counted in parse_failures
+- Bedrock forces a tool call with ENTITY_SCHEMA and reads the tool input
+- Google GenAI requests a JSON response constrained to ENTITY_SCHEMA
+- CBORG sends response_format and drops it for models that reject it
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from base_llm_client import BaseLLMClient, ENTITY_SCHEMA
+from bedrock_client import BedrockClient, ENTITY_TOOL_NAME
+from config_manager import BedrockConfig, CBORGConfig, GoogleGenAIConfig
+from google_genai_client import GoogleGenAIClient
+
+VALID = json.dumps({"projects": ["Alpha"], "participants": ["Bob"], "tasks": [], "themes": []})
+
+
+class ScriptedClient(BaseLLMClient):
+    """Returns queued responses and records the prompts it was sent."""
+
+    def __init__(self, responses):
+        super().__init__()
+        self._responses = list(responses)
+        self.systems = []
+
+    def _make_api_call(self, system: str, user: str) -> str:
+        self.systems.append(system)
+        return self._responses.pop(0)
+
+    def test_connection(self) -> bool:
+        return True
+
+    def get_provider_info(self):
+        return {"provider": "scripted"}
+
+
+class TestRepairRetry:
+    """Test validation and the one-shot repair retry in BaseLLMClient."""
+
+    def test_valid_json_parsed_without_extraction(self):
+        client = ScriptedClient([VALID])
+        with patch.object(client, "_extract_json_from_text") as extract:
+            result = client.analyze_content("entry", Path("/a.txt"))
+
+        extract.assert_not_called()
+        assert result.projects == ["Alpha"]
+        assert len(client.systems) == 1
+        assert client.get_stats().parse_failures == 0
+
+    def test_invalid_response_repaired_once(self):
+        client = ScriptedClient(["Sure! Here are the entities you asked for.", VALID])
+        result = client.analyze_content("entry", Path("/a.txt"))
+
+        assert result.projects == ["Alpha"]
+        assert len(client.systems) == 2
+        assert client.systems[1].endswith(BaseLLMClient.REPAIR_INSTRUCTION)
+        stats = client.get_stats()
+        assert stats.parse_failures == 1
+        assert stats.total_calls == 1
+        assert stats.successful_calls == 1
+
+    def test_wrong_field_types_trigger_repair(self):
+        client = ScriptedClient([json.dumps({"projects": "Alpha"}), VALID])
+        assert client.analyze_content("entry", Path("/a.txt")).projects == ["Alpha"]
+        assert len(client.systems) == 2
+
+    def test_missing_fields_are_not_repaired(self):
+        client = ScriptedClient([json.dumps({"projects": ["Alpha"]})])
+        result = client.analyze_content("entry", Path("/a.txt"))
+
+        assert result.projects == ["Alpha"]
+        assert result.themes == []
+        assert len(client.systems) == 1
+
+    def test_unrepairable_response_returns_empty_entities(self):
+        client = ScriptedClient(["not json", "still not json"])
+        result = client.analyze_content("entry", Path("/a.txt"))
+
+        assert result.projects == []
+        assert not result.is_error
+        assert len(client.systems) == 2
+        assert client.get_stats().parse_failures == 2
+
+
+class TestBedrockToolUse:
+    """Test Bedrock structured output via a forced tool call."""
+
+    @pytest.fixture
+    def client(self):
+        config = BedrockConfig(region="us-west-2", model_id="test-model", max_retries=0)
+        with patch.dict("os.environ", {"AWS_ACCESS_KEY_ID": "k", "AWS_SECRET_ACCESS_KEY": "s"}):
+            return BedrockClient(config)
+
+    def test_structured_request_forces_entity_tool(self, client):
+        request = client._format_bedrock_request(system="Rules.", user="Entry", structured=True)
+
+        assert request["tools"][0]["name"] == ENTITY_TOOL_NAME
+        assert request["tools"][0]["input_schema"] == ENTITY_SCHEMA
+        assert request["tool_choice"] == {"type": "tool", "name": ENTITY_TOOL_NAME}
+
+    def test_plain_request_has_no_tools(self, client):
+        request = client._format_bedrock_request(system="Rules.", user="Entry")
+        assert "tools" not in request
+
+    def test_tool_input_returned_as_json(self, client):
+        entities = {"projects": ["Alpha"], "participants": [], "tasks": [], "themes": []}
+        response = {"content": [{"type": "tool_use", "name": ENTITY_TOOL_NAME, "input": entities}]}
+
+        with patch.object(client, "_make_api_call_with_retry", return_value=response) as call:
+            text = client._make_api_call("Rules.", "Entry")
+
+        assert json.loads(text) == entities
+        assert "tools" in call.call_args[0][0]
+
+
+class TestGoogleGenAIResponseSchema:
+    """Test Gemini JSON mode with the entity schema."""
+
+    @pytest.fixture
+    def genai(self):
+        with patch("google_genai_client.genai") as mock_genai:
+            inner = MagicMock()
+            mock_genai.Client.return_value = inner
+            response = MagicMock()
+            response.text = VALID
+            response.candidates = []
+            inner.models.generate_content.return_value = response
+            yield GoogleGenAIClient(GoogleGenAIConfig(project="p", model="m")), inner
+
+    def test_analysis_requests_response_schema(self, genai):
+        client, inner = genai
+        client._make_api_call(system="Rules.", user="Entry")
+
+        config = inner.models.generate_content.call_args.kwargs["config"]
+        assert config["response_mime_type"] == "application/json"
+        assert config["response_schema"] == ENTITY_SCHEMA
+
+    def test_disabled_structured_output_omits_schema(self, genai):
+        client, inner = genai
+        client.configure_structured_output(False)
+        client._make_api_call(system="Rules.", user="Entry")
+
+        config = inner.models.generate_content.call_args.kwargs["config"]
+        assert "response_schema" not in config
+
+
+class TestCBORGResponseFormat:
+    """Test OpenAI-compatible response_format handling."""
+
+    @pytest.fixture
+    def cborg(self):
+        from cborg_client import CBORGClient
+
+        with patch.dict("os.environ", {"CBORG_API_KEY": "k"}), patch("cborg_client.openai") as mock_openai:
+            inner = MagicMock()
+            mock_openai.OpenAI.return_value = inner
+            completion = MagicMock()
+            completion.choices = [MagicMock()]
+            completion.choices[0].message.content = VALID
+            inner.chat.completions.create.return_value = completion
+            yield CBORGClient(CBORGConfig(max_retries=0)), inner
+
+    def test_response_format_sent(self, cborg):
+        client, inner = cborg
+        client._make_api_call(system="Rules.", user="Entry")
+
+        response_format = inner.chat.completions.create.call_args.kwargs["response_format"]
+        assert response_format["json_schema"]["schema"] == ENTITY_SCHEMA
+
+    def test_rejected_response_format_dropped(self, cborg):
+        client, inner = cborg
+        completion = inner.chat.completions.create.return_value
+        inner.chat.completions.create.side_effect = [
+            Exception("400 Bad Request: response_format json_schema is not supported"),
+            completion,
+            completion,
+        ]
+
+        assert client._make_api_call(system="Rules.", user="Entry") == VALID
+        client._make_api_call(system="Rules.", user="Entry")
+
+        calls = inner.chat.completions.create.call_args_list
+        assert "response_format" in calls[0].kwargs
+        assert "response_format" not in calls[1].kwargs
+        assert "response_format" not in calls[2].kwargs
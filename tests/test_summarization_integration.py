@@ -98,7 +98,7 @@ async def test_db_manager():
 @pytest.fixture
 def summarization_service(test_config, test_logger, test_db_manager):
     """Create WebSummarizationService with pipeline mocked to avoid real LLM calls."""
-    with patch('web.services.web_summarizer.UnifiedLLMClient'):
+    with patch('web.services.web_summarizer.get_llm_client'):
         service = WebSummarizationService(test_config, test_logger, test_db_manager)
         return service
 
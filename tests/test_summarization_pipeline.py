@@ -12,12 +12,15 @@ from datetime import date
 from pathlib import Path
 from unittest.mock import Mock, patch, call
 
+from config_manager import AppConfig, MockConfig
 from content_processor import ProcessedContent, ProcessingStats
 from llm_data_structures import AnalysisResult, APIStats
 from summary_generator import PeriodSummary, SummaryStats
 from file_discovery import FileDiscoveryResult
+from unified_llm_client import UnifiedLLMClient
 
 import summarization_pipeline
+import unified_llm_client
 
 
 class TestDiscoverFiles:
@@ -86,7 +89,7 @@ class TestProcessContent:
 class TestAnalyzeContent:
     """Tests for summarization_pipeline.analyze_content."""
 
-    @patch('summarization_pipeline.UnifiedLLMClient')
+    @patch('summarization_pipeline.get_llm_client')
     def test_iterates_processed_content(self, mock_llm_class):
         """Verify analyze_content calls analyze_content for each ProcessedContent item."""
         mock_llm_instance = Mock()
@@ -114,9 +117,9 @@ class TestAnalyzeContent:
         mock_llm_instance.analyze_content.assert_any_call("Day 1 work", Path("/tmp/worklog_2024-01-15.txt"))
         mock_llm_instance.analyze_content.assert_any_call("Day 2 work", Path("/tmp/worklog_2024-01-16.txt"))
 
-    @patch('summarization_pipeline.UnifiedLLMClient')
+    @patch('summarization_pipeline.get_llm_client')
     def test_returns_client_for_reuse(self, mock_llm_class):
-        """Verify the UnifiedLLMClient instance is returned for reuse by generate_summaries."""
+        """Verify the shared UnifiedLLMClient instance is returned for reuse by generate_summaries."""
         mock_llm_instance = Mock()
         mock_llm_instance.get_stats.return_value = Mock(spec=APIStats)
         mock_llm_class.return_value = mock_llm_instance
@@ -126,20 +129,28 @@ class TestAnalyzeContent:
 
         assert client is mock_llm_instance
 
-    @patch('summarization_pipeline.UnifiedLLMClient')
-    def test_passes_on_fallback_callback(self, mock_llm_class):
-        """Verify on_fallback is passed to UnifiedLLMClient."""
+    @patch('summarization_pipeline.get_llm_client')
+    def test_routes_on_fallback_to_this_call(self, mock_llm_class):
+        """Verify on_fallback receives notices raised during the call without keying the client."""
+        hooks = []
         mock_llm_instance = Mock()
+        mock_llm_instance.analyze_content.side_effect = \
+            lambda *args: hooks.append(unified_llm_client._fallback_hook.get())
         mock_llm_instance.get_stats.return_value = Mock(spec=APIStats)
         mock_llm_class.return_value = mock_llm_instance
 
+        content = Mock(spec=ProcessedContent)
+        content.content = "Day 1 work"
+        content.file_path = Path("/tmp/worklog_2024-01-15.txt")
         callback = Mock()
         mock_config = Mock()
-        summarization_pipeline.analyze_content([], mock_config, on_fallback=callback)
+        summarization_pipeline.analyze_content([content], mock_config, on_fallback=callback)
 
-        mock_llm_class.assert_called_once_with(mock_config, on_fallback=callback)
+        mock_llm_class.assert_called_once_with(mock_config)
+        assert hooks == [callback]
+        assert unified_llm_client._fallback_hook.get() is None
 
-    @patch('summarization_pipeline.UnifiedLLMClient')
+    @patch('summarization_pipeline.get_llm_client')
     def test_empty_list_returns_empty_results(self, mock_llm_class):
         """Verify empty processed_content returns empty results and zeroed stats."""
         mock_llm_instance = Mock()
@@ -155,6 +166,27 @@ class TestAnalyzeContent:
         assert client is mock_llm_instance
         mock_llm_instance.analyze_content.assert_not_called()
 
+    def test_open_circuit_reports_per_file_errors(self):
+        """Verify a run continues with error results once every circuit is open."""
+        config = AppConfig()
+        config.llm.provider = "mock"
+        config.mock = MockConfig(latency_ms=0.0, error_rate=1.0, max_retries=0)
+        config.llm.circuit_failure_threshold = 2
+        config.llm.circuit_reset_seconds = 3600
+        files = [
+            Mock(spec=ProcessedContent, content=f"Day {day} work",
+                 file_path=Path(f"/tmp/worklog_2024-01-{day:02d}.txt"))
+            for day in range(15, 21)
+        ]
+
+        results, _, _ = summarization_pipeline.analyze_content(
+            files, config, llm_client=UnifiedLLMClient(config, on_fallback=Mock())
+        )
+
+        assert [r.file_path for r in results] == [f.file_path for f in files]
+        assert all(r.is_error for r in results)
+        assert results[-1].raw_response == "ERROR (ProviderUnavailableError)"
+
 
 class TestGenerateSummaries:
     """Tests for summarization_pipeline.generate_summaries."""
@@ -177,7 +209,8 @@ class TestGenerateSummaries:
 
         mock_sg_class.assert_called_once_with(mock_llm_client)
         mock_sg_instance.generate_summaries.assert_called_once_with(
-            mock_results, "weekly", date(2024, 1, 1), date(2024, 1, 7)
+            mock_results, "weekly", date(2024, 1, 1), date(2024, 1, 7), cancel_token=None,
+            on_progress=None
         )
         assert result == (mock_summaries, mock_stats)
 
@@ -193,5 +226,6 @@ class TestGenerateSummaries:
         )
 
         mock_sg_instance.generate_summaries.assert_called_once_with(
-            [], "monthly", date(2024, 1, 1), date(2024, 1, 31)
+            [], "monthly", date(2024, 1, 1), date(2024, 1, 31), cancel_token=None,
+            on_progress=None
         )
@@ -0,0 +1,173 @@
+"""
+Tests for Sync History Retention
+
+This module tests how sync_status stays small and fast to query:
+- Indexes behind history and last-sync lookups, including on existing databases
+- Compaction of expired rows into daily aggregates
+- The cached last-full-sync pointer
+"""
+
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, text
+
+from web.database import DatabaseManager, SyncHistoryDaily, SyncStatus
+from web.services.sync_service import DatabaseSyncService
+
+
+@pytest_asyncio.fixture
+async def db_manager():
+    """Initialized DatabaseManager backed by a temporary file."""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+        db_path = f.name
+
+    manager = DatabaseManager(db_path)
+    await manager.initialize()
+
+    yield manager
+
+    await manager.engine.dispose()
+    os.unlink(db_path)
+
+
+@pytest.fixture
+def sync_service(db_manager, tmp_path):
+    config = Mock()
+    config.processing.base_path = str(tmp_path)
+    return DatabaseSyncService(config, Mock(), db_manager)
+
+
+def sync_row(sync_type, days_ago, status="completed", processed=10, duration_seconds=60):
+    started_at = datetime.utcnow() - timedelta(days=days_ago)
+    return SyncStatus(
+        sync_type=sync_type,
+        started_at=started_at,
+        completed_at=started_at + timedelta(seconds=duration_seconds),
+        status=status,
+        entries_processed=processed,
+        entries_added=1,
+        entries_updated=2,
+        entries_removed=0,
+    )
+
+
+async def add_rows(manager, *rows):
+    async with manager.get_session() as session:
+        session.add_all(rows)
+        await session.commit()
+
+
+class TestSyncStatusIndexes:
+    """Test the indexes that keep history and last-sync lookups off table scans."""
+
+    @pytest.mark.asyncio
+    async def test_last_sync_lookup_uses_index(self, db_manager):
+        async with db_manager.engine.connect() as conn:
+            plan = (await conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT max(completed_at) FROM sync_status "
+                "WHERE sync_type = 'full' AND status = 'completed'"
+            ))).fetchall()
+
+        assert "idx_sync_status_type_status_completed" in " ".join(str(row) for row in plan)
+
+    @pytest.mark.asyncio
+    async def test_indexes_added_to_existing_database(self, db_manager):
+        async with db_manager.engine.begin() as conn:
+            await conn.execute(text("DROP INDEX idx_sync_status_started"))
+            await conn.execute(text("DROP INDEX idx_sync_status_type_status_completed"))
+
+        await db_manager._apply_schema_migrations()
+
+        async with db_manager.engine.connect() as conn:
+            indexes = {row[1] for row in (await conn.execute(text("PRAGMA index_list(sync_status)"))).fetchall()}
+        assert {"idx_sync_status_started", "idx_sync_status_type_status_completed"} <= indexes
+
+
+class TestCompactSyncHistory:
+    """Test rolling expired rows into daily aggregates."""
+
+    @pytest.mark.asyncio
+    async def test_expired_rows_rolled_into_daily_aggregates(self, db_manager, sync_service):
+        await add_rows(
+            db_manager,
+            sync_row("incremental", 40, processed=5),
+            sync_row("incremental", 40, processed=7, duration_seconds=120),
+            sync_row("incremental", 40, status="failed", processed=0),
+            sync_row("incremental", 35),
+            sync_row("incremental", 1),
+        )
+
+        result = await sync_service.compact_sync_history(retention_days=30)
+
+        assert result == {"rows_compacted": 4, "days_written": 3}
+        history = await sync_service.get_daily_sync_history(days=60, sync_type="incremental")
+        completed = [h for h in history if h["status"] == "completed" and h["runs"] == 2][0]
+        assert completed["entries_processed"] == 12
+        assert completed["average_duration_seconds"] == pytest.approx(90.0, abs=0.01)
+
+        async with db_manager.get_session() as session:
+            remaining = (await session.scalars(select(SyncStatus))).all()
+        assert len(remaining) == 1
+
+    @pytest.mark.asyncio
+    async def test_latest_completed_row_per_type_kept(self, db_manager, sync_service):
+        await add_rows(db_manager, sync_row("full", 60), sync_row("full", 45))
+
+        await sync_service.compact_sync_history(retention_days=30)
+
+        async with db_manager.get_session() as session:
+            remaining = (await session.scalars(select(SyncStatus))).all()
+        assert len(remaining) == 1
+        assert remaining[0].started_at.date() == (datetime.utcnow() - timedelta(days=45)).date()
+
+    @pytest.mark.asyncio
+    async def test_repeat_compaction_merges_into_existing_day(self, db_manager, sync_service):
+        await add_rows(db_manager, sync_row("incremental", 40), sync_row("incremental", 1))
+        await sync_service.compact_sync_history(retention_days=30)
+        await add_rows(db_manager, sync_row("incremental", 40))
+
+        await sync_service.compact_sync_history(retention_days=30)
+
+        async with db_manager.get_session() as session:
+            rollups = (await session.scalars(select(SyncHistoryDaily))).all()
+        assert len(rollups) == 1
+        assert rollups[0].runs == 2
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_compact(self, db_manager, sync_service):
+        await add_rows(db_manager, sync_row("incremental", 1))
+
+        result = await sync_service.compact_sync_history()
+
+        assert result == {"rows_compacted": 0, "days_written": 0}
+
+
+class TestLastFullSyncPointer:
+    """Test the cached last-full-sync pointer."""
+
+    @pytest.mark.asyncio
+    async def test_loaded_once_then_served_from_cache(self, db_manager):
+        await add_rows(db_manager, sync_row("full", 3), sync_row("full", 2, status="failed"))
+        expected = (await db_manager.get_last_full_sync())
+
+        await add_rows(db_manager, sync_row("full", 1))
+
+        assert await db_manager.get_last_full_sync() == expected
+        assert expected.date() == (datetime.utcnow() - timedelta(days=3)).date()
+
+    @pytest.mark.asyncio
+    async def test_completed_full_sync_advances_pointer(self, db_manager):
+        completed_at = datetime.utcnow()
+        await db_manager.get_last_full_sync()
+
+        db_manager.record_full_sync_completed(completed_at)
+        db_manager.record_full_sync_completed(completed_at - timedelta(hours=1))
+
+        assert await db_manager.get_last_full_sync() == completed_at
+        stats = await db_manager.get_database_stats()
+        assert stats["last_sync"] == completed_at.isoformat()
@@ -15,7 +15,8 @@ from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
 from config_manager import AppConfig, BedrockConfig, GoogleGenAIConfig, CBORGConfig, LLMConfig
-from unified_llm_client import UnifiedLLMClient
+import unified_llm_client
+from unified_llm_client import UnifiedLLMClient, fallback_notifications, get_llm_client
 from llm_data_structures import AnalysisResult, APIStats
 
 
@@ -107,7 +108,7 @@ class TestUnifiedLLMClient:
             UnifiedLLMClient(invalid_config)
         
         assert "Unsupported LLM provider: 'invalid_provider'" in str(exc_info.value)
-        assert "Supported providers: ['bedrock', 'google_genai', 'cborg']" in str(exc_info.value)
+        assert "Supported providers: ['bedrock', 'google_genai', 'cborg', 'mock']" in str(exc_info.value)
     
     @patch('unified_llm_client.BedrockClient')
     def test_init_with_client_creation_failure(self, mock_bedrock_client, bedrock_config):
@@ -653,5 +654,83 @@ class TestUnifiedLLMClientFallback:
             assert callback.call_count == 2
 
 
+
+class TestSharedClientRegistry:
+    """Test suite for get_llm_client() client reuse."""
+
+    @pytest.fixture(autouse=True)
+    def empty_registry(self):
+        unified_llm_client._shared_clients.clear()
+        yield
+        unified_llm_client._shared_clients.clear()
+
+    @pytest.fixture
+    def config(self):
+        return AppConfig(
+            llm=LLMConfig(provider="bedrock"),
+            bedrock=BedrockConfig(region="us-east-1", model_id="test-model"),
+        )
+
+    @patch('unified_llm_client.BedrockClient')
+    def test_same_config_shares_client(self, mock_bedrock_client, config):
+        """Identical settings reuse one client and one provider SDK client."""
+        first = get_llm_client(config)
+        second = get_llm_client(AppConfig(
+            llm=LLMConfig(provider="bedrock"),
+            bedrock=BedrockConfig(region="us-east-1", model_id="test-model"),
+        ))
+
+        assert first is second
+        mock_bedrock_client.assert_called_once()
+
+    @patch('unified_llm_client.BedrockClient')
+    def test_changed_config_gets_new_client(self, mock_bedrock_client, config):
+        """A different model or hedging setting builds a separate client."""
+        first = get_llm_client(config)
+        other_model = AppConfig(
+            llm=LLMConfig(provider="bedrock"),
+            bedrock=BedrockConfig(region="us-east-1", model_id="other-model"),
+        )
+
+        assert get_llm_client(other_model) is not first
+        assert get_llm_client(config, hedge_requests=True) is not first
+
+    @patch('unified_llm_client.BedrockClient')
+    @patch('unified_llm_client.GoogleGenAIClient')
+    def test_fallback_callbacks_stay_per_task(self, mock_google_client, mock_bedrock_client):
+        """Tasks with different callbacks share one client but only hear their own fallbacks."""
+        config = AppConfig(
+            llm=LLMConfig(provider="google_genai", fallback_providers=["bedrock"]),
+            bedrock=BedrockConfig(region="us-east-1", model_id="test-model"),
+            google_genai=GoogleGenAIConfig(project="test-project", model="test-model"),
+        )
+        mock_google_client.return_value.analyze_content.side_effect = Exception("Google API down")
+        first_callback, second_callback = Mock(), Mock()
+
+        with fallback_notifications(first_callback):
+            first = get_llm_client(config)
+            first.analyze_content("first", Path("first.md"))
+        with fallback_notifications(second_callback):
+            second = get_llm_client(config)
+            second.analyze_content("second", Path("second.md"))
+
+        assert first is second
+        assert len(unified_llm_client._shared_clients) == 1
+        first_callback.assert_called_once()
+        second_callback.assert_called_once()
+
+    @patch('unified_llm_client.BedrockClient')
+    def test_get_stats_reports_task_scope(self, mock_bedrock_client, config):
+        """Inside track_task_stats() the shared client reports that task only."""
+        from base_llm_client import track_task_stats
+
+        mock_bedrock_client.return_value.get_stats.return_value = APIStats(9, 9, 0, 9.0, 1.0, 0)
+        client = get_llm_client(config)
+
+        with track_task_stats() as task_stats:
+            assert client.get_stats() is task_stats
+        assert client.get_stats().total_calls == 9
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -58,7 +58,7 @@ def mock_db_manager():
 @pytest.fixture
 def summarization_service(mock_config, mock_logger, mock_db_manager):
     """Create WebSummarizationService instance for testing."""
-    with patch('web.services.web_summarizer.UnifiedLLMClient'):
+    with patch('web.services.web_summarizer.get_llm_client'):
         service = WebSummarizationService(mock_config, mock_logger, mock_db_manager)
         return service
 
@@ -167,6 +167,7 @@ class TestWebSummarizationService:
         task = await summarization_service.get_task_status(task_id)
         assert task.status == SummaryTaskStatus.CANCELLED
         assert task.completed_at is not None
+        assert summarization_service._cancel_tokens[task_id].cancelled
     
     @pytest.mark.asyncio
     async def test_cancel_task_not_running(self, summarization_service):
@@ -364,5 +365,26 @@ class TestWebSummarizationService:
         assert progress.current_step == "Generating summary"
 
 
+    @pytest.mark.asyncio
+    async def test_broadcast_outside_task_lock(self, summarization_service):
+        """WebSocket broadcasts must not run while the task lock is held."""
+        task_id = await summarization_service.create_summary_task(
+            SummaryType.WEEKLY, date(2024, 1, 1), date(2024, 1, 7)
+        )
+        lock_held = []
+
+        async def record(*args):
+            lock_held.append(summarization_service._task_lock.locked())
+
+        connection_manager = Mock()
+        connection_manager.send_progress_update = AsyncMock(side_effect=record)
+        connection_manager.send_task_status = AsyncMock(side_effect=record)
+        summarization_service.set_connection_manager(connection_manager)
+
+        await summarization_service._update_progress(task_id, 50.0, "Analyzing")
+        await summarization_service._update_task_status(task_id, SummaryTaskStatus.RUNNING)
+
+        assert lock_held == [False, False]
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -91,6 +91,7 @@ class TestWebSocketSummarization:
         }
         
         await connection_manager.send_progress_update(task_id, progress_data)
+        await connection_manager.drain()
         
         # Verify WebSocket was called
         mock_websocket.send_text.assert_called_once()
@@ -125,6 +126,7 @@ class TestWebSocketSummarization:
         }
         
         await connection_manager.send_task_status(task_id, status_data)
+        await connection_manager.drain()
         
         # Verify WebSocket was called
         mock_websocket.send_text.assert_called_once()
@@ -170,5 +172,97 @@ class TestWebSocketSummarization:
         assert mock_websocket not in connection_manager.active_connections.get("general", set())
 
 
+
+class BlockingWebSocket:
+    """WebSocket stand-in whose sends wait until released."""
+
+    def __init__(self):
+        self.sent = []
+        self.release = asyncio.Event()
+        self.close = AsyncMock()
+
+    async def send_text(self, text):
+        await self.release.wait()
+        self.sent.append(text)
+
+
+class TestConnectionManagerBroadcast:
+    """Test serialize-once fan-out, coalescing and slow-consumer handling."""
+
+    @pytest.mark.asyncio
+    async def test_message_serialized_once_for_all_subscribers(self):
+        from web.api.summarization import ConnectionManager
+
+        manager = ConnectionManager()
+        task_socket, general_socket = AsyncMock(), AsyncMock()
+        manager.task_subscribers["task-1"] = {task_socket}
+        manager.active_connections["general"] = {general_socket}
+
+        await manager.send_task_status("task-1", {"status": "running"})
+        await manager.drain()
+
+        assert task_socket.send_text.call_args[0][0] is general_socket.send_text.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_delay_others(self):
+        from web.api.summarization import ConnectionManager
+
+        manager = ConnectionManager()
+        slow, fast = BlockingWebSocket(), AsyncMock()
+        manager.task_subscribers["task-1"] = {slow, fast}
+
+        await asyncio.wait_for(manager.send_task_status("task-1", {"status": "running"}), 0.5)
+        await asyncio.sleep(0.01)
+
+        fast.send_text.assert_called_once()
+        assert slow.sent == []
+
+    @pytest.mark.asyncio
+    async def test_pending_progress_coalesced_to_latest(self):
+        from web.api.summarization import ConnectionManager
+
+        manager = ConnectionManager()
+        websocket = BlockingWebSocket()
+        manager.task_subscribers["task-1"] = {websocket}
+
+        for progress in (10.0, 20.0, 30.0, 40.0):
+            await manager.send_progress_update("task-1", {"progress": progress})
+            await asyncio.sleep(0)
+        websocket.release.set()
+        await manager.drain()
+
+        assert [json.loads(text)["data"]["progress"] for text in websocket.sent] == [10.0, 40.0]
+
+    @pytest.mark.asyncio
+    async def test_full_outbox_closes_slow_consumer(self):
+        from web.api.summarization import ConnectionManager
+
+        manager = ConnectionManager(max_pending=2)
+        websocket = BlockingWebSocket()
+        manager.task_subscribers["task-1"] = {websocket}
+
+        for _ in range(4):
+            await manager.send_task_status("task-1", {"status": "running"})
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+
+        assert "task-1" not in manager.task_subscribers
+        websocket.close.assert_awaited_once()
+        assert websocket.close.call_args.kwargs["code"] == 1013
+
+    @pytest.mark.asyncio
+    async def test_failed_send_unsubscribes(self):
+        from web.api.summarization import ConnectionManager
+
+        manager = ConnectionManager()
+        websocket = AsyncMock()
+        websocket.send_text.side_effect = RuntimeError("closed")
+        manager.active_connections["general"] = {websocket}
+
+        await manager.send_task_status("task-1", {"status": "running"})
+        await manager.drain()
+
+        assert websocket not in manager.active_connections["general"]
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -369,7 +369,7 @@ class TestRunLLMAnalysis:
         mock_stats.average_response_time = 0.5
         mock_stats.rate_limit_hits = 0
 
-        with patch("summarization_pipeline.UnifiedLLMClient") as mock_llm_cls:
+        with patch("summarization_pipeline.get_llm_client") as mock_llm_cls:
             mock_llm = MagicMock()
             mock_llm.analyze_content.return_value = mock_result
             mock_llm.get_stats.return_value = mock_stats
@@ -409,7 +409,7 @@ class TestRunLLMAnalysis:
         mock_stats.average_response_time = 0.5
         mock_stats.rate_limit_hits = 0
 
-        with patch("summarization_pipeline.UnifiedLLMClient") as mock_llm_cls:
+        with patch("summarization_pipeline.get_llm_client") as mock_llm_cls:
             mock_llm = MagicMock()
             mock_llm.analyze_content.return_value = mock_result
             mock_llm.get_stats.return_value = mock_stats
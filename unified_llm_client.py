@@ -1,24 +1,83 @@
 # ABOUTME: Multi-provider LLM interface with ordered fallback chain.
-# ABOUTME: Delegates to Google GenAI, AWS Bedrock, or CBORG with lazy initialization and user-visible notifications.
+# ABOUTME: Delegates to Google GenAI, AWS Bedrock, CBORG or the offline mock with lazy initialization and notifications.
 """
 Unified LLM Client - Multi-Provider LLM Interface with Fallback
 
 This module implements a unified interface that can switch between different LLM
-providers (AWS Bedrock, Google GenAI, CBORG) based on configuration. When the
+providers (AWS Bedrock, Google GenAI, CBORG, or the offline mock used for load
+testing) based on configuration. When the
 active provider fails, it falls back to the next provider in a configurable chain,
 notifying the user on every transition.
+
+Each provider has a circuit breaker: after repeated failures it is skipped
+until a half-open probe succeeds, and every call starts again from the top
+of the chain so the primary is used as soon as it recovers. Optionally,
+requests are hedged: when a provider has not answered within its p95
+latency, the next provider is asked in parallel and the first good answer wins.
+
+get_llm_client() returns a process-wide client per provider configuration,
+so the web service and the pipeline reuse SDK clients, their connection
+pools and auth tokens across tasks instead of rebuilding them each time.
 """
 
-from typing import Union, Dict, Any, Optional, Callable, List
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Union, Dict, Any, Hashable, Iterator, Optional, Callable, List, Tuple
 from pathlib import Path
+import importlib
 import logging
+import sys
+import threading
+import time
 
+from base_llm_client import current_task_stats
+from cancellation import TaskCancelledError, check_cancelled
+from circuit_breaker import CircuitBreaker, LatencyTracker, ProviderUnavailableError
 from config_manager import AppConfig
-from bedrock_client import BedrockClient
-from google_genai_client import GoogleGenAIClient
-from cborg_client import CBORGClient
 from llm_data_structures import AnalysisResult, APIStats
 
+if TYPE_CHECKING:
+    from bedrock_client import BedrockClient
+    from google_genai_client import GoogleGenAIClient
+    from cborg_client import CBORGClient
+    from mock_llm_client import MockLLMClient
+
+# Provider -> (module, client class). Provider modules import their SDK
+# (boto3, google.genai, openai) at the top, so they are only imported when a
+# client for that provider is actually created.
+_PROVIDER_CLASSES = {
+    "bedrock": ("bedrock_client", "BedrockClient"),
+    "google_genai": ("google_genai_client", "GoogleGenAIClient"),
+    "cborg": ("cborg_client", "CBORGClient"),
+    "mock": ("mock_llm_client", "MockLLMClient"),
+}
+
+ProviderClient = Union["BedrockClient", "GoogleGenAIClient", "CBORGClient", "MockLLMClient"]
+
+
+def __getattr__(name: str):
+    """Import provider client classes (e.g. unified_llm_client.BedrockClient) on first access."""
+    for module_name, class_name in _PROVIDER_CLASSES.values():
+        if name == class_name:
+            provider_class = getattr(importlib.import_module(module_name), class_name)
+            globals()[name] = provider_class
+            return provider_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _provider_class(provider_name: str) -> type:
+    """Look up a provider's client class through the module, so patching it takes effect."""
+    return getattr(sys.modules[__name__], _PROVIDER_CLASSES[provider_name][1])
+
+
+# Never hedge sooner than this, however fast a provider usually answers
+HEDGE_MIN_DELAY_SECONDS = 1.0
+
+# Outcome of one provider attempt: (result, exception); exactly one is set
+_Attempt = Tuple[Optional[AnalysisResult], Optional[Exception]]
+
 
 class UnifiedLLMClient:
     """
@@ -27,12 +86,14 @@ class UnifiedLLMClient:
     Manages a chain of LLM providers (e.g. Google GenAI → Bedrock → CBORG).
     The primary provider is created at init time; fallback providers are created
     lazily only when needed. On every provider transition, a user-visible
-    notification is emitted via the on_fallback callback.
+    notification is emitted via the enclosing fallback_notifications()
+    callback, or the on_fallback callback outside one.
     """
 
-    SUPPORTED_PROVIDERS = ["bedrock", "google_genai", "cborg"]
+    SUPPORTED_PROVIDERS = ["bedrock", "google_genai", "cborg", "mock"]
 
-    def __init__(self, config: AppConfig, on_fallback: Optional[Callable[[str], None]] = None):
+    def __init__(self, config: AppConfig, on_fallback: Optional[Callable[[str], None]] = None,
+                 hedge_requests: Optional[bool] = None):
         """
         Initialize the unified LLM client with provider fallback support.
 
@@ -40,6 +101,9 @@ class UnifiedLLMClient:
             config: Complete application configuration
             on_fallback: Callback invoked with a message string when switching
                         providers. Defaults to logging.warning.
+            hedge_requests: Send a parallel request to the next provider when
+                        one is slower than its p95 latency. Defaults to
+                        config.llm.hedge_requests.
 
         Raises:
             ValueError: If an unsupported provider is specified
@@ -56,7 +120,25 @@ class UnifiedLLMClient:
         )
 
         # Cache for lazily initialized provider clients
-        self._clients: Dict[str, Union[BedrockClient, GoogleGenAIClient, CBORGClient]] = {}
+        self._clients: Dict[str, ProviderClient] = {}
+        self._clients_lock = threading.Lock()
+
+        # Provider health: consecutive-failure breakers and latency windows
+        self._breakers: Dict[str, CircuitBreaker] = {
+            name: CircuitBreaker(
+                name,
+                failure_threshold=config.llm.circuit_failure_threshold,
+                reset_timeout=config.llm.circuit_reset_seconds,
+            )
+            for name in self._provider_chain
+        }
+        self._latency: Dict[str, LatencyTracker] = {
+            name: LatencyTracker() for name in self._provider_chain
+        }
+        self.hedge_requests = (
+            config.llm.hedge_requests if hedge_requests is None else hedge_requests
+        )
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
 
         # Create the primary client eagerly
         self.client = self._create_client_for_provider(config.llm.provider)
@@ -65,14 +147,12 @@ class UnifiedLLMClient:
 
         self.logger.info(f"UnifiedLLMClient initialized with provider: {self.provider_name}")
 
-    def _create_client_for_provider(
-        self, provider_name: str
-    ) -> Union[BedrockClient, GoogleGenAIClient, CBORGClient]:
+    def _create_client_for_provider(self, provider_name: str) -> ProviderClient:
         """
         Create an LLM client for the given provider name.
 
         Args:
-            provider_name: One of "bedrock", "google_genai", or "cborg"
+            provider_name: One of "bedrock", "google_genai", "cborg" or "mock"
 
         Returns:
             The initialized client instance
@@ -84,25 +164,31 @@ class UnifiedLLMClient:
         try:
             if provider_name == "bedrock":
                 self.logger.debug("Creating BedrockClient")
-                return BedrockClient(self.config.bedrock)
+                client = _provider_class("bedrock")(self.config.bedrock)
             elif provider_name == "google_genai":
                 self.logger.debug("Creating GoogleGenAIClient")
-                return GoogleGenAIClient(self.config.google_genai)
+                client = _provider_class("google_genai")(self.config.google_genai)
             elif provider_name == "cborg":
                 self.logger.debug("Creating CBORGClient")
-                return CBORGClient(self.config.cborg)
+                client = _provider_class("cborg")(self.config.cborg)
+            elif provider_name == "mock":
+                self.logger.debug("Creating MockLLMClient")
+                client = _provider_class("mock")(self.config.mock)
             else:
                 raise ValueError(
                     f"Unsupported LLM provider: '{provider_name}'. "
                     f"Supported providers: {self.SUPPORTED_PROVIDERS}"
                 )
+            client.configure_chunking(
+                self.config.llm.analysis_chunk_tokens, self.config.llm.analysis_concurrency
+            )
+            client.configure_structured_output(self.config.llm.structured_output)
+            return client
         except Exception as e:
             self.logger.error(f"Failed to create {provider_name} client: {e}")
             raise
 
-    def _get_or_create_client(
-        self, provider_name: str
-    ) -> Union[BedrockClient, GoogleGenAIClient, CBORGClient]:
+    def _get_or_create_client(self, provider_name: str) -> ProviderClient:
         """
         Get a cached client or create a new one for the given provider.
 
@@ -112,72 +198,224 @@ class UnifiedLLMClient:
         Returns:
             The client instance
         """
-        if provider_name not in self._clients:
-            self._clients[provider_name] = self._create_client_for_provider(provider_name)
-        return self._clients[provider_name]
+        with self._clients_lock:
+            if provider_name not in self._clients:
+                self._clients[provider_name] = self._create_client_for_provider(provider_name)
+            return self._clients[provider_name]
 
     def analyze_content(self, content: str, file_path: Path) -> AnalysisResult:
         """
         Analyze journal content, falling back to alternate providers on failure.
 
-        Tries the active provider first. On failure, walks the remaining fallback
-        chain, notifying the user at each transition. If all providers fail, the
-        last exception is raised.
+        Walks the provider chain from the top, skipping providers whose circuit
+        is open, and notifies the user at each transition. A provider fails if
+        it raises or returns an error result. With hedging enabled, a provider
+        slower than its p95 latency is raced against the next one.
 
         Args:
             content: The journal content to analyze
             file_path: Path to the source file being analyzed
 
         Returns:
-            AnalysisResult: Structured analysis results
+            AnalysisResult: Structured analysis results (the last error result
+            if every provider answered with one)
 
         Raises:
-            Exception: If all providers in the chain fail
+            ProviderUnavailableError: If every provider's circuit is open
+            TaskCancelledError: If the current task is cancelled
+            Exception: The last exception if all attempted providers fail
         """
-        last_exception: Optional[Exception] = None
+        last_failure: Optional[_Attempt] = None
         failed_provider: Optional[str] = None
-        active_index = self._provider_chain.index(self.active_provider_name)
-
-        for i in range(active_index, len(self._provider_chain)):
-            provider_name = self._provider_chain[i]
+        chain = self._provider_chain
+        index = 0
+
+        while index < len(chain):
+            check_cancelled()
+            provider_name = chain[index]
+            index += 1
+            if not self._breakers[provider_name].allow_request():
+                self.logger.debug(f"Skipping provider '{provider_name}': circuit open")
+                continue
 
-            # Notify on transition from a previously failed provider
             if failed_provider is not None:
-                self.on_fallback(
-                    f"Provider '{failed_provider}' failed: {last_exception}. "
+                self._notify_fallback(
+                    f"Provider '{failed_provider}' failed: {self._describe(last_failure)}. "
                     f"Falling back to '{provider_name}'."
                 )
 
-            try:
-                client = self._get_or_create_client(provider_name)
-            except Exception as init_err:
-                self.logger.warning(
-                    f"Failed to initialize fallback provider '{provider_name}': {init_err}"
-                )
-                failed_provider = provider_name
-                last_exception = init_err
+            client = self._client_or_failure(provider_name)
+            if isinstance(client, Exception):
+                failed_provider, last_failure = provider_name, (None, client)
                 continue
 
-            try:
-                self.logger.debug(f"Analyzing content using {provider_name} provider")
-                result = client.analyze_content(content, file_path)
-                self.active_provider_name = provider_name
-                self.client = client
-                return result
-            except Exception as e:
-                failed_provider = provider_name
-                last_exception = e
-                self.logger.warning(f"Provider '{provider_name}' failed: {e}")
+            deadline = self._hedge_deadline(provider_name)
+            if deadline is None:
+                outcomes = [(provider_name, client,
+                             self._attempt(provider_name, client, content, file_path))]
+            else:
+                outcomes, index = self._hedged_attempts(
+                    provider_name, client, deadline, index, content, file_path
+                )
+
+            for name, attempt_client, attempt in outcomes:
+                if self._succeeded(attempt):
+                    self.active_provider_name = name
+                    self.client = attempt_client
+                    return attempt[0]
+                failed_provider, last_failure = name, attempt
+                self.logger.warning(f"Provider '{name}' failed: {self._describe(attempt)}")
+
+        if last_failure is None:
+            raise ProviderUnavailableError(
+                f"All LLM providers are unavailable (circuits open): {', '.join(chain)}"
+            )
+        result, error = last_failure
+        if error is not None:
+            raise error
+        return result
+
+    def _client_or_failure(self, provider_name: str):
+        """Return the provider's client, or the exception if it cannot be created."""
+        try:
+            return self._get_or_create_client(provider_name)
+        except Exception as init_err:
+            self.logger.warning(
+                f"Failed to initialize fallback provider '{provider_name}': {init_err}"
+            )
+            self._breakers[provider_name].record_failure()
+            return init_err
+
+    def _attempt(self, provider_name: str, client, content: str, file_path: Path) -> _Attempt:
+        """
+        Call one provider, record its health, and return the outcome.
 
-        raise last_exception
+        Only cancellation is raised; it says nothing about the provider's health.
+        """
+        self.logger.debug(f"Analyzing content using {provider_name} provider")
+        start = time.monotonic()
+        try:
+            result = client.analyze_content(content, file_path)
+        except TaskCancelledError:
+            self._breakers[provider_name].record_abandoned()
+            raise
+        except Exception as e:
+            self._breakers[provider_name].record_failure()
+            return None, e
+
+        if self._succeeded((result, None)):
+            self._breakers[provider_name].record_success()
+            self._latency[provider_name].record(time.monotonic() - start)
+        else:
+            self._breakers[provider_name].record_failure()
+        return result, None
+
+    def _hedged_attempts(self, provider_name: str, client, deadline: float, index: int,
+                         content: str, file_path: Path):
+        """
+        Run provider_name, adding the next available provider if it misses deadline.
+
+        Returns:
+            Tuple of (outcomes in completion order, next chain index). Outcomes
+            stop at the first success; a slower loser keeps running in the
+            background and only updates health statistics.
+        """
+        pool = self._get_hedge_pool()
+        futures: Dict[Future, Tuple[str, Any]] = {
+            pool.submit(copy_context().run, self._attempt, provider_name, client, content, file_path):
+                (provider_name, client)
+        }
+        done, _ = wait(futures, timeout=deadline)
+
+        if not done:
+            while index < len(self._provider_chain):
+                hedge_name = self._provider_chain[index]
+                index += 1
+                if not self._breakers[hedge_name].allow_request():
+                    continue
+                hedge_client = self._client_or_failure(hedge_name)
+                if isinstance(hedge_client, Exception):
+                    continue
+                self._notify_fallback(
+                    f"Provider '{provider_name}' has not answered within {deadline:.1f}s. "
+                    f"Also trying '{hedge_name}'."
+                )
+                futures[pool.submit(copy_context().run, self._attempt, hedge_name, hedge_client,
+                                    content, file_path)] = (hedge_name, hedge_client)
+                break
+
+        outcomes = []
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, attempt_client = futures[future]
+                attempt = future.result()
+                outcomes.append((name, attempt_client, attempt))
+                if self._succeeded(attempt):
+                    return outcomes, index
+        return outcomes, index
+
+    def _hedge_deadline(self, provider_name: str) -> Optional[float]:
+        """p95 latency of the provider, if hedging applies to this call."""
+        if not self.hedge_requests or provider_name == self._provider_chain[-1]:
+            return None
+        p95 = self._latency[provider_name].percentile(0.95)
+        if p95 is None:
+            return None
+        return max(p95, HEDGE_MIN_DELAY_SECONDS)
+
+    def _get_hedge_pool(self) -> ThreadPoolExecutor:
+        if self._hedge_pool is None:
+            self._hedge_pool = ThreadPoolExecutor(
+                max_workers=2 * len(self._provider_chain), thread_name_prefix="llm-hedge"
+            )
+        return self._hedge_pool
+
+    @staticmethod
+    def _succeeded(attempt: _Attempt) -> bool:
+        result, error = attempt
+        return error is None and not (isinstance(result, AnalysisResult) and result.is_error)
+
+    def _notify_fallback(self, message: str) -> None:
+        """Send a provider transition notice to the current task's callback."""
+        (_fallback_hook.get() or self.on_fallback)(message)
+
+    @staticmethod
+    def _describe(attempt: Optional[_Attempt]) -> str:
+        if attempt is None:
+            return "unknown error"
+        result, error = attempt
+        return str(error) if error is not None else str(result.raw_response)
+
+    def get_provider_health(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Circuit state and p95 latency of every provider in the chain.
+
+        Returns:
+            Dict mapping provider name to {"circuit": state, "p95_latency": seconds or None}
+        """
+        return {
+            name: {
+                "circuit": self._breakers[name].state,
+                "p95_latency": self._latency[name].percentile(0.95),
+            }
+            for name in self._provider_chain
+        }
 
     def get_stats(self) -> APIStats:
         """
-        Get API usage statistics from the active client.
+        Get API usage statistics.
+
+        Inside a track_task_stats() block these are the current task's
+        statistics across all providers; otherwise the active client's totals.
 
         Returns:
             APIStats: Statistics including call counts, timing, and error rates
         """
+        task_stats = current_task_stats()
+        if task_stats is not None:
+            return task_stats
         return self.client.get_stats()
 
     def reset_stats(self) -> None:
@@ -201,7 +439,7 @@ class UnifiedLLMClient:
             provider_name = self._provider_chain[i]
 
             if i > active_index:
-                self.on_fallback(
+                self._notify_fallback(
                     f"Provider '{self._provider_chain[i - 1]}' connection failed. "
                     f"Falling back to '{provider_name}'."
                 )
@@ -248,3 +486,57 @@ class UnifiedLLMClient:
         info["active_provider"] = self.active_provider_name
         info["fallback_providers"] = list(self.config.llm.fallback_providers)
         return info
+
+
+_fallback_hook: ContextVar[Optional[Callable[[str], None]]] = ContextVar(
+    "llm_fallback_hook", default=None
+)
+
+
+@contextmanager
+def fallback_notifications(on_fallback: Optional[Callable[[str], None]]) -> Iterator[None]:
+    """
+    Send fallback notifications raised inside the block to on_fallback.
+
+    Lets tasks sharing one client each receive their own notifications;
+    with on_fallback None the client's own callback is used.
+    """
+    token = _fallback_hook.set(on_fallback)
+    try:
+        yield
+    finally:
+        _fallback_hook.reset(token)
+
+
+_shared_clients: Dict[Hashable, UnifiedLLMClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_llm_client(config: AppConfig, hedge_requests: Optional[bool] = None) -> UnifiedLLMClient:
+    """
+    Return the process-wide UnifiedLLMClient for this provider configuration.
+
+    Clients are keyed by the LLM and provider config sections plus
+    hedge_requests, so callers with identical settings share one client (and
+    its provider health) while a changed config gets a fresh one. Use
+    track_task_stats() to get statistics and fallback_notifications() to get
+    fallback notices for a single task.
+
+    Args:
+        config: Complete application configuration
+        hedge_requests: Hedging override, as for UnifiedLLMClient
+
+    Returns:
+        UnifiedLLMClient: Shared, thread-safe client
+    """
+    key = (
+        repr([asdict(section) for section in
+              (config.llm, config.bedrock, config.google_genai, config.cborg, config.mock)]),
+        hedge_requests,
+    )
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = UnifiedLLMClient(config, hedge_requests=hedge_requests)
+            _shared_clients[key] = client
+        return client
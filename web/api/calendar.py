@@ -7,7 +7,7 @@ This module provides REST API endpoints for calendar functionality,
 including calendar data, navigation, and date-based queries.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import JSONResponse
 from datetime import date, datetime, timedelta
 from typing import Optional, List
@@ -16,6 +16,7 @@ from logger import JournalSummarizerLogger, ErrorCategory
 from web.auth import get_current_user, User
 from web.services.calendar_service import CalendarService
 from web.models.journal import CalendarMonth, CalendarEntry, TodayResponse
+from web.utils.etag_utils import make_etag, etag_matches, not_modified, apply_etag
 
 router = APIRouter(prefix="/api/calendar", tags=["calendar"])
 
@@ -27,13 +28,24 @@ def get_calendar_service(request: Request) -> CalendarService:
 
 @router.get("/today", response_model=TodayResponse)
 async def get_today_info(
+    request: Request,
+    response: Response,
     calendar_service: CalendarService = Depends(get_calendar_service),
     user: User = Depends(get_current_user)
 ):
     """Get information about today's date and entry status."""
     try:
+        try:
+            etag = make_etag("today", *await calendar_service.get_today_version())
+        except Exception:
+            etag = None
+
+        if etag and etag_matches(request, etag):
+            return not_modified(etag)
+
         today_info = await calendar_service.get_today_info()
         
+        apply_etag(response, etag)
         return TodayResponse(
             today=today_info["today"],
             day_name=today_info["day_name"],
@@ -300,10 +312,15 @@ async def get_entries_in_range(
 async def get_calendar_month(
     year: int,
     month: int,
+    request: Request,
+    response: Response,
     calendar_service: CalendarService = Depends(get_calendar_service),
     user: User = Depends(get_current_user)
 ):
-    """Get calendar data for a specific month and year."""
+    """Get calendar data for a specific month and year.
+
+    Responses carry an ETag; a matching If-None-Match is answered with 304.
+    """
     try:
         # Validate year and month
         if not (1900 <= year <= 3000):
@@ -317,7 +334,16 @@ async def get_calendar_month(
                 detail=f"Invalid month: {month}. Must be between 1 and 12."
             )
         
+        try:
+            etag = make_etag("month", *await calendar_service.get_month_version(year, month))
+        except Exception:
+            etag = None
+
+        if etag and etag_matches(request, etag):
+            return not_modified(etag)
+
         calendar_data = await calendar_service.get_calendar_month(year, month)
+        apply_etag(response, etag)
         return calendar_data
         
     except HTTPException:
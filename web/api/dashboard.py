@@ -0,0 +1,47 @@
+# ABOUTME: REST API endpoint that bootstraps the dashboard and calendar pages in one request.
+# ABOUTME: Returns today's status, recent entries, database stats and optionally a calendar month.
+"""
+Dashboard API Endpoint for Work Journal Maker Web Interface
+
+This module provides a single aggregated endpoint so the dashboard's first
+paint needs one round trip instead of one request per panel.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from web.auth import get_current_user, User
+from web.models.journal import DashboardResponse
+from web.services.dashboard_service import DashboardService
+
+router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
+
+
+def get_dashboard_service(request: Request) -> DashboardService:
+    """Dependency to get DashboardService from app state."""
+    return request.app.state.dashboard_service
+
+
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard(
+    recent_limit: int = Query(5, ge=1, le=50, description="Number of recent entries to include"),
+    year: Optional[int] = Query(None, ge=1900, le=3000, description="Calendar year to include"),
+    month: Optional[int] = Query(None, ge=1, le=12, description="Calendar month to include"),
+    dashboard_service: DashboardService = Depends(get_dashboard_service),
+    user: User = Depends(get_current_user)
+):
+    """
+    Get everything the dashboard needs on load.
+
+    Pass year and month together to also receive that calendar month.
+    """
+    if (year is None) != (month is None):
+        raise HTTPException(status_code=400, detail="year and month must be given together")
+
+    try:
+        return await dashboard_service.get_dashboard(recent_limit=recent_limit, year=year, month=month)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        raise HTTPException(status_code=500, detail="Failed to retrieve dashboard data")
@@ -7,8 +7,8 @@ This module provides REST API endpoints for journal entry operations,
 including CRUD functionality, listing, and metadata operations.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from datetime import date, datetime
 from typing import Optional, List
 from pathlib import Path
@@ -16,11 +16,14 @@ from pathlib import Path
 from config_manager import AppConfig
 from logger import JournalSummarizerLogger, ErrorCategory
 from web.auth import get_current_user, require_admin, User
-from web.services.entry_manager import EntryManager
+from web.services.entry_manager import EntryManager, EntryConflictError, EntryPatchError
+from web.services.entry_export import EntryExporter
 from web.models.journal import (
     JournalEntryCreate, JournalEntryUpDate, JournalEntryResponse,
-    RecentEntriesResponse, EntryListRequest, DatabaseStats
+    RecentEntriesResponse, EntryListRequest, DatabaseStats,
+    EntryContentPatch, EntryContentPatchResponse, EntryExportRequest
 )
+from web.utils.etag_utils import make_etag, etag_matches, not_modified, apply_etag
 
 router = APIRouter(prefix="/api/entries", tags=["entries"])
 
@@ -89,9 +92,48 @@ async def get_recent_entries(
         raise HTTPException(status_code=500, detail="Failed to retrieve recent entries")
 
 
+@router.get("/export")
+async def export_entries(
+    start_date: Optional[date] = Query(None, description="Start date for export"),
+    end_date: Optional[date] = Query(None, description="End date for export"),
+    format: str = Query("json", description="Export format: json, csv, txt or markdown"),
+    include_metadata: bool = Query(True, description="Include entry metadata"),
+    include_empty_entries: bool = Query(False, description="Include entries without content"),
+    compression: Optional[str] = Query(None, description="Optional compression: gzip or zip"),
+    entry_manager: EntryManager = Depends(get_entry_manager),
+    user: User = Depends(get_current_user)
+):
+    """
+    Export journal entries as a single streamed download.
+    
+    Entries are written in date order as they are read from disk, so large
+    multi-year exports start downloading immediately and use constant memory.
+    """
+    try:
+        request_model = EntryExportRequest(
+            start_date=start_date,
+            end_date=end_date,
+            format=format,
+            include_metadata=include_metadata,
+            include_empty_entries=include_empty_entries,
+            compression=compression
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    exporter = EntryExporter(entry_manager, request_model)
+    return StreamingResponse(
+        exporter.stream(),
+        media_type=exporter.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{exporter.filename}"'}
+    )
+
+
 @router.get("/{entry_date}", response_model=JournalEntryResponse)
 async def get_entry(
     entry_date: date,
+    request: Request,
+    response: Response,
     include_content: bool = Query(False, description="Include entry content"),
     entry_manager: EntryManager = Depends(get_entry_manager),
     user: User = Depends(get_current_user)
@@ -100,13 +142,25 @@ async def get_entry(
     Get a specific journal entry by date.
     
     Returns the journal entry for the specified date with optional content.
+    Responses carry an ETag; a matching If-None-Match is answered with 304.
     """
     try:
+        try:
+            version = await entry_manager.get_entry_version(entry_date, include_content)
+        except Exception:
+            version = None
+        etag = make_etag(*version) if version else None
+
+        if etag and etag_matches(request, etag):
+            entry_manager.record_entry_access(entry_date)
+            return not_modified(etag)
+
         entry = await entry_manager.get_entry_by_date(entry_date, include_content=include_content)
         
         if not entry:
             raise HTTPException(status_code=404, detail=f"Entry not found for date {entry_date}")
         
+        apply_etag(response, etag)
         return entry
         
     except HTTPException:
@@ -276,6 +330,39 @@ async def update_entry_content(
         raise HTTPException(status_code=500, detail="Failed to update entry content")
 
 
+@router.patch("/{entry_date}/content", response_model=EntryContentPatchResponse)
+async def patch_entry_content(
+    entry_date: date,
+    body: EntryContentPatch,
+    entry_manager: EntryManager = Depends(get_entry_manager),
+    user: User = Depends(get_current_user)
+):
+    """
+    Conditionally save entry content from a diff.
+
+    The client sends the hash of the version it edited, the hash of the
+    result, and the edits in between. Nothing is written when the stored
+    content already matches. Returns 409 when the stored content no longer
+    matches the base version, and 422 when the edits do not reproduce the
+    expected content (the client should then fall back to a full save).
+    """
+    try:
+        result = await entry_manager.patch_entry_content(
+            entry_date, body.base_hash, body.content_hash, body.edits
+        )
+        return EntryContentPatchResponse(date=entry_date, **result)
+
+    except EntryConflictError as e:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Entry was modified since it was loaded", "current_hash": e.current_hash}
+        )
+    except EntryPatchError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Failed to save entry content")
+
+
 @router.get("/stats/database", response_model=DatabaseStats)
 async def get_database_stats(
     request: Request,
@@ -289,46 +376,8 @@ async def get_database_stats(
     """
     try:
         db_manager = request.app.state.db_manager
-        
-        async with db_manager.get_session() as session:
-            # Get total entry count
-            from sqlalchemy import select, func
-            from web.database import JournalEntryIndex
-            
-            total_count_result = await session.execute(
-                select(func.count(JournalEntryIndex.id))
-            )
-            total_count = total_count_result.scalar()
-            
-            # Get entries with content count
-            content_count_result = await session.execute(
-                select(func.count(JournalEntryIndex.id))
-                .where(JournalEntryIndex.has_content == True)
-            )
-            content_count = content_count_result.scalar()
-            
-            # Get date range
-            date_range_result = await session.execute(
-                select(
-                    func.min(JournalEntryIndex.date),
-                    func.max(JournalEntryIndex.date)
-                )
-            )
-            min_date, max_date = date_range_result.first()
-            
-            # Get database file size
-            db_path = Path(db_manager.database_path)
-            db_size_mb = 0.0
-            if db_path.exists():
-                db_size_mb = db_path.stat().st_size / (1024 * 1024)
-            
-            return DatabaseStats(
-                total_entries=total_count or 0,
-                entries_with_content=content_count or 0,
-                date_range={"start": min_date, "end": max_date} if min_date and max_date else None,
-                last_sync=None,  # Will be implemented in sync service
-                database_size_mb=round(db_size_mb, 2)
-            )
+        stats = await db_manager.get_database_stats()
+        return DatabaseStats(**stats)
             
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to retrieve database statistics")
\ No newline at end of file
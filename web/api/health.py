@@ -90,10 +90,16 @@ async def system_metrics(request: Request, user: User = Depends(require_admin)):
     # Get database stats
     db_stats = await db_manager.health_check()
     
+    try:
+        performance = await db_manager.get_performance_profile()
+    except Exception:
+        performance = None
+    
     return {
         "database": {
             "entry_count": db_stats.get("entry_count", 0),
-            "status": db_stats.get("status", "unknown")
+            "status": db_stats.get("status", "unknown"),
+            "performance": performance
         },
         "uptime": datetime.utcnow().isoformat()
     }
\ No newline at end of file
@@ -10,7 +10,8 @@ real-time progress tracking and task management.
 from fastapi import APIRouter, Depends, HTTPException, Request, BackgroundTasks, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse, FileResponse
 from datetime import date, datetime
-from typing import Optional, List, Dict, Set
+from collections import deque
+from typing import Callable, Deque, Optional, List, Dict, Set
 import os
 import json
 import asyncio
@@ -24,13 +25,102 @@ from web.models.journal import SummaryRequest, SummaryTaskResponse, ProgressResp
 router = APIRouter(prefix="/api/summarization", tags=["summarization"])
 
 
+# A connection with this many undelivered frames is closed as too slow
+WEBSOCKET_MAX_PENDING_FRAMES = 64
+# A single send taking longer than this marks the connection as dead
+WEBSOCKET_SEND_TIMEOUT_SECONDS = 10.0
+# Close code telling the browser to fall back to polling and retry later
+WEBSOCKET_SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class _ConnectionOutbox:
+    """
+    Bounded queue of serialized frames for one WebSocket, drained by its own writer task.
+
+    Frames enqueued with a coalesce key replace a still-pending frame with the
+    same key, so a backed-up client receives only the latest progress for a
+    task instead of every intermediate step.
+    """
+
+    def __init__(self, websocket: WebSocket, on_failure: Callable[[WebSocket], None],
+                 max_pending: int, send_timeout: float):
+        self.websocket = websocket
+        self._on_failure = on_failure
+        self._max_pending = max_pending
+        self._send_timeout = send_timeout
+        self._frames: Deque[List] = deque()
+        self._pending_by_key: Dict[str, List] = {}
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._writer = asyncio.create_task(self._run())
+
+    def enqueue(self, text: str, coalesce_key: Optional[str] = None) -> bool:
+        """Queue a frame without blocking. Returns False if the outbox is full."""
+        if coalesce_key is not None and coalesce_key in self._pending_by_key:
+            self._pending_by_key[coalesce_key][1] = text
+            return True
+        if len(self._frames) >= self._max_pending:
+            return False
+        frame = [coalesce_key, text]
+        self._frames.append(frame)
+        if coalesce_key is not None:
+            self._pending_by_key[coalesce_key] = frame
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    async def wait_idle(self) -> None:
+        """Wait until every queued frame has been sent or the writer has stopped."""
+        await self._idle.wait()
+
+    def close(self) -> None:
+        """Stop the writer, discarding undelivered frames."""
+        self._writer.cancel()
+        self._frames.clear()
+        self._pending_by_key.clear()
+        self._idle.set()
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                if not self._frames:
+                    self._idle.set()
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                coalesce_key, text = self._frames.popleft()
+                if coalesce_key is not None:
+                    self._pending_by_key.pop(coalesce_key, None)
+                try:
+                    await asyncio.wait_for(self.websocket.send_text(text), self._send_timeout)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self._idle.set()
+                    self._on_failure(self.websocket)
+                    return
+        finally:
+            self._idle.set()
+
+
 # WebSocket connection manager
 class ConnectionManager:
-    """Manages WebSocket connections for real-time progress updates."""
+    """
+    Manages WebSocket connections for real-time progress updates.
+
+    Broadcasts serialize each message once and only enqueue it on every
+    subscriber's outbox, so callers never wait on network I/O and one slow
+    browser tab cannot delay updates to the others.
+    """
     
-    def __init__(self):
+    def __init__(self, max_pending: int = WEBSOCKET_MAX_PENDING_FRAMES,
+                 send_timeout: float = WEBSOCKET_SEND_TIMEOUT_SECONDS):
         self.active_connections: Dict[str, Set[WebSocket]] = {}
         self.task_subscribers: Dict[str, Set[WebSocket]] = {}
+        self.max_pending = max_pending
+        self.send_timeout = send_timeout
+        self._outboxes: Dict[WebSocket, _ConnectionOutbox] = {}
     
     async def connect(self, websocket: WebSocket, task_id: Optional[str] = None):
         """Accept a WebSocket connection."""
@@ -45,6 +135,7 @@ class ConnectionManager:
             if "general" not in self.active_connections:
                 self.active_connections["general"] = set()
             self.active_connections["general"].add(websocket)
+        self._outbox_for(websocket)
     
     def disconnect(self, websocket: WebSocket, task_id: Optional[str] = None):
         """Remove a WebSocket connection."""
@@ -55,70 +146,82 @@ class ConnectionManager:
         else:
             if "general" in self.active_connections:
                 self.active_connections["general"].discard(websocket)
+        outbox = self._outboxes.pop(websocket, None)
+        if outbox is not None:
+            outbox.close()
+
+    def send_personal(self, websocket: WebSocket, message: dict) -> None:
+        """Queue a message for one connection, behind any updates already queued for it."""
+        if not self._outbox_for(websocket).enqueue(json.dumps(message)):
+            self._drop_slow_consumer(websocket)
     
     async def send_progress_update(self, task_id: str, progress_data: dict):
         """Send progress update to subscribers of a specific task."""
-        connections_to_remove = []
-        
-        # Send to task-specific subscribers
-        if task_id in self.task_subscribers:
-            for websocket in self.task_subscribers[task_id].copy():
-                try:
-                    await websocket.send_text(json.dumps({
-                        "type": "progress_update",
-                        "task_id": task_id,
-                        "data": progress_data
-                    }))
-                except Exception:
-                    connections_to_remove.append((websocket, task_id))
-        
-        # Send to general subscribers
-        if "general" in self.active_connections:
-            for websocket in self.active_connections["general"].copy():
-                try:
-                    await websocket.send_text(json.dumps({
-                        "type": "progress_update",
-                        "task_id": task_id,
-                        "data": progress_data
-                    }))
-                except Exception:
-                    connections_to_remove.append((websocket, None))
-        
-        # Clean up failed connections
-        for websocket, tid in connections_to_remove:
-            self.disconnect(websocket, tid)
+        text = json.dumps({
+            "type": "progress_update",
+            "task_id": task_id,
+            "data": progress_data
+        })
+        # Only the newest undelivered progress frame per task is worth sending
+        self._broadcast(task_id, text, coalesce_key=task_id)
     
     async def send_task_status(self, task_id: str, status_data: dict):
         """Send task status update to subscribers."""
-        connections_to_remove = []
-        
-        # Send to task-specific subscribers
-        if task_id in self.task_subscribers:
-            for websocket in self.task_subscribers[task_id].copy():
-                try:
-                    await websocket.send_text(json.dumps({
-                        "type": "task_status",
-                        "task_id": task_id,
-                        "data": status_data
-                    }))
-                except Exception:
-                    connections_to_remove.append((websocket, task_id))
-        
-        # Send to general subscribers
-        if "general" in self.active_connections:
-            for websocket in self.active_connections["general"].copy():
-                try:
-                    await websocket.send_text(json.dumps({
-                        "type": "task_status",
-                        "task_id": task_id,
-                        "data": status_data
-                    }))
-                except Exception:
-                    connections_to_remove.append((websocket, None))
-        
-        # Clean up failed connections
-        for websocket, tid in connections_to_remove:
-            self.disconnect(websocket, tid)
+        text = json.dumps({
+            "type": "task_status",
+            "task_id": task_id,
+            "data": status_data
+        })
+        self._broadcast(task_id, text)
+
+    async def drain(self) -> None:
+        """Wait until every connection has sent or abandoned its queued frames."""
+        await asyncio.gather(*(outbox.wait_idle() for outbox in list(self._outboxes.values())))
+
+    def _broadcast(self, task_id: str, text: str, coalesce_key: Optional[str] = None) -> None:
+        recipients = (list(self.task_subscribers.get(task_id, ())) +
+                      list(self.active_connections.get("general", ())))
+        for websocket in recipients:
+            try:
+                queued = self._outbox_for(websocket).enqueue(text, coalesce_key)
+            except Exception:
+                self._forget(websocket)
+                continue
+            if not queued:
+                self._drop_slow_consumer(websocket)
+
+    def _outbox_for(self, websocket: WebSocket) -> _ConnectionOutbox:
+        outbox = self._outboxes.get(websocket)
+        if outbox is None:
+            outbox = _ConnectionOutbox(websocket, self._forget, self.max_pending, self.send_timeout)
+            self._outboxes[websocket] = outbox
+        return outbox
+
+    def _forget(self, websocket: WebSocket) -> None:
+        """Unsubscribe a connection everywhere and stop its writer."""
+        for task_id in list(self.task_subscribers):
+            self.task_subscribers[task_id].discard(websocket)
+            if not self.task_subscribers[task_id]:
+                del self.task_subscribers[task_id]
+        for connections in self.active_connections.values():
+            connections.discard(websocket)
+        outbox = self._outboxes.pop(websocket, None)
+        if outbox is not None:
+            outbox.close()
+
+    def _drop_slow_consumer(self, websocket: WebSocket) -> None:
+        self._forget(websocket)
+        # The client reconnects or polls; closing must not block the broadcaster
+        asyncio.create_task(self._close_quietly(websocket))
+
+    async def _close_quietly(self, websocket: WebSocket) -> None:
+        try:
+            await asyncio.wait_for(
+                websocket.close(code=WEBSOCKET_SLOW_CONSUMER_CLOSE_CODE, reason="Client too slow"),
+                self.send_timeout
+            )
+        except Exception:
+            pass
 
 
 # Global connection manager instance
@@ -273,6 +376,7 @@ async def get_task_progress(
             current_step=progress.current_step,
             status=progress.status.value,
             message=progress.message,
+            eta_seconds=progress.eta_seconds,
             timestamp=progress.timestamp
         )
         
@@ -487,23 +591,25 @@ async def websocket_endpoint(websocket: WebSocket):
     await connection_manager.connect(websocket)
     try:
         # Send initial connection status
-        await websocket.send_text(json.dumps({
+        connection_manager.send_personal(websocket, {
             "type": "connection_status",
             "status": "connected",
             "message": "WebSocket connection established",
             "service_configured": True
-        }))
+        })
         
         while True:
             # Keep connection alive and handle any incoming messages
             data = await websocket.receive_text()
             # Echo back for connection testing
-            await websocket.send_text(json.dumps({
+            connection_manager.send_personal(websocket, {
                 "type": "connection_status",
                 "status": "connected",
                 "message": "WebSocket connection established"
-            }))
+            })
     except WebSocketDisconnect:
+        pass
+    finally:
         connection_manager.disconnect(websocket)
 
 
@@ -539,7 +645,7 @@ async def websocket_task_endpoint(websocket: WebSocket, task_id: str):
         task = await summarization_service.get_task_status(task_id)
         
         if task:
-            await websocket.send_text(json.dumps({
+            connection_manager.send_personal(websocket, {
                 "type": "initial_status",
                 "task_id": task_id,
                 "data": {
@@ -550,22 +656,24 @@ async def websocket_task_endpoint(websocket: WebSocket, task_id: str):
                     "started_at": task.started_at.isoformat() if task.started_at else None,
                     "completed_at": task.completed_at.isoformat() if task.completed_at else None
                 }
-            }))
+            })
         else:
-            await websocket.send_text(json.dumps({
+            connection_manager.send_personal(websocket, {
                 "type": "error",
                 "message": f"Task {task_id} not found"
-            }))
+            })
         
         while True:
             # Keep connection alive and handle any incoming messages
             data = await websocket.receive_text()
             # Echo back for connection testing
-            await websocket.send_text(json.dumps({
+            connection_manager.send_personal(websocket, {
                 "type": "connection_status",
                 "task_id": task_id,
                 "status": "connected",
                 "message": f"WebSocket connection established for task {task_id}"
-            }))
+            })
     except WebSocketDisconnect:
+        pass
+    finally:
         connection_manager.disconnect(websocket, task_id)
\ No newline at end of file
@@ -7,7 +7,7 @@ This module provides REST API endpoints for managing and monitoring
 database synchronization operations.
 """
 
-from fastapi import APIRouter, Body, Depends, HTTPException, BackgroundTasks, Request
+from fastapi import APIRouter, Body, Depends, HTTPException, BackgroundTasks, Query, Request
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from datetime import date, datetime, timedelta
@@ -380,6 +380,34 @@ async def get_sync_history(
         raise HTTPException(status_code=500, detail="Failed to get sync history")
 
 
+@router.get("/history/daily")
+async def get_daily_sync_history(
+    days: int = Query(90, ge=1, le=3650),
+    sync_type: Optional[str] = None,
+    sync_service: DatabaseSyncService = Depends(get_sync_service),
+    user: User = Depends(get_current_user)
+):
+    """
+    Get daily aggregates of sync history older than the retention window.
+    
+    Args:
+        days: How many days back to include
+        sync_type: Filter by sync type (full, incremental, single_entry)
+        
+    Returns:
+        Per-day, per-type, per-status run counts and totals
+    """
+    try:
+        history = await sync_service.get_daily_sync_history(days=days, sync_type=sync_type)
+        return {
+            "daily_history": history,
+            "total_records": len(history),
+            "retrieved_at": datetime.utcnow().isoformat()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Failed to get daily sync history")
+
+
 # Background task functions
 async def _run_full_sync(sync_service: DatabaseSyncService, date_range_days: Optional[int]):
     """Background task to run full sync."""
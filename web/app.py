@@ -14,7 +14,8 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
+import asyncio
 import hashlib
 import os
 import time
@@ -25,21 +26,27 @@ from typing import Dict, Any, Optional
 
 _DEBUG_MODE = os.getenv("WORK_JOURNAL_DEBUG", "").lower() in ("1", "true", "yes")
 
+_IMPORTS_STARTED = time.perf_counter()
+
 from config_manager import ConfigManager, AppConfig, AuthConfig
 from logger import LogConfig, JournalSummarizerLogger, ErrorCategory
 from web.database import DatabaseManager, db_manager
-from web.api import health, entries, sync, calendar, summarization, settings, auth as auth_api
+from web.api import health, entries, sync, calendar, dashboard, summarization, settings, auth as auth_api
 from web.providers.local import LocalAuthProvider
 from web.auth import decode_access_token
 from web.middleware import LoggingMiddleware, ErrorHandlingMiddleware, CSRFMiddleware, SecurityHeadersMiddleware
 from web.services.entry_manager import EntryManager
 from web.services.calendar_service import CalendarService
+from web.services.dashboard_service import DashboardService
 from web.services.web_summarizer import WebSummarizationService
 from web.services.sync_service import DatabaseSyncService
 from web.services.scheduler import SyncScheduler
 from web.services.settings_service import SettingsService
 from web.services.work_week_service import WorkWeekService
 
+# Reported as the "imports" startup stage; later imports of web.app are cached
+_IMPORTS_MS = (time.perf_counter() - _IMPORTS_STARTED) * 1000
+
 
 def create_logger_with_config(log_config: LogConfig) -> JournalSummarizerLogger:
     """Create logger instance with the provided configuration."""
@@ -58,63 +65,92 @@ class WorkJournalWebApp:
         self.entry_manager: Optional[EntryManager] = None
         self.calendar_service: Optional[CalendarService] = None
         self.settings_service: Optional[SettingsService] = None
+        self.dashboard_service: Optional[DashboardService] = None
         self.summarization_service: Optional[WebSummarizationService] = None
         self.sync_service: Optional['DatabaseSyncService'] = None
         self.scheduler: Optional[SyncScheduler] = None
+        # Milliseconds spent in each startup stage, in order
+        self.startup_timings: Dict[str, float] = {}
+
+    @contextmanager
+    def _startup_stage(self, name: str):
+        """Record how long a startup stage takes in startup_timings."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.startup_timings[name] = (time.perf_counter() - started) * 1000
         
     async def startup(self):
         """Application startup sequence."""
+        self.startup_timings = {"imports": _IMPORTS_MS}
         try:
             # Initialize configuration
-            config_manager = ConfigManager()
-            self.config = config_manager.get_config()
+            with self._startup_stage("config"):
+                config_manager = ConfigManager()
+                self.config = config_manager.get_config()
             
             # Initialize logging
-            self.logger = create_logger_with_config(self.config.logging)
+            with self._startup_stage("logging"):
+                self.logger = create_logger_with_config(self.config.logging)
             self.logger.logger.info("Starting Work Journal Web Application...")
             
             # Initialize database (with migration from old source-tree location)
-            old_db_path = str(Path(__file__).parent / "journal_index.db")
-            await self.db_manager.initialize(old_db_path=old_db_path)
+            with self._startup_stage("database"):
+                old_db_path = str(Path(__file__).parent / "journal_index.db")
+                await self.db_manager.initialize(old_db_path=old_db_path, db_config=self.config.database)
             self.logger.logger.info("Database initialized successfully")
 
-            
-            # Initialize WorkWeekService for proper directory organization
-            self.work_week_service = WorkWeekService(self.config, self.logger, self.db_manager)
-            self.logger.logger.info("WorkWeekService initialized successfully")
-            
-            # Initialize EntryManager service with WorkWeekService dependency
-            self.entry_manager = EntryManager(self.config, self.logger, self.db_manager, self.work_week_service)
-            self.logger.logger.info("EntryManager service initialized successfully with work week integration")
-            
-            # Initialize CalendarService
-            self.calendar_service = CalendarService(self.config, self.logger, self.db_manager)
-            self.logger.logger.info("CalendarService initialized successfully")
+            with self._startup_stage("services"):
+                # Initialize WorkWeekService for proper directory organization
+                self.work_week_service = WorkWeekService(self.config, self.logger, self.db_manager)
+                self.logger.logger.info("WorkWeekService initialized successfully")
+                
+                # Initialize EntryManager service with WorkWeekService dependency
+                self.entry_manager = EntryManager(self.config, self.logger, self.db_manager, self.work_week_service)
+                self.logger.logger.info("EntryManager service initialized successfully with work week integration")
+                self.entry_manager.start_access_stats_flush()
+                
+                # Initialize CalendarService
+                self.calendar_service = CalendarService(self.config, self.logger, self.db_manager)
+                self.logger.logger.info("CalendarService initialized successfully")
+
+                # Initialize DashboardService (subscribes to entry changes)
+                self.dashboard_service = DashboardService(
+                    self.config, self.logger, self.db_manager, self.entry_manager, self.calendar_service
+                )
+                self.logger.logger.info("DashboardService initialized successfully")
 
-            # Initialize SettingsService
-            self.settings_service = SettingsService(self.config, self.logger, self.db_manager)
-            self.logger.logger.info("SettingsService initialized successfully")
+                # Initialize SettingsService
+                self.settings_service = SettingsService(self.config, self.logger, self.db_manager)
+                self.logger.logger.info("SettingsService initialized successfully")
 
-            # Initialize DatabaseSyncService
-            self.sync_service = DatabaseSyncService(self.config, self.logger, self.db_manager)
-            self.logger.logger.info("DatabaseSyncService initialized successfully")
+                # Initialize DatabaseSyncService
+                self.sync_service = DatabaseSyncService(self.config, self.logger, self.db_manager)
+                self.logger.logger.info("DatabaseSyncService initialized successfully")
             
-            # Initialize WebSummarizationService
-            self.summarization_service = WebSummarizationService(self.config, self.logger, self.db_manager)
-            self.logger.logger.info("WebSummarizationService initialized successfully")
+            with self._startup_stage("summarization"):
+                # Initialize WebSummarizationService (its LLM client is built on first use)
+                self.summarization_service = WebSummarizationService(self.config, self.logger, self.db_manager)
+                self.logger.logger.info("WebSummarizationService initialized successfully")
+                
+                # Set up WebSocket connection manager for real-time updates
+                from web.api.summarization import connection_manager
+                self.summarization_service.set_connection_manager(connection_manager)
+                self.logger.logger.info("WebSocket connection manager configured for summarization service")
             
-            # Set up WebSocket connection manager for real-time updates
-            from web.api.summarization import connection_manager
-            self.summarization_service.set_connection_manager(connection_manager)
-            self.logger.logger.info("WebSocket connection manager configured for summarization service")
-            
-            # Initialize and start sync scheduler
-            self.scheduler = SyncScheduler(self.config, self.logger, self.db_manager)
-            await self.scheduler.start()
+            # Initialize and start sync scheduler (its first sync runs after startup_sync_delay)
+            with self._startup_stage("scheduler"):
+                self.scheduler = SyncScheduler(self.config, self.logger, self.db_manager)
+                await self.scheduler.start()
             self.logger.logger.info("Sync scheduler started successfully")
             
             # Log startup completion
-            self.logger.logger.info("Web application startup completed successfully")
+            breakdown = ", ".join(f"{name} {ms:.0f}ms" for name, ms in self.startup_timings.items())
+            self.logger.logger.info(
+                f"Web application startup completed successfully in "
+                f"{sum(self.startup_timings.values()):.0f}ms ({breakdown})"
+            )
             
         except Exception as e:
             if self.logger:
@@ -135,9 +171,13 @@ class WorkJournalWebApp:
             await self.scheduler.stop()
             self.logger.logger.info("Sync scheduler stopped")
             
+        # Flush buffered entry access statistics before the engine goes away
+        if self.entry_manager:
+            await self.entry_manager.stop_access_stats_flush()
+            
         # Close database connections
-        if self.db_manager and self.db_manager.engine:
-            await self.db_manager.engine.dispose()
+        if self.db_manager:
+            await self.db_manager.dispose()
             
         if self.logger:
             self.logger.logger.info("Web application shutdown complete")
@@ -158,19 +198,25 @@ async def lifespan(app: FastAPI):
     app.state.work_week_service = web_app.work_week_service
     app.state.entry_manager = web_app.entry_manager
     app.state.calendar_service = web_app.calendar_service
+    app.state.dashboard_service = web_app.dashboard_service
     app.state.settings_service = web_app.settings_service
     app.state.sync_service = web_app.sync_service
     app.state.summarization_service = web_app.summarization_service
     app.state.scheduler = web_app.scheduler
     app.state.auth_config = web_app.config.auth
+    auth_warm_up = None
     if web_app.config.auth.enabled:
         app.state.auth_provider = LocalAuthProvider(web_app.db_manager, web_app.config.auth)
+        # In the background, so bcrypt's work factor does not delay startup
+        auth_warm_up = asyncio.create_task(app.state.auth_provider.warm_up())
     else:
         app.state.auth_provider = None
 
     yield
     
     # Shutdown
+    if auth_warm_up is not None:
+        await auth_warm_up
     await web_app.shutdown()
 
 
@@ -210,6 +256,7 @@ app.include_router(health.router)
 app.include_router(entries.router)
 app.include_router(sync.router)
 app.include_router(calendar.router)
+app.include_router(dashboard.router)
 app.include_router(summarization.router)
 app.include_router(settings.router)
 app.include_router(auth_api.router)
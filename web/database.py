@@ -8,9 +8,11 @@ while maintaining the file system as the primary data store.
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import Column, Integer, String, Date, Boolean, DateTime, Text, Float, Index, update, text
-from datetime import datetime
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy import Column, Integer, String, Date, Boolean, DateTime, Text, Float, Index, update, text, event
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from config_manager import DatabaseConfig
 from .utils.timezone_utils import now_utc, now_local
 import aiosqlite
 import json
@@ -19,9 +21,10 @@ import os
 import shutil
 import sqlite3
 import tempfile
+import time
 from pathlib import Path
 from contextlib import asynccontextmanager
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Set, Union
 
 
 class Base(DeclarativeBase):
@@ -101,6 +104,23 @@ class SyncStatus(Base):
     sync_metadata = Column(Text)  # JSON metadata
 
 
+class SyncHistoryDaily(Base):
+    """Per-day rollup of sync_status rows older than the retention window."""
+    __tablename__ = "sync_history_daily"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    day = Column(Date, nullable=False)
+    sync_type = Column(String, nullable=False)
+    status = Column(String, nullable=False)
+    runs = Column(Integer, nullable=False, default=0)
+    entries_processed = Column(Integer, nullable=False, default=0)
+    entries_added = Column(Integer, nullable=False, default=0)
+    entries_updated = Column(Integer, nullable=False, default=0)
+    entries_removed = Column(Integer, nullable=False, default=0)
+    total_duration_seconds = Column(Float, nullable=False, default=0.0)
+    last_completed_at = Column(DateTime)
+
+
 class UserAccount(Base):
     """User account for authentication (local provider)."""
     __tablename__ = "users"
@@ -130,11 +150,44 @@ class RefreshToken(Base):
 Index('idx_journal_entries_date_content', JournalEntryIndex.date, JournalEntryIndex.has_content)
 Index('idx_journal_entries_week_ending', JournalEntryIndex.week_ending_date)
 Index('idx_sync_status_type_started', SyncStatus.sync_type, SyncStatus.started_at)
+Index('idx_sync_status_started', SyncStatus.started_at)
+Index('idx_sync_status_type_status_completed', SyncStatus.sync_type, SyncStatus.status, SyncStatus.completed_at)
+Index('idx_sync_history_daily_key', SyncHistoryDaily.day, SyncHistoryDaily.sync_type,
+      SyncHistoryDaily.status, unique=True)
 Index('idx_work_week_settings_user', WorkWeekSettings.user_id)
 Index('idx_work_week_settings_preset', WorkWeekSettings.work_week_preset)
 Index('idx_refresh_tokens_hash', RefreshToken.token_hash)
 
 
+# Cached entry statistics are rebuilt from the table at least this often,
+# correcting any drift from writes that bypass record_entry_*()
+ENTRY_STATS_RECONCILE_SECONDS = 300.0
+
+_ENTRY_STATS_DELTA_KEY = "entry_stats_delta"
+
+
+@dataclass
+class EntryStatsDelta:
+    """Net effect of one transaction's journal_entries writes on the cached statistics."""
+    manager: "DatabaseManager"
+    entries: int = 0
+    with_content: int = 0
+    added_dates: Set[date] = field(default_factory=set)
+    removed_dates: Set[date] = field(default_factory=set)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_entry_stats_delta(session) -> None:
+    delta = session.info.pop(_ENTRY_STATS_DELTA_KEY, None)
+    if delta is not None:
+        delta.manager._apply_entry_stats_delta(delta)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_entry_stats_delta(session) -> None:
+    session.info.pop(_ENTRY_STATS_DELTA_KEY, None)
+
+
 class DatabaseManager:
     """Manages database operations and migrations."""
 
@@ -144,7 +197,18 @@ class DatabaseManager:
         else:
             self.database_path = self._resolve_explicit_path(database_path)
         self.engine = None
+        self.read_engine = None
         self.SessionLocal = None
+        self.ReadSessionLocal = None
+        self.db_config = DatabaseConfig()
+        # Cached get_database_stats() counts, kept current by record_entry_*()
+        self._entry_stats: Optional[Dict[str, Any]] = None
+        self._entry_stats_loaded_at = 0.0
+        # Bumped by every committed change so a recount that overlaps one is not cached
+        self._entry_stats_version = 0
+        # Completion time of the newest full sync, looked up once then kept current
+        self._last_full_sync: Optional[datetime] = None
+        self._last_full_sync_loaded = False
 
     def _get_default_database_path(self) -> str:
         """
@@ -199,13 +263,61 @@ class DatabaseManager:
 
         return str(resolved)
 
-    async def initialize(self, old_db_path: Optional[str] = None):
+    def _get_pragmas(self, read_only: bool = False) -> Dict[str, Any]:
+        """Build the PRAGMA statements for the configured performance profile.
+
+        Args:
+            read_only: Build pragmas for the read-only pool. journal_mode is
+                persistent in the database file, so only the write pool sets it.
+        """
+        cfg = self.db_config
+        pragmas: Dict[str, Any] = {}
+        if not read_only:
+            pragmas["journal_mode"] = cfg.journal_mode.upper()
+        pragmas.update({
+            "synchronous": cfg.synchronous.upper(),
+            "mmap_size": cfg.mmap_size_mb * 1024 * 1024,
+            "cache_size": -cfg.cache_size_mb * 1024,  # negative value means KiB
+            "temp_store": cfg.temp_store.upper(),
+            "busy_timeout": cfg.busy_timeout_ms,
+        })
+        if read_only:
+            pragmas["query_only"] = "ON"
+        return pragmas
+
+    def _create_engine(self, pool_size: int, max_overflow: int, read_only: bool = False):
+        """Create an async engine whose connections get the performance pragmas."""
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{self.database_path}",
+            echo=False,  # Set to True for SQL debugging
+            pool_pre_ping=True,
+            pool_size=pool_size,
+            max_overflow=max_overflow
+        )
+        pragmas = self._get_pragmas(read_only=read_only)
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _apply_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+        return engine
+
+    async def initialize(self, old_db_path: Optional[str] = None,
+                         db_config: Optional[DatabaseConfig] = None):
         """Initialize database with proper async setup.
 
         Args:
             old_db_path: Path to old source-tree DB for one-time migration.
                 If provided and target doesn't exist, copies old DB first.
+            db_config: SQLite performance profile (pragmas and pool sizes).
+                Defaults to DatabaseConfig().
         """
+        if db_config is not None:
+            self.db_config = db_config
+
         db_file = Path(self.database_path)
         db_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -247,10 +359,9 @@ class DatabaseManager:
                         )
                         db_file.unlink(missing_ok=True)
 
-        self.engine = create_async_engine(
-            f"sqlite+aiosqlite:///{self.database_path}",
-            echo=False,  # Set to True for SQL debugging
-            pool_pre_ping=True
+        self.engine = self._create_engine(
+            pool_size=self.db_config.pool_size,
+            max_overflow=self.db_config.max_overflow
         )
         self.SessionLocal = async_sessionmaker(
             self.engine, 
@@ -262,6 +373,18 @@ class DatabaseManager:
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
+        # Separate read-only pool so GET endpoints never queue behind writers
+        self.read_engine = self._create_engine(
+            pool_size=self.db_config.read_pool_size,
+            max_overflow=0,
+            read_only=True
+        )
+        self.ReadSessionLocal = async_sessionmaker(
+            self.read_engine,
+            class_=AsyncSession,
+            expire_on_commit=False
+        )
+
         # Apply schema migrations for columns added after initial release
         await self._apply_schema_migrations()
 
@@ -290,6 +413,16 @@ class DatabaseManager:
                 ))
                 log.info("Migration complete: user_id column added")
 
+            # create_all() skips indexes on tables that already exist
+            await conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_sync_status_started "
+                "ON sync_status(started_at)"
+            ))
+            await conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_sync_status_type_status_completed "
+                "ON sync_status(sync_type, status, completed_at)"
+            ))
+
     async def _initialize_default_settings(self):
         """Initialize default web settings."""
         default_settings = [
@@ -431,50 +564,149 @@ class DatabaseManager:
         except Exception as e:
             return {}
     
+    def record_entry_upsert(self, session, entry_date: date,
+                            previous_has_content: Optional[bool], has_content: bool) -> None:
+        """
+        Note an insert or update of a journal entry row in session's transaction.
+
+        The cached statistics change only if the transaction commits.
+
+        Args:
+            session: Session the write was made in
+            entry_date: Date of the entry written
+            previous_has_content: has_content before the write, or None for an insert
+            has_content: has_content after the write
+        """
+        delta = self._pending_entry_stats_delta(session)
+        if previous_has_content is None:
+            delta.entries += 1
+            delta.added_dates.add(entry_date)
+        delta.with_content += int(bool(has_content)) - int(bool(previous_has_content))
+
+    def record_entry_removal(self, session, entry_date: date, had_content: bool) -> None:
+        """Note the deletion of a journal entry row in session's transaction."""
+        delta = self._pending_entry_stats_delta(session)
+        delta.entries -= 1
+        delta.with_content -= int(bool(had_content))
+        delta.removed_dates.add(entry_date)
+
+    def invalidate_entry_stats(self) -> None:
+        """Force the next get_database_stats() to recount from the table."""
+        self._entry_stats_version += 1
+        self._entry_stats = None
+
+    def _pending_entry_stats_delta(self, session) -> EntryStatsDelta:
+        delta = session.info.get(_ENTRY_STATS_DELTA_KEY)
+        if delta is None:
+            delta = EntryStatsDelta(manager=self)
+            session.info[_ENTRY_STATS_DELTA_KEY] = delta
+        return delta
+
+    def _apply_entry_stats_delta(self, delta: EntryStatsDelta) -> None:
+        self._entry_stats_version += 1
+        stats = self._entry_stats
+        if stats is None:
+            return
+        # Removing an endpoint of the date range needs a rescan to find the new one
+        if delta.removed_dates & {stats["min_date"], stats["max_date"]}:
+            self._entry_stats = None
+            return
+        stats["total_entries"] += delta.entries
+        stats["entries_with_content"] += delta.with_content
+        for added in delta.added_dates:
+            if stats["min_date"] is None or added < stats["min_date"]:
+                stats["min_date"] = added
+            if stats["max_date"] is None or added > stats["max_date"]:
+                stats["max_date"] = added
+
+    def record_full_sync_completed(self, completed_at: datetime) -> None:
+        """Advance the cached last-full-sync pointer after a full sync commits."""
+        if self._last_full_sync is None or completed_at > self._last_full_sync:
+            self._last_full_sync = completed_at
+        self._last_full_sync_loaded = True
+
+    async def get_last_full_sync(self) -> Optional[datetime]:
+        """Get when the newest completed full sync finished, or None if there was none."""
+        if not self._last_full_sync_loaded:
+            from sqlalchemy import select, func, and_
+
+            async with self.get_session(read_only=True) as session:
+                # Answered from idx_sync_status_type_status_completed
+                last_sync = await session.scalar(
+                    select(func.max(SyncStatus.completed_at)).where(
+                        and_(SyncStatus.sync_type == "full", SyncStatus.status == "completed")
+                    )
+                )
+            if not self._last_full_sync_loaded:
+                self._last_full_sync = last_sync
+                self._last_full_sync_loaded = True
+        return self._last_full_sync
+
+    async def _load_entry_stats(self) -> Dict[str, Any]:
+        """Count entries and content and find the date range."""
+        async with self.get_session(read_only=True) as session:
+            from sqlalchemy import select, func
+            
+            # Get entry statistics
+            total_entries_stmt = select(func.count(JournalEntryIndex.id))
+            total_entries = await session.scalar(total_entries_stmt)
+            
+            entries_with_content_stmt = select(func.count(JournalEntryIndex.id)).where(
+                JournalEntryIndex.has_content == True
+            )
+            entries_with_content = await session.scalar(entries_with_content_stmt)
+            
+            # Get date range
+            date_range_stmt = select(
+                func.min(JournalEntryIndex.date),
+                func.max(JournalEntryIndex.date)
+            )
+            date_range_result = await session.execute(date_range_stmt)
+            min_date, max_date = date_range_result.fetchone()
+        
+        return {
+            "total_entries": total_entries or 0,
+            "entries_with_content": entries_with_content or 0,
+            "min_date": min_date,
+            "max_date": max_date
+        }
+
     async def get_database_stats(self) -> Dict[str, Any]:
-        """Get comprehensive database statistics."""
+        """
+        Get comprehensive database statistics.
+
+        Entry counts come from an in-process cache that writers keep current
+        through record_entry_upsert()/record_entry_removal(); the table is only
+        scanned on first use, after invalidate_entry_stats(), or once the cache
+        is older than ENTRY_STATS_RECONCILE_SECONDS.
+        """
         try:
-            async with self.get_session() as session:
-                from sqlalchemy import select, func, and_
-                
-                # Get entry statistics
-                total_entries_stmt = select(func.count(JournalEntryIndex.id))
-                total_entries = await session.scalar(total_entries_stmt)
-                
-                entries_with_content_stmt = select(func.count(JournalEntryIndex.id)).where(
-                    JournalEntryIndex.has_content == True
-                )
-                entries_with_content = await session.scalar(entries_with_content_stmt)
-                
-                # Get date range
-                date_range_stmt = select(
-                    func.min(JournalEntryIndex.date),
-                    func.max(JournalEntryIndex.date)
-                )
-                date_range_result = await session.execute(date_range_stmt)
-                min_date, max_date = date_range_result.fetchone()
-                
-                # Get last sync info
-                last_sync_stmt = select(func.max(SyncStatus.completed_at)).where(
-                    and_(SyncStatus.status == "completed", SyncStatus.sync_type == "full")
-                )
-                last_sync = await session.scalar(last_sync_stmt)
-                
-                # Get database file size
-                db_size_mb = 0.0
-                if os.path.exists(self.database_path):
-                    db_size_mb = os.path.getsize(self.database_path) / (1024 * 1024)
-                
-                return {
-                    "total_entries": total_entries or 0,
-                    "entries_with_content": entries_with_content or 0,
-                    "date_range": {
-                        "start": min_date.isoformat() if min_date else None,
-                        "end": max_date.isoformat() if max_date else None
-                    } if min_date and max_date else None,
-                    "last_sync": last_sync.isoformat() if last_sync else None,
-                    "database_size_mb": round(db_size_mb, 2)
-                }
+            stats = self._entry_stats
+            if (stats is None or
+                    time.monotonic() - self._entry_stats_loaded_at > ENTRY_STATS_RECONCILE_SECONDS):
+                version = self._entry_stats_version
+                stats = await self._load_entry_stats()
+                if version == self._entry_stats_version:
+                    self._entry_stats = stats
+                    self._entry_stats_loaded_at = time.monotonic()
+            min_date, max_date = stats["min_date"], stats["max_date"]
+            last_sync = await self.get_last_full_sync()
+            
+            # Get database file size
+            db_size_mb = 0.0
+            if os.path.exists(self.database_path):
+                db_size_mb = os.path.getsize(self.database_path) / (1024 * 1024)
+            
+            return {
+                "total_entries": stats["total_entries"],
+                "entries_with_content": stats["entries_with_content"],
+                "date_range": {
+                    "start": min_date.isoformat() if min_date else None,
+                    "end": max_date.isoformat() if max_date else None
+                } if min_date and max_date else None,
+                "last_sync": last_sync.isoformat() if last_sync else None,
+                "database_size_mb": round(db_size_mb, 2)
+            }
         except Exception as e:
             return {
                 "total_entries": 0,
@@ -485,9 +717,17 @@ class DatabaseManager:
             }
     
     @asynccontextmanager
-    async def get_session(self):
-        """Get database session with proper cleanup."""
-        async with self.SessionLocal() as session:
+    async def get_session(self, read_only: bool = False):
+        """Get database session with proper cleanup.
+
+        Args:
+            read_only: Use the read-only connection pool. Falls back to the
+                read-write pool if the read-only pool is not initialized.
+        """
+        session_factory = self.SessionLocal
+        if read_only and self.ReadSessionLocal is not None:
+            session_factory = self.ReadSessionLocal
+        async with session_factory() as session:
             try:
                 yield session
             except Exception:
@@ -496,10 +736,38 @@ class DatabaseManager:
             finally:
                 await session.close()
     
+    async def dispose(self):
+        """Close all pooled connections of both engines."""
+        if self.read_engine:
+            await self.read_engine.dispose()
+        if self.engine:
+            await self.engine.dispose()
+
+    async def get_performance_profile(self) -> Dict[str, Any]:
+        """Report the pragmas in effect on pooled connections and the pool sizes."""
+        profile: Dict[str, Any] = {
+            "pragmas": {},
+            "read_only_pragmas": {},
+            "pool": {
+                "pool_size": self.db_config.pool_size,
+                "max_overflow": self.db_config.max_overflow,
+                "read_pool_size": self.db_config.read_pool_size
+            }
+        }
+        for key, engine, read_only in (("pragmas", self.engine, False),
+                                       ("read_only_pragmas", self.read_engine, True)):
+            if engine is None:
+                continue
+            async with engine.connect() as conn:
+                for name in self._get_pragmas(read_only=read_only):
+                    result = await conn.execute(text(f"PRAGMA {name}"))
+                    profile[key][name] = result.scalar()
+        return profile
+
     async def health_check(self) -> Dict[str, Any]:
         """Check database health and return status."""
         try:
-            async with self.get_session() as session:
+            async with self.get_session(read_only=True) as session:
                 from sqlalchemy import text
                 result = await session.execute(text("SELECT 1"))
                 result.fetchone()
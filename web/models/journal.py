@@ -13,6 +13,9 @@ from typing import Optional, List, Dict, Any, Union
 from enum import Enum
 from web.utils.timezone_utils import to_local, format_local_datetime
 
+# Longest entry content accepted by full saves and by patched results
+MAX_ENTRY_CONTENT_LENGTH = 500_000
+
 
 class EntryStatus(str, Enum):
     """Entry status enumeration."""
@@ -44,12 +47,49 @@ class JournalEntryBase(BaseModel):
 
 class JournalEntryCreate(JournalEntryBase):
     """Model for creating journal entries."""
-    content: str = Field("", max_length=500_000, description="Entry content")
+    content: str = Field("", max_length=MAX_ENTRY_CONTENT_LENGTH, description="Entry content")
 
 
 class JournalEntryUpDate(BaseModel):
     """Model for updating journal entries."""
-    content: str = Field(..., max_length=500_000, description="Updated entry content")
+    content: str = Field(..., max_length=MAX_ENTRY_CONTENT_LENGTH, description="Updated entry content")
+
+
+class EntryContentEdit(BaseModel):
+    """A single splice of entry content, in code-point offsets of the base text."""
+    start: int = Field(..., ge=0, description="Start offset of the replaced range")
+    end: int = Field(..., ge=0, description="End offset (exclusive) of the replaced range")
+    text: str = Field("", max_length=MAX_ENTRY_CONTENT_LENGTH, description="Replacement text")
+
+    @model_validator(mode='after')
+    def validate_range(self):
+        """Validate that the replaced range is not inverted."""
+        if self.end < self.start:
+            raise ValueError('end must be greater than or equal to start')
+        return self
+
+
+class EntryContentPatch(BaseModel):
+    """Conditional save of entry content as a diff against a known base version."""
+    base_hash: Optional[str] = Field(
+        None, pattern="^[0-9a-f]{64}$",
+        description="SHA-256 of the content the edits apply to (None for a new entry)"
+    )
+    content_hash: str = Field(
+        ..., pattern="^[0-9a-f]{64}$",
+        description="SHA-256 of the content after the edits are applied"
+    )
+    edits: List[EntryContentEdit] = Field(
+        default_factory=list, max_length=1000,
+        description="Non-overlapping edits in ascending order"
+    )
+
+
+class EntryContentPatchResponse(BaseModel):
+    """Response model for conditional content saves."""
+    date: Date = Field(..., description="Entry date")
+    status: str = Field(..., pattern="^(saved|unchanged)$", description="Whether a write happened")
+    content_hash: str = Field(..., description="SHA-256 of the content now stored")
 
 
 class JournalEntryResponse(JournalEntryBase):
@@ -199,18 +239,16 @@ class EntryExportRequest(BaseModel):
     format: str = Field("json", pattern="^(json|csv|txt|markdown)$", description="Export format")
     include_metadata: bool = Field(True, description="Include entry metadata")
     include_empty_entries: bool = Field(False, description="Include entries without content")
+    compression: Optional[str] = Field(None, pattern="^(gzip|zip)$", description="Optional archive compression")
     
     @model_validator(mode='after')
-    def validate_export_range(cls, values):
+    def validate_export_range(self):
         """Validate export date range."""
-        start_date = values.get('start_date')
-        end_date = values.get('end_date')
-        
-        if start_date and end_date:
-            if start_date > end_date:
+        if self.start_date and self.end_date:
+            if self.start_date > self.end_date:
                 raise ValueError('start_date must be before or equal to end_date')
         
-        return values
+        return self
 
 
 class EntryValidationResult(BaseModel):
@@ -233,6 +271,14 @@ class TodayResponse(BaseModel):
     current_year: int = Field(..., description="Current year")
 
 
+class DashboardResponse(BaseModel):
+    """Response model for the dashboard bootstrap payload."""
+    today: TodayResponse = Field(..., description="Today's date and entry status")
+    recent_entries: RecentEntriesResponse = Field(..., description="Most recent entries")
+    stats: DatabaseStats = Field(..., description="Database statistics")
+    calendar: Optional[CalendarMonth] = Field(None, description="Requested calendar month, if any")
+
+
 class SummaryRequest(BaseModel):
     """Request model for summary generation."""
     summary_type: str = Field(..., pattern="^(weekly|monthly|custom)$", description="Type of summary")
@@ -275,4 +321,5 @@ class ProgressResponse(BaseModel):
     current_step: str = Field(..., description="Current processing step")
     status: str = Field(..., description="Task status")
     message: Optional[str] = Field(None, description="Progress message")
+    eta_seconds: Optional[float] = Field(None, description="Estimated seconds left in the current phase")
     timestamp: DateTime = Field(..., description="Update timestamp")
\ No newline at end of file
@@ -0,0 +1,98 @@
+# ABOUTME: Write-behind buffer for journal entry access statistics.
+# ABOUTME: Coalesces per-date read counters in memory and flushes them in one batched UPDATE.
+"""
+Access Statistics Buffer for Work Journal Maker Web Interface
+
+Reading an entry used to bump access_count/last_accessed_at with its own
+write transaction, turning every read into an SQLite write. This module keeps
+those counters in memory, coalesced per date, and writes them back in a single
+executemany. Access statistics are advisory, so losing the unflushed delta on
+a crash is acceptable.
+"""
+
+import threading
+from datetime import date, datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+from sqlalchemy import update, bindparam, func
+
+from web.database import DatabaseManager, JournalEntryIndex
+from web.utils.timezone_utils import now_utc
+
+
+class AccessStatsBuffer:
+    """In-memory, per-date accumulator for entry access counters."""
+
+    def __init__(self):
+        self._pending: Dict[date, Tuple[int, datetime]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of distinct dates waiting to be flushed."""
+        return len(self._pending)
+
+    def record(self, entry_date: date, accessed_at: Optional[datetime] = None) -> None:
+        """Record one access to an entry without touching the database."""
+        accessed_at = accessed_at or now_utc()
+        with self._lock:
+            count, last = self._pending.get(entry_date, (0, accessed_at))
+            self._pending[entry_date] = (count + 1, max(last, accessed_at))
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Remove and return all pending counters as executemany parameter rows."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return [
+            {"entry_date": entry_date, "increment": count, "accessed_at": last}
+            for entry_date, (count, last) in pending.items()
+        ]
+
+    def restore(self, rows: List[Dict[str, Any]]) -> None:
+        """Merge previously drained rows back, e.g. after a failed flush."""
+        with self._lock:
+            for row in rows:
+                count, last = self._pending.get(row["entry_date"], (0, row["accessed_at"]))
+                self._pending[row["entry_date"]] = (
+                    count + row["increment"], max(last, row["accessed_at"])
+                )
+
+    async def flush(self, db_manager: DatabaseManager) -> int:
+        """
+        Write all pending counters to the database in one batched UPDATE.
+
+        Args:
+            db_manager: Database manager to write through
+
+        Returns:
+            Number of dates flushed
+
+        Raises:
+            Exception: If the write fails; the counts are merged back first
+        """
+        rows = self.drain()
+        if not rows:
+            return 0
+
+        table = JournalEntryIndex.__table__
+        stmt = (
+            update(table)
+            .where(table.c.date == bindparam("entry_date"))
+            .values(
+                access_count=func.coalesce(table.c.access_count, 0) + bindparam("increment"),
+                last_accessed_at=bindparam("accessed_at"),
+                # Reads are not modifications; suppress the column's onupdate.
+                modified_at=table.c.modified_at,
+            )
+        )
+
+        try:
+            async with db_manager.get_session() as session:
+                await session.execute(stmt, rows)
+                await session.commit()
+        except BaseException:
+            # Includes cancellation of the flush task mid-write at shutdown
+            self.restore(rows)
+            raise
+
+        return len(rows)
@@ -21,7 +21,7 @@ from web.database import DatabaseManager, JournalEntryIndex
 from web.models.journal import CalendarEntry, CalendarMonth, EntryStatus
 from web.services.base_service import BaseService
 from web.utils.timezone_utils import now_local, to_local
-from sqlalchemy import select, and_, extract
+from sqlalchemy import select, and_, extract, func
 
 
 @dataclass
@@ -103,6 +103,50 @@ class CalendarService(BaseService):
             )
             raise
     
+    async def get_month_version(self, year: int, month: int) -> Tuple:
+        """
+        Get a cheap version token for a month's calendar data.
+
+        Aggregates the month's index rows in a single query instead of loading
+        them, so callers can build an ETag and skip get_calendar_month() when
+        nothing has changed. Today's date is part of the token because the
+        response marks the current day.
+        """
+        start_date = date(year, month, 1)
+        end_date = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+
+        async with self.db_manager.get_session(read_only=True) as session:
+            stmt = select(
+                func.count(JournalEntryIndex.id),
+                func.sum(JournalEntryIndex.word_count),
+                func.sum(JournalEntryIndex.has_content),
+                func.max(JournalEntryIndex.modified_at),
+                func.max(JournalEntryIndex.synced_at)
+            ).where(
+                and_(
+                    JournalEntryIndex.date >= start_date,
+                    JournalEntryIndex.date < end_date
+                )
+            )
+            row = (await session.execute(stmt)).one()
+
+        return (year, month, now_local().date(), *row)
+
+    async def get_today_version(self) -> Tuple:
+        """Get a cheap version token for the data returned by get_today_info()."""
+        today = now_local().date()
+
+        async with self.db_manager.get_session(read_only=True) as session:
+            stmt = select(
+                JournalEntryIndex.has_content,
+                JournalEntryIndex.word_count,
+                JournalEntryIndex.modified_at,
+                JournalEntryIndex.synced_at
+            ).where(JournalEntryIndex.date == today)
+            row = (await session.execute(stmt)).one_or_none()
+
+        return (today, *(row or ()))
+
     async def get_adjacent_months(self, year: int, month: int) -> Tuple[Tuple[int, int], Tuple[int, int]]:
         """Get previous and next month for navigation."""
         # Calculate previous month
@@ -122,7 +166,7 @@ class CalendarService(BaseService):
     async def has_entry_for_date(self, entry_date: date) -> bool:
         """Check if an entry exists for a specific date."""
         try:
-            async with self.db_manager.get_session() as session:
+            async with self.db_manager.get_session(read_only=True) as session:
                 stmt = select(JournalEntryIndex).where(JournalEntryIndex.date == entry_date)
                 result = await session.execute(stmt)
                 entry = result.scalar_one_or_none()
@@ -139,7 +183,7 @@ class CalendarService(BaseService):
     async def get_entries_for_date_range(self, start_date: date, end_date: date) -> List[CalendarEntry]:
         """Get all entries within a date range."""
         try:
-            async with self.db_manager.get_session() as session:
+            async with self.db_manager.get_session(read_only=True) as session:
                 stmt = (
                     select(JournalEntryIndex)
                     .where(
@@ -176,28 +220,37 @@ class CalendarService(BaseService):
         """Get week ending date using existing FileDiscovery logic."""
         return self.file_discovery._find_week_ending_for_date(entry_date)
     
+    async def _get_entry_metadata(self, entry_date: date) -> Optional[Dict[str, Any]]:
+        """Get metadata for an entry with content, or None if there is none."""
+        try:
+            async with self.db_manager.get_session(read_only=True) as session:
+                stmt = select(JournalEntryIndex).where(JournalEntryIndex.date == entry_date)
+                result = await session.execute(stmt)
+                entry = result.scalar_one_or_none()
+
+                if entry is None or not entry.has_content:
+                    return None
+                return {
+                    "word_count": entry.word_count,
+                    "has_content": entry.has_content,
+                    "modified_at": entry.modified_at
+                }
+
+        except Exception as e:
+            self.logger.log_error_with_category(
+                ErrorCategory.PROCESSING_ERROR,
+                f"Failed to get entry metadata for {entry_date}: {str(e)}"
+            )
+            return None
+
     async def get_today_info(self) -> Dict[str, Any]:
         """Get information about today's date and entry status."""
         today = now_local().date()
         
         try:
-            # Check if today has an entry
-            has_entry = await self.has_entry_for_date(today)
-            
-            # Get entry metadata if it exists
-            entry_metadata = None
-            if has_entry:
-                async with self.db_manager.get_session() as session:
-                    stmt = select(JournalEntryIndex).where(JournalEntryIndex.date == today)
-                    result = await session.execute(stmt)
-                    entry = result.scalar_one_or_none()
-                    
-                    if entry:
-                        entry_metadata = {
-                            "word_count": entry.word_count,
-                            "has_content": entry.has_content,
-                            "modified_at": entry.modified_at
-                        }
+            # One lookup answers both "has an entry" and its metadata
+            entry_metadata = await self._get_entry_metadata(today)
+            has_entry = entry_metadata is not None
             
             # Calculate week ending date using existing logic
             week_ending = self.file_discovery._find_week_ending_for_date(today)
@@ -232,7 +285,7 @@ class CalendarService(BaseService):
     async def _get_month_entries(self, year: int, month: int) -> Dict[date, Dict[str, Any]]:
         """Get all entries for a specific month from database."""
         try:
-            async with self.db_manager.get_session() as session:
+            async with self.db_manager.get_session(read_only=True) as session:
                 stmt = (
                     select(JournalEntryIndex)
                     .where(
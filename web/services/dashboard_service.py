@@ -0,0 +1,115 @@
+# ABOUTME: Aggregates the data the dashboard and calendar pages need on first paint.
+# ABOUTME: Gathers today/recent/stats/month reads concurrently and caches the payload briefly.
+"""
+Dashboard Service for Work Journal Maker Web Interface
+
+The dashboard used to bootstrap with three requests (today, recent entries,
+database stats) and the calendar page with two more, each opening its own
+database session. DashboardService runs those independent reads concurrently
+and returns them as one DashboardResponse. Payloads are cached for a few
+seconds and dropped as soon as EntryManager reports a saved or deleted entry.
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+
+from config_manager import AppConfig
+from logger import JournalSummarizerLogger
+from web.database import DatabaseManager
+from web.models.journal import DashboardResponse, DatabaseStats, TodayResponse
+from web.services.base_service import BaseService
+from web.services.calendar_service import CalendarService
+from web.services.entry_manager import EntryManager
+from web.utils.timezone_utils import now_local
+
+DASHBOARD_CACHE_TTL_SECONDS = 15.0
+# Most payloads kept at once; each (today, limit, year, month) is its own entry
+DASHBOARD_CACHE_MAX_ENTRIES = 32
+
+
+class DashboardService(BaseService):
+    """Builds and caches the dashboard bootstrap payload."""
+
+    def __init__(self, config: AppConfig, logger: JournalSummarizerLogger,
+                 db_manager: DatabaseManager, entry_manager: EntryManager,
+                 calendar_service: CalendarService,
+                 cache_ttl: float = DASHBOARD_CACHE_TTL_SECONDS):
+        """
+        Initialize DashboardService and subscribe to entry changes.
+
+        Args:
+            config: Application configuration
+            logger: Logger instance
+            db_manager: Database manager instance
+            entry_manager: Source of recent entries and change notifications
+            calendar_service: Source of today's info and month views
+            cache_ttl: Seconds a payload is reused (0 disables caching)
+        """
+        super().__init__(config, logger, db_manager)
+        self.entry_manager = entry_manager
+        self.calendar_service = calendar_service
+        self.cache_ttl = cache_ttl
+
+        # (today, recent limit, year, month) -> (expires at, payload)
+        self._cache: Dict[Tuple, Tuple[float, DashboardResponse]] = {}
+        # Bumped on invalidation so reads that straddle a save are not cached
+        self._generation = 0
+        entry_manager.add_change_listener(lambda entry_date: self.invalidate())
+
+    def invalidate(self) -> None:
+        """Drop every cached payload."""
+        self._generation += 1
+        self._cache.clear()
+
+    async def get_dashboard(self, recent_limit: int = 5, year: Optional[int] = None,
+                            month: Optional[int] = None) -> DashboardResponse:
+        """
+        Get today's info, recent entries, database stats and optionally a month.
+
+        Args:
+            recent_limit: Number of recent entries to include
+            year: Year of the calendar month to include (with month)
+            month: Month of the calendar month to include (with year)
+
+        Returns:
+            DashboardResponse for the current local date
+        """
+        # Today's date is part of the key so a cached payload never outlives midnight
+        key = (now_local().date(), recent_limit, year, month)
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        self._log_operation_start("get_dashboard", recent_limit=recent_limit, year=year, month=month)
+        generation = self._generation
+        reads = [
+            self.calendar_service.get_today_info(),
+            self.entry_manager.get_recent_entries(limit=recent_limit),
+            self.db_manager.get_database_stats(),
+        ]
+        if year is not None and month is not None:
+            reads.append(self.calendar_service.get_calendar_month(year, month))
+
+        today_info, recent_entries, stats, *calendar = await asyncio.gather(*reads)
+        payload = DashboardResponse(
+            today=TodayResponse(**today_info),
+            recent_entries=recent_entries,
+            stats=DatabaseStats(**stats),
+            calendar=calendar[0] if calendar else None,
+        )
+
+        if self.cache_ttl > 0 and generation == self._generation:
+            self._store(key, payload)
+        self._log_operation_success("get_dashboard")
+        return payload
+
+    def _store(self, key: Tuple, payload: DashboardResponse) -> None:
+        """Cache payload under key, dropping expired and then the oldest payloads."""
+        now = time.monotonic()
+        for stale in [k for k, (expires_at, _) in self._cache.items() if expires_at <= now]:
+            del self._cache[stale]
+        self._cache.pop(key, None)
+        while len(self._cache) >= DASHBOARD_CACHE_MAX_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (now + self.cache_ttl, payload)
@@ -0,0 +1,244 @@
+# ABOUTME: Streaming bulk export of journal entries in json, csv, txt or markdown.
+# ABOUTME: Reads entry files chunk by chunk in index order, optionally gzip- or zip-compressed.
+"""
+Entry Export for Work Journal Maker Web Interface
+
+This module turns an EntryExportRequest into an async stream of bytes
+suitable for a StreamingResponse. Index rows are paged from the database
+and entry files are read in fixed-size chunks, so memory use does not grow
+with the size of the export and the first bytes are sent immediately.
+"""
+
+import csv
+import io
+import json
+import zipfile
+import zlib
+from pathlib import Path
+from typing import AsyncIterator, Dict, Any
+
+import aiofiles
+
+from logger import ErrorCategory
+from web.database import JournalEntryIndex
+from web.models.journal import EntryExportRequest
+
+READ_CHUNK_SIZE = 64 * 1024
+
+FORMAT_EXTENSIONS = {
+    "json": "json",
+    "csv": "csv",
+    "txt": "txt",
+    "markdown": "md",
+}
+
+FORMAT_MEDIA_TYPES = {
+    "json": "application/json",
+    "csv": "text/csv; charset=utf-8",
+    "txt": "text/plain; charset=utf-8",
+    "markdown": "text/markdown; charset=utf-8",
+}
+
+CSV_METADATA_FIELDS = ["week_ending_date", "word_count", "character_count", "line_count"]
+
+
+class _ChunkSink:
+    """Write-only file object that collects bytes written by zipfile.
+
+    It has no tell()/seek(), so ZipFile falls back to streaming mode with
+    data descriptors and never needs to rewind.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class EntryExporter:
+    """
+    Streams journal entries in the format described by an EntryExportRequest.
+
+    Usage:
+        exporter = EntryExporter(entry_manager, request)
+        StreamingResponse(exporter.stream(), media_type=exporter.media_type)
+    """
+
+    def __init__(self, entry_manager, request: EntryExportRequest,
+                 chunk_size: int = READ_CHUNK_SIZE):
+        self.entry_manager = entry_manager
+        self.request = request
+        self.chunk_size = chunk_size
+
+    @property
+    def filename(self) -> str:
+        """Download filename reflecting the range, format and compression."""
+        start = self.request.start_date.isoformat() if self.request.start_date else "start"
+        end = self.request.end_date.isoformat() if self.request.end_date else "latest"
+        name = f"work_journal_{start}_to_{end}.{FORMAT_EXTENSIONS[self.request.format]}"
+        if self.request.compression == "gzip":
+            return name + ".gz"
+        if self.request.compression == "zip":
+            return name.rsplit(".", 1)[0] + ".zip"
+        return name
+
+    @property
+    def member_name(self) -> str:
+        """Name of the export file inside a zip archive."""
+        return self.filename.rsplit(".", 1)[0] + "." + FORMAT_EXTENSIONS[self.request.format]
+
+    @property
+    def media_type(self) -> str:
+        """Content type of the streamed response."""
+        if self.request.compression == "gzip":
+            return "application/gzip"
+        if self.request.compression == "zip":
+            return "application/zip"
+        return FORMAT_MEDIA_TYPES[self.request.format]
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """Yield the encoded (and optionally compressed) export."""
+        if self.request.compression == "gzip":
+            compressor = zlib.compressobj(wbits=31)
+            async for chunk in self._encoded():
+                data = compressor.compress(chunk)
+                if data:
+                    yield data
+            yield compressor.flush()
+
+        elif self.request.compression == "zip":
+            sink = _ChunkSink()
+            with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+                with archive.open(self.member_name, mode="w", force_zip64=True) as member:
+                    async for chunk in self._encoded():
+                        member.write(chunk)
+                        data = sink.drain()
+                        if data:
+                            yield data
+            yield sink.drain()
+
+        else:
+            async for chunk in self._encoded():
+                yield chunk
+
+    async def _encoded(self) -> AsyncIterator[bytes]:
+        async for text in self._formatted():
+            if text:
+                yield text.encode("utf-8")
+
+    async def _formatted(self) -> AsyncIterator[str]:
+        """Yield the export as text fragments, one file chunk at a time."""
+        fmt = self.request.format
+        include_metadata = self.request.include_metadata
+
+        if fmt == "json":
+            yield "["
+        elif fmt == "csv":
+            header = ["date"] + (CSV_METADATA_FIELDS if include_metadata else []) + ["content"]
+            yield self._csv_row(header) + "\r\n"
+
+        first = True
+        async for entry in self.entry_manager.iter_export_entries(
+            start_date=self.request.start_date,
+            end_date=self.request.end_date,
+            include_empty=self.request.include_empty_entries
+        ):
+            separator = "" if first else "\n"
+
+            if fmt == "json":
+                record = {"date": entry.date.isoformat()}
+                if include_metadata:
+                    record["metadata"] = self._metadata(entry)
+                # Open the content string; chunks are escaped as they are read
+                yield ("" if first else ",") + json.dumps(record)[:-1] + ', "content": "'
+                async for chunk in self._read_chunks(entry.file_path):
+                    yield json.dumps(chunk)[1:-1]
+                yield '"}'
+
+            elif fmt == "csv":
+                values = [entry.date.isoformat()]
+                if include_metadata:
+                    metadata = self._metadata(entry)
+                    values += [metadata[field] for field in CSV_METADATA_FIELDS]
+                yield self._csv_row(values) + ',"'
+                async for chunk in self._read_chunks(entry.file_path):
+                    yield chunk.replace('"', '""')
+                yield '"\r\n'
+
+            elif fmt == "txt":
+                yield f"{separator}===== {entry.date.isoformat()} =====\n"
+                if include_metadata:
+                    yield self._metadata_line(entry) + "\n"
+                yield "\n"
+                async for chunk in self._read_chunks(entry.file_path):
+                    yield chunk
+                yield "\n"
+
+            else:
+                yield f"{separator}## {entry.date.strftime('%A, %B %d, %Y')}\n\n"
+                if include_metadata:
+                    yield f"*{self._metadata_line(entry)}*\n\n"
+                async for chunk in self._read_chunks(entry.file_path):
+                    yield chunk
+                yield "\n"
+
+            first = False
+
+        if fmt == "json":
+            yield "]"
+
+    async def _read_chunks(self, file_path: str) -> AsyncIterator[str]:
+        """Yield the entry file in chunks; a missing file exports as empty content.
+
+        An unreadable or undecodable file is logged and its content ends where
+        the error occurred, so one bad entry never aborts the whole export.
+        """
+        try:
+            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
+                while True:
+                    chunk = await f.read(self.chunk_size)
+                    if not chunk:
+                        return
+                    yield chunk
+        except FileNotFoundError:
+            return
+        except (OSError, UnicodeDecodeError) as e:
+            self.entry_manager.logger.log_error_with_category(
+                ErrorCategory.FILE_ACCESS_ERROR,
+                "Could not read entry file during export",
+                exception=e,
+                file_path=Path(file_path),
+                recovery_action="Exported the content read before the error"
+            )
+            return
+
+    @staticmethod
+    def _metadata(entry: JournalEntryIndex) -> Dict[str, Any]:
+        return {
+            "week_ending_date": entry.week_ending_date.isoformat() if entry.week_ending_date else None,
+            "word_count": entry.word_count or 0,
+            "character_count": entry.character_count or 0,
+            "line_count": entry.line_count or 0,
+        }
+
+    @classmethod
+    def _metadata_line(cls, entry: JournalEntryIndex) -> str:
+        metadata = cls._metadata(entry)
+        return (f"Week ending {metadata['week_ending_date']} · "
+                f"{metadata['word_count']} words · {metadata['line_count']} lines")
+
+    @staticmethod
+    def _csv_row(values) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="").writerow(values)
+        return buffer.getvalue()
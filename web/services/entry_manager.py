@@ -9,12 +9,14 @@ between the web interface and the existing file system operations.
 """
 
 import asyncio
+import hashlib
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Callable, List, Optional, Dict, Any, Tuple, AsyncIterator
 import aiofiles
 import os
 import tempfile
+import weakref
 from contextlib import asynccontextmanager
 
 from file_discovery import FileDiscovery, FileDiscoveryResult
@@ -23,8 +25,9 @@ from logger import JournalSummarizerLogger, ErrorCategory
 from web.database import DatabaseManager, JournalEntryIndex
 from web.models.journal import (
     JournalEntryResponse, JournalEntryMetadata, EntryStatus,
-    RecentEntriesResponse, EntryListRequest
+    RecentEntriesResponse, EntryListRequest, EntryContentEdit, MAX_ENTRY_CONTENT_LENGTH
 )
+from web.services.access_stats import AccessStatsBuffer
 from web.services.base_service import BaseService
 from web.services.work_week_service import WorkWeekService
 from web.utils.timezone_utils import now_utc, to_local
@@ -33,6 +36,18 @@ from sqlalchemy import select, update, delete, and_, or_
 from sqlalchemy.exc import IntegrityError
 
 
+class EntryConflictError(Exception):
+    """Raised when a patch targets a base version that is no longer current."""
+
+    def __init__(self, current_hash: str):
+        super().__init__("Entry content changed since the base version")
+        self.current_hash = current_hash
+
+
+class EntryPatchError(Exception):
+    """Raised when edits cannot be applied or do not produce the expected content."""
+
+
 class EntryManager(BaseService):
     """
     Manages journal entries by wrapping the existing FileDiscovery system
@@ -74,6 +89,72 @@ class EntryManager(BaseService):
         self._settings_cache_expiry = None
         self._settings_cache_ttl = 300  # 5 minutes
         
+        # Content hashes keyed by date, validated against (mtime_ns, size)
+        self._content_hash_cache: Dict[date, Tuple[int, int, str]] = {}
+        
+        # Serializes patch read-check-write per date; unused locks are dropped
+        self._entry_write_locks: "weakref.WeakValueDictionary[date, asyncio.Lock]" = weakref.WeakValueDictionary()
+        
+        # Write-behind buffer for access statistics (keeps reads read-only)
+        self.access_stats = AccessStatsBuffer()
+        self._access_stats_flush_interval = 60  # seconds
+        self._access_stats_task: Optional[asyncio.Task] = None
+        
+        # Callbacks told which date changed after a save or delete
+        self._change_listeners: List[Callable[[date], None]] = []
+    
+    def add_change_listener(self, listener: Callable[[date], None]) -> None:
+        """Register a callback invoked with the entry date after it is saved or deleted."""
+        self._change_listeners.append(listener)
+    
+    def _notify_entry_changed(self, entry_date: date) -> None:
+        for listener in self._change_listeners:
+            try:
+                listener(entry_date)
+            except Exception as e:
+                self.logger.logger.warning(f"Entry change listener failed for {entry_date}: {str(e)}")
+    
+    def start_access_stats_flush(self) -> None:
+        """Start the background task that periodically flushes access statistics."""
+        if self._access_stats_task is None or self._access_stats_task.done():
+            self._access_stats_task = asyncio.create_task(self._access_stats_flush_loop())
+    
+    async def stop_access_stats_flush(self) -> None:
+        """Stop the periodic flush task and write out any pending statistics."""
+        if self._access_stats_task:
+            self._access_stats_task.cancel()
+            try:
+                await self._access_stats_task
+            except asyncio.CancelledError:
+                pass
+            self._access_stats_task = None
+        await self.flush_access_stats()
+    
+    async def flush_access_stats(self) -> int:
+        """
+        Flush buffered access statistics to the database.
+        
+        A failed flush keeps the counts buffered for the next attempt.
+        
+        Returns:
+            Number of entry dates written
+        """
+        try:
+            return await self.access_stats.flush(self.db_manager)
+        except Exception as e:
+            self.logger.log_error_with_category(
+                ErrorCategory.DATABASE_ERROR,
+                f"Failed to flush entry access statistics: {str(e)}",
+                exception=e,
+                recovery_action=f"Keeping {self.access_stats.pending_count} dates buffered for the next flush"
+            )
+            return 0
+    
+    async def _access_stats_flush_loop(self) -> None:
+        """Flush access statistics every flush interval until cancelled."""
+        while True:
+            await asyncio.sleep(self._access_stats_flush_interval)
+            await self.flush_access_stats()
     
     async def _get_current_settings(self) -> Dict[str, Any]:
         """Get current settings from database with caching."""
@@ -161,6 +242,9 @@ class EntryManager(BaseService):
             async with aiofiles.open(file_path, 'r', encoding='utf-8') as file:
                 content = await file.read()
             
+            # Remember the hash so the editor's first conditional save is stat-only
+            self._remember_content_hash(entry_date, file_path, self.compute_content_hash(content))
+            
             # Update database index with access information
             await self._update_entry_access(entry_date, file_path)
             
@@ -176,6 +260,9 @@ class EntryManager(BaseService):
         """
         Save content for a specific journal entry date.
         
+        Waits for any patch of the same date, so a full save never lands
+        between a patch's base version check and its write.
+        
         Args:
             entry_date: Date of the entry to save
             content: Content to save
@@ -183,6 +270,11 @@ class EntryManager(BaseService):
         Returns:
             True if save was successful, False otherwise
         """
+        async with self._entry_write_lock(entry_date):
+            return await self._save_entry_content_locked(entry_date, content)
+    
+    async def _save_entry_content_locked(self, entry_date: date, content: str) -> bool:
+        """Save entry content; the caller holds _entry_write_lock(entry_date)."""
         self._log_operation_start("save_entry_content", date=entry_date, 
                                 content_length=len(content))
         
@@ -210,8 +302,11 @@ class EntryManager(BaseService):
                 tmp_file.unlink(missing_ok=True)
                 raise
             
+            self._remember_content_hash(entry_date, file_path, self.compute_content_hash(content))
+            
             # Update database index
             await self._sync_entry_to_database(entry_date, file_path, content)
+            self._notify_entry_changed(entry_date)
             
             self._log_operation_success("save_entry_content", date=entry_date)
             return True
@@ -220,6 +315,129 @@ class EntryManager(BaseService):
             self._log_operation_error("save_entry_content", e, date=entry_date)
             return False
     
+    async def patch_entry_content(self, entry_date: date, base_hash: Optional[str],
+                                  content_hash: str, edits: List[EntryContentEdit]) -> Dict[str, Any]:
+        """
+        Conditionally save entry content from a diff against a known base version.
+        
+        When the stored content already matches content_hash nothing is written.
+        Otherwise the edits are applied to the stored content, which must match
+        base_hash, and the result must hash to content_hash.
+        
+        Args:
+            entry_date: Date of the entry to save
+            base_hash: SHA-256 of the content the edits apply to (None for a new entry)
+            content_hash: SHA-256 of the content after the edits
+            edits: Non-overlapping edits in ascending order
+            
+        Returns:
+            Dict with status ("saved" or "unchanged") and the stored content hash
+            
+        Raises:
+            EntryConflictError: If the stored content no longer matches base_hash
+            EntryPatchError: If the edits are invalid, produce unexpected content
+                or produce content longer than MAX_ENTRY_CONTENT_LENGTH
+        """
+        self._log_operation_start("patch_entry_content", date=entry_date, edits=len(edits))
+        
+        async with self._entry_write_lock(entry_date):
+            await self._ensure_file_discovery_initialized()
+            file_path = await self._construct_file_path_async(entry_date)
+            if not file_path.exists():
+                legacy_file_path = await self._try_find_entry_in_legacy_structure(entry_date)
+                if legacy_file_path and legacy_file_path.exists():
+                    file_path = legacy_file_path
+            
+            current_content = None
+            current_hash = self._get_cached_content_hash(entry_date, file_path)
+            if current_hash is None:
+                current_content = await self._read_entry_file(file_path)
+                current_hash = self.compute_content_hash(current_content)
+                if current_content or file_path.exists():
+                    self._remember_content_hash(entry_date, file_path, current_hash)
+            
+            # Idle autosave: the stored content is already what the client has
+            if content_hash == current_hash:
+                self._log_operation_success("patch_entry_content", date=entry_date, status="unchanged")
+                return {"status": "unchanged", "content_hash": current_hash}
+            
+            is_new_entry = not file_path.exists()
+            if base_hash != current_hash and not (base_hash is None and is_new_entry):
+                raise EntryConflictError(current_hash)
+            
+            if current_content is None:
+                current_content = await self._read_entry_file(file_path)
+            new_content = self._apply_content_edits(current_content, edits)
+            if len(new_content) > MAX_ENTRY_CONTENT_LENGTH:
+                raise EntryPatchError(
+                    f"Patched content exceeds {MAX_ENTRY_CONTENT_LENGTH} characters"
+                )
+            if self.compute_content_hash(new_content) != content_hash:
+                raise EntryPatchError("Patched content does not match content_hash")
+            
+            if not await self._save_entry_content_locked(entry_date, new_content):
+                raise RuntimeError(f"Failed to save entry content for {entry_date}")
+            
+            self._log_operation_success("patch_entry_content", date=entry_date, status="saved")
+            return {"status": "saved", "content_hash": content_hash}
+    
+    def _entry_write_lock(self, entry_date: date) -> asyncio.Lock:
+        """Lock held around one save or patch of entry_date, shared by all writers."""
+        lock = self._entry_write_locks.get(entry_date)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._entry_write_locks[entry_date] = lock
+        return lock
+    
+    @staticmethod
+    def compute_content_hash(content: str) -> str:
+        """Return the SHA-256 hex digest of entry content encoded as UTF-8."""
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _apply_content_edits(content: str, edits: List[EntryContentEdit]) -> str:
+        """Apply non-overlapping, ascending splices to content."""
+        pieces = []
+        position = 0
+        for edit in edits:
+            if edit.start < position or edit.end > len(content):
+                raise EntryPatchError("Edits must be in range, ascending and non-overlapping")
+            pieces.append(content[position:edit.start])
+            pieces.append(edit.text)
+            position = edit.end
+        pieces.append(content[position:])
+        return "".join(pieces)
+    
+    async def _read_entry_file(self, file_path: Path) -> str:
+        """Read an entry file, treating a missing file as empty content."""
+        if not file_path.exists():
+            return ""
+        async with aiofiles.open(file_path, 'r', encoding='utf-8') as file:
+            return await file.read()
+    
+    def _get_cached_content_hash(self, entry_date: date, file_path: Path) -> Optional[str]:
+        """Return the cached content hash if the file is unchanged since it was hashed."""
+        cached = self._content_hash_cache.get(entry_date)
+        if cached is None:
+            return None
+        try:
+            stats = file_path.stat()
+        except OSError:
+            return None
+        mtime_ns, size, content_hash = cached
+        if stats.st_mtime_ns == mtime_ns and stats.st_size == size:
+            return content_hash
+        return None
+    
+    def _remember_content_hash(self, entry_date: date, file_path: Path, content_hash: str) -> None:
+        """Cache a content hash together with the file's current mtime and size."""
+        try:
+            stats = file_path.stat()
+        except OSError:
+            self._content_hash_cache.pop(entry_date, None)
+            return
+        self._content_hash_cache[entry_date] = (stats.st_mtime_ns, stats.st_size, content_hash)
+    
     def is_work_week_service_available(self) -> bool:
         """
         Check if WorkWeekService is available for use.
@@ -278,7 +496,7 @@ class EntryManager(BaseService):
         self._log_operation_start("get_recent_entries", limit=limit)
         
         try:
-            async with self.db_manager.get_session() as session:
+            async with self.db_manager.get_session(read_only=True) as session:
                 # Query recent entries from database index
                 stmt = (
                     select(JournalEntryIndex)
@@ -336,7 +554,7 @@ class EntryManager(BaseService):
                                 offset=request.offset)
         
         try:
-            async with self.db_manager.get_session() as session:
+            async with self.db_manager.get_session(read_only=True) as session:
                 # Build query with filters
                 stmt = select(JournalEntryIndex)
                 
@@ -419,6 +637,51 @@ class EntryManager(BaseService):
                                     end_date=request.end_date)
             return RecentEntriesResponse(entries=[], total_count=0, has_more=False, pagination={})
     
+    async def iter_export_entries(self, start_date: Optional[date] = None,
+                                  end_date: Optional[date] = None,
+                                  include_empty: bool = False,
+                                  batch_size: int = 200) -> AsyncIterator[JournalEntryIndex]:
+        """
+        Yield indexed entries in date order for export.
+
+        Uses keyset pagination on the date column so memory stays bounded by
+        batch_size no matter how many years are exported, and releases the
+        read session between batches.
+
+        Args:
+            start_date: Optional inclusive lower bound
+            end_date: Optional inclusive upper bound
+            include_empty: Whether to include entries without content
+            batch_size: Number of index rows fetched per query
+        """
+        last_date = None
+        while True:
+            conditions = []
+            if start_date:
+                conditions.append(JournalEntryIndex.date >= start_date)
+            if end_date:
+                conditions.append(JournalEntryIndex.date <= end_date)
+            if not include_empty:
+                conditions.append(JournalEntryIndex.has_content == True)
+            if last_date is not None:
+                conditions.append(JournalEntryIndex.date > last_date)
+
+            async with self.db_manager.get_session(read_only=True) as session:
+                stmt = (
+                    select(JournalEntryIndex)
+                    .where(*conditions)
+                    .order_by(JournalEntryIndex.date)
+                    .limit(batch_size)
+                )
+                batch = (await session.execute(stmt)).scalars().all()
+
+            for entry in batch:
+                yield entry
+
+            if len(batch) < batch_size:
+                return
+            last_date = batch[-1].date
+
     async def get_entry_by_date(self, entry_date: date, include_content: bool = False) -> Optional[JournalEntryResponse]:
         """
         Get a specific entry by date with optional content.
@@ -465,6 +728,44 @@ class EntryManager(BaseService):
             self._log_operation_error("get_entry_by_date", e, date=entry_date)
             return None
     
+    async def get_entry_version(self, entry_date: date,
+                                include_content: bool = False) -> Optional[Tuple]:
+        """
+        Get a cheap version token for the response of get_entry_by_date().
+
+        Reads only the index row's timestamps (plus a stat of the file when
+        content is included, since the file can change outside the web UI).
+        Access statistics are left out: every read records one, so including
+        them would change the token on each access-stats flush.
+
+        Returns:
+            Version tuple, or None if the entry is not indexed yet
+        """
+        async with self.db_manager.get_session(read_only=True) as session:
+            stmt = select(
+                JournalEntryIndex.file_path,
+                JournalEntryIndex.modified_at,
+                JournalEntryIndex.synced_at
+            ).where(JournalEntryIndex.date == entry_date)
+            row = (await session.execute(stmt)).one_or_none()
+
+        if row is None:
+            return None
+
+        file_version = None
+        if include_content:
+            try:
+                stat = os.stat(row.file_path)
+                file_version = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+
+        return (entry_date, include_content, row.modified_at, row.synced_at, file_version)
+
+    def record_entry_access(self, entry_date: date) -> None:
+        """Count an entry read that was answered without calling get_entry_by_date()."""
+        self.access_stats.record(entry_date)
+
     async def delete_entry(self, entry_date: date) -> bool:
         """
         Delete an entry (both file and database record).
@@ -486,12 +787,19 @@ class EntryManager(BaseService):
             # Delete file if it exists
             if file_path.exists():
                 file_path.unlink()
+            self._content_hash_cache.pop(entry_date, None)
             
             # Remove from database
             async with self.db_manager.get_session() as session:
+                had_content = await session.scalar(
+                    select(JournalEntryIndex.has_content).where(JournalEntryIndex.date == entry_date)
+                )
                 delete_stmt = delete(JournalEntryIndex).where(JournalEntryIndex.date == entry_date)
                 await session.execute(delete_stmt)
+                if had_content is not None:
+                    self.db_manager.record_entry_removal(session, entry_date, had_content)
                 await session.commit()
+            self._notify_entry_changed(entry_date)
             
             self._log_operation_success("delete_entry", date=entry_date)
             return True
@@ -615,6 +923,12 @@ class EntryManager(BaseService):
                     synced_at=now_utc()
                 )
                 session.add(new_entry)
+
+            self.db_manager.record_entry_upsert(
+                session, entry_date,
+                existing_entry.has_content if existing_entry else None,
+                metadata["has_content"]
+            )
                 
         except Exception as e:
             self.logger.logger.error(f"Failed to sync entry {entry_date} to database: {str(e)}")
@@ -671,21 +985,8 @@ class EntryManager(BaseService):
             return None
     
     async def _update_entry_access(self, entry_date: date, file_path: Path) -> None:
-        """Update entry access statistics in database."""
-        try:
-            async with self.db_manager.get_session() as session:
-                update_stmt = (
-                    update(JournalEntryIndex)
-                    .where(JournalEntryIndex.date == entry_date)
-                    .values(
-                        last_accessed_at=now_utc(),
-                        access_count=JournalEntryIndex.access_count + 1
-                    )
-                )
-                await session.execute(update_stmt)
-                await session.commit()
-        except Exception as e:
-            self.logger.logger.info(f"Failed to update entry access for {entry_date}: {str(e)}")
+        """Record an entry access in the write-behind buffer (flushed periodically)."""
+        self.access_stats.record(entry_date)
     
     async def _calculate_week_ending_date(self, entry_date: date) -> date:
         """
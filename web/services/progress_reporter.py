@@ -0,0 +1,118 @@
+# ABOUTME: Throttled progress reporting for web summarization tasks.
+# ABOUTME: Coalesces per-file callbacks from worker threads into rate-limited updates with an ETA.
+"""
+Progress Reporter for Work Journal Maker Web Interface
+
+Pipeline phases call back once per file or summary period from an executor
+thread. Forwarding each call to the WebSocket would flood every open tab, so
+ProgressReporter keeps only the latest count, publishes at most once per
+min_interval on the event loop, and derives throughput and an ETA for the
+current phase from the time spent on it so far.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Tuple
+
+PROGRESS_MIN_INTERVAL_SECONDS = 0.5
+
+
+@dataclass
+class ProgressSnapshot:
+    """Progress of a task, ready to publish."""
+    progress: float
+    current_step: str
+    items_per_second: Optional[float] = None
+    eta_seconds: Optional[float] = None
+
+
+class ProgressReporter:
+    """
+    Maps item counts within a phase onto a task's overall percentage.
+
+    Usage (on the event loop):
+        reporter = ProgressReporter(loop, publish)
+        await reporter.start_phase("Analyzing content", 50.0, 80.0, unit="files")
+        await loop.run_in_executor(None, work, reporter.report)
+        await reporter.flush()
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop,
+                 publish: Callable[[ProgressSnapshot], Awaitable[None]],
+                 min_interval: float = PROGRESS_MIN_INTERVAL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            loop: Event loop that publish runs on.
+            publish: Coroutine function that delivers a snapshot.
+            min_interval: Minimum seconds between item-count updates.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self._loop = loop
+        self._publish = publish
+        self.min_interval = min_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._latest: Optional[Tuple[int, int]] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._last_sent = float("-inf")
+        self._label = ""
+        self._unit = "items"
+        self._start = 0.0
+        self._end = 0.0
+        self._phase_started = clock()
+
+    async def start_phase(self, label: str, start: float, end: float, unit: str = "items") -> None:
+        """Flush the previous phase and announce a new one spanning start..end percent."""
+        await self.flush()
+        self._label = label
+        self._unit = unit
+        self._start = start
+        self._end = end
+        self._phase_started = self._clock()
+        await self._publish(ProgressSnapshot(progress=start, current_step=label))
+
+    def report(self, completed: int, total: int) -> None:
+        """Record progress within the current phase. Safe to call from any thread."""
+        with self._lock:
+            pending = self._latest is not None
+            self._latest = (completed, total)
+        if not pending:
+            self._loop.call_soon_threadsafe(self._schedule)
+
+    async def flush(self) -> None:
+        """Publish the latest unsent count immediately, if any."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        with self._lock:
+            latest, self._latest = self._latest, None
+        if latest is None:
+            return
+        self._last_sent = self._clock()
+        await self._publish(self._snapshot(*latest))
+
+    def _schedule(self) -> None:
+        if self._handle is not None:
+            return
+        delay = max(0.0, self._last_sent + self.min_interval - self._clock())
+        self._handle = self._loop.call_later(delay, self._fire)
+
+    def _fire(self) -> None:
+        self._handle = None
+        self._loop.create_task(self.flush())
+
+    def _snapshot(self, completed: int, total: int) -> ProgressSnapshot:
+        fraction = min(1.0, completed / total) if total > 0 else 1.0
+        progress = self._start + (self._end - self._start) * fraction
+        current_step = f"{self._label} ({completed}/{total} {self._unit})"
+
+        elapsed = self._clock() - self._phase_started
+        if completed <= 0 or elapsed <= 0:
+            return ProgressSnapshot(progress=progress, current_step=current_step)
+        rate = completed / elapsed
+        return ProgressSnapshot(progress=progress, current_step=current_step,
+                                items_per_second=rate,
+                                eta_seconds=max(0, total - completed) / rate)
@@ -152,6 +152,7 @@ class SyncScheduler:
                     
                     if await self._run_full_sync():
                         last_full_sync = current_time
+                        await self._compact_sync_history()
                 
                 # Sleep for a short interval
                 await asyncio.sleep(60)  # Check every minute
@@ -225,6 +226,13 @@ class SyncScheduler:
             self.logger.log_error_with_category(ErrorCategory.DATABASE_ERROR, f"Full sync failed: {str(e)}")
             return False
     
+    async def _compact_sync_history(self):
+        """Roll expired sync history into daily aggregates so it stays small."""
+        try:
+            await self.sync_service.compact_sync_history()
+        except Exception as e:
+            self.logger.log_error_with_category(ErrorCategory.DATABASE_ERROR, f"Sync history compaction failed: {str(e)}")
+    
     def get_scheduler_status(self) -> Dict[str, Any]:
         """Get current scheduler status and statistics."""
         return {
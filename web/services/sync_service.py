@@ -20,10 +20,11 @@ import json
 from file_discovery import FileDiscovery, FileDiscoveryResult
 from config_manager import AppConfig
 from logger import JournalSummarizerLogger, ErrorCategory
-from web.database import DatabaseManager, JournalEntryIndex, SyncStatus
+from web.database import DatabaseManager, JournalEntryIndex, SyncStatus, SyncHistoryDaily
 from web.utils.error_utils import sanitize_error_message
 from sqlalchemy import select, update, delete, and_, or_, func
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
 
 
 class SyncType(Enum):
@@ -148,6 +149,7 @@ class DatabaseSyncService:
             
             await self._record_sync_completion(sync_id, sync_result)
             self._last_full_sync = datetime.utcnow()
+            self.db_manager.record_full_sync_completed(sync_result.completed_at)
             
             self.logger.logger.info(f"Full sync completed: {sync_result.entries_processed} processed, "
                            f"{sync_result.entries_added} added, {sync_result.entries_updated} updated, "
@@ -328,6 +330,7 @@ class DatabaseSyncService:
                             existing_entry.file_modified_at < datetime.fromtimestamp(file_stats.st_mtime)):
                             
                             # Update existing entry
+                            previous_has_content = existing_entry.has_content
                             update_stmt = (
                                 update(JournalEntryIndex)
                                 .where(JournalEntryIndex.date == entry_date)
@@ -345,6 +348,9 @@ class DatabaseSyncService:
                                 )
                             )
                             await session.execute(update_stmt)
+                            self.db_manager.record_entry_upsert(
+                                session, entry_date, previous_has_content, content_metadata["has_content"]
+                            )
                             result["updated"] += 1
                     else:
                         # Create new entry
@@ -363,6 +369,9 @@ class DatabaseSyncService:
                             synced_at=datetime.utcnow()
                         )
                         session.add(new_entry)
+                        self.db_manager.record_entry_upsert(
+                            session, entry_date, None, content_metadata["has_content"]
+                        )
                         result["added"] += 1
                     
                     result["processed"] += 1
@@ -393,14 +402,16 @@ class DatabaseSyncService:
                     if entry.file_path not in existing_paths:
                         # Double-check that file doesn't exist
                         if not Path(entry.file_path).exists():
-                            entries_to_remove.append(entry.date)
+                            entries_to_remove.append((entry.date, entry.has_content))
                 
                 # Remove orphaned entries
                 if entries_to_remove:
                     delete_stmt = delete(JournalEntryIndex).where(
-                        JournalEntryIndex.date.in_(entries_to_remove)
+                        JournalEntryIndex.date.in_([entry_date for entry_date, _ in entries_to_remove])
                     )
                     await session.execute(delete_stmt)
+                    for entry_date, had_content in entries_to_remove:
+                        self.db_manager.record_entry_removal(session, entry_date, had_content)
                     await session.commit()
                     result["removed"] = len(entries_to_remove)
                     
@@ -416,8 +427,13 @@ class DatabaseSyncService:
         """Remove a specific entry from the database."""
         try:
             async with self.db_manager.get_session() as session:
+                had_content = await session.scalar(
+                    select(JournalEntryIndex.has_content).where(JournalEntryIndex.date == entry_date)
+                )
                 delete_stmt = delete(JournalEntryIndex).where(JournalEntryIndex.date == entry_date)
                 await session.execute(delete_stmt)
+                if had_content is not None:
+                    self.db_manager.record_entry_removal(session, entry_date, had_content)
                 await session.commit()
         except Exception as e:
             self.logger.log_error_with_category(ErrorCategory.DATABASE_ERROR, f"Failed to remove entry {entry_date} from database: {str(e)}")
@@ -509,9 +525,125 @@ class DatabaseSyncService:
             await session.execute(update_stmt)
             await session.commit()
     
+    async def compact_sync_history(self, retention_days: Optional[int] = None) -> Dict[str, int]:
+        """
+        Roll sync_status rows older than the retention window into daily aggregates.
+
+        The newest completed row of each sync type is always kept so "last sync"
+        lookups keep answering from sync_status.
+
+        Args:
+            retention_days: Days of raw rows to keep; defaults to the database config
+
+        Returns:
+            Counts of raw rows compacted and daily aggregate rows written
+        """
+        if retention_days is None:
+            retention_days = self.db_manager.db_config.sync_history_retention_days
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+
+        async with self.db_manager.get_session() as session:
+            newer = aliased(SyncStatus)
+            latest_completed_at = (
+                select(func.max(newer.completed_at))
+                .where(and_(newer.sync_type == SyncStatus.sync_type, newer.status == "completed"))
+                .scalar_subquery()
+            )
+            is_latest_completed = and_(SyncStatus.status == "completed",
+                                       SyncStatus.completed_at == latest_completed_at)
+            expired = and_(SyncStatus.started_at < cutoff, ~is_latest_completed)
+
+            day = func.date(SyncStatus.started_at)
+            duration = (func.julianday(SyncStatus.completed_at) - func.julianday(SyncStatus.started_at)) * 86400
+            rollup_stmt = (
+                select(
+                    day, SyncStatus.sync_type, SyncStatus.status, func.count(SyncStatus.id),
+                    func.coalesce(func.sum(SyncStatus.entries_processed), 0),
+                    func.coalesce(func.sum(SyncStatus.entries_added), 0),
+                    func.coalesce(func.sum(SyncStatus.entries_updated), 0),
+                    func.coalesce(func.sum(SyncStatus.entries_removed), 0),
+                    func.coalesce(func.sum(duration), 0.0),
+                    func.max(SyncStatus.completed_at)
+                )
+                .where(expired)
+                .group_by(day, SyncStatus.sync_type, SyncStatus.status)
+            )
+            groups = (await session.execute(rollup_stmt)).all()
+            if not groups:
+                return {"rows_compacted": 0, "days_written": 0}
+
+            rows_compacted = 0
+            for (day_str, sync_type, status, runs, processed, added, updated,
+                 removed, duration_seconds, last_completed_at) in groups:
+                rollup_day = date.fromisoformat(day_str)
+                rollup = await session.scalar(
+                    select(SyncHistoryDaily).where(and_(
+                        SyncHistoryDaily.day == rollup_day,
+                        SyncHistoryDaily.sync_type == sync_type,
+                        SyncHistoryDaily.status == status
+                    ))
+                )
+                if rollup is None:
+                    rollup = SyncHistoryDaily(day=rollup_day, sync_type=sync_type, status=status,
+                                              runs=0, entries_processed=0, entries_added=0,
+                                              entries_updated=0, entries_removed=0,
+                                              total_duration_seconds=0.0)
+                    session.add(rollup)
+                rollup.runs += runs
+                rollup.entries_processed += processed
+                rollup.entries_added += added
+                rollup.entries_updated += updated
+                rollup.entries_removed += removed
+                rollup.total_duration_seconds += duration_seconds
+                if last_completed_at is not None and (
+                        rollup.last_completed_at is None or last_completed_at > rollup.last_completed_at):
+                    rollup.last_completed_at = last_completed_at
+                rows_compacted += runs
+
+            await session.execute(delete(SyncStatus).where(expired))
+            await session.commit()
+
+        self.logger.logger.info(f"Compacted {rows_compacted} sync history rows into {len(groups)} daily aggregates")
+        return {"rows_compacted": rows_compacted, "days_written": len(groups)}
+
+    async def get_daily_sync_history(self, days: int = 90,
+                                     sync_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get daily aggregates of compacted sync history, newest day first."""
+        since = date.today() - timedelta(days=days)
+        async with self.db_manager.get_session(read_only=True) as session:
+            stmt = (
+                select(SyncHistoryDaily)
+                .where(SyncHistoryDaily.day >= since)
+                .order_by(SyncHistoryDaily.day.desc(), SyncHistoryDaily.sync_type, SyncHistoryDaily.status)
+            )
+            if sync_type:
+                stmt = stmt.where(SyncHistoryDaily.sync_type == sync_type)
+            rollups = await session.scalars(stmt)
+
+            return [
+                {
+                    "day": rollup.day.isoformat(),
+                    "sync_type": rollup.sync_type,
+                    "status": rollup.status,
+                    "runs": rollup.runs,
+                    "entries_processed": rollup.entries_processed,
+                    "entries_added": rollup.entries_added,
+                    "entries_updated": rollup.entries_updated,
+                    "entries_removed": rollup.entries_removed,
+                    "average_duration_seconds": (
+                        rollup.total_duration_seconds / rollup.runs if rollup.runs else None
+                    ),
+                    "last_completed_at": (
+                        rollup.last_completed_at.isoformat() if rollup.last_completed_at else None
+                    )
+                }
+                for rollup in rollups
+            ]
+
     async def get_sync_status(self) -> Dict[str, Any]:
         """Get current synchronization status."""
-        async with self.db_manager.get_session() as session:
+        last_full_sync = await self.db_manager.get_last_full_sync()
+        async with self.db_manager.get_session(read_only=True) as session:
             # Get latest sync records
             stmt = (
                 select(SyncStatus)
@@ -522,7 +654,7 @@ class DatabaseSyncService:
             
             return {
                 "sync_in_progress": self._sync_in_progress,
-                "last_full_sync": self._last_full_sync.isoformat() if self._last_full_sync else None,
+                "last_full_sync": last_full_sync.isoformat() if last_full_sync else None,
                 "recent_syncs": [
                     {
                         "id": sync.id,
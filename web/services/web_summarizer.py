@@ -9,17 +9,20 @@ full compatibility with existing CLI components.
 """
 
 import asyncio
+import functools
 from datetime import date, datetime, timedelta
 from typing import Dict, Any, Optional, List, AsyncGenerator
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
 
+from cancellation import CancellationToken, TaskCancelledError
 from config_manager import AppConfig
 from logger import JournalSummarizerLogger, ErrorCategory
-from unified_llm_client import UnifiedLLMClient
+from unified_llm_client import get_llm_client
 import summarization_pipeline
 from web.services.base_service import BaseService
+from web.services.progress_reporter import ProgressReporter, ProgressSnapshot
 from web.database import DatabaseManager
 
 
@@ -65,6 +68,7 @@ class ProgressUpdate:
     current_step: str
     status: SummaryTaskStatus
     message: Optional[str] = None
+    eta_seconds: Optional[float] = None
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
@@ -81,17 +85,32 @@ class WebSummarizationService(BaseService):
         """Initialize WebSummarizationService with core dependencies."""
         super().__init__(config, logger, db_manager)
 
-        # Keep llm_client for WebSocket endpoint configuration checks
-        self.llm_client = UnifiedLLMClient(config)
+        # Shared registry client: tasks reuse its SDK connections and provider
+        # health; hedging trades extra calls for interactive latency. Built on
+        # first use so server startup never waits on provider SDK clients.
+        self._llm_client = None
+        self._llm_client_factory = functools.partial(get_llm_client, config, hedge_requests=True)
 
         # Task management
         self.active_tasks: Dict[str, SummaryTask] = {}
         self.task_progress: Dict[str, ProgressUpdate] = {}
+        self._cancel_tokens: Dict[str, CancellationToken] = {}
         self._task_lock = asyncio.Lock()
 
         # WebSocket connection manager (will be set by the API)
         self.connection_manager = None
     
+    @property
+    def llm_client(self):
+        """The shared LLM client, constructed on first access."""
+        if self._llm_client is None:
+            self._llm_client = self._llm_client_factory()
+        return self._llm_client
+
+    @llm_client.setter
+    def llm_client(self, client) -> None:
+        self._llm_client = client
+
     def set_connection_manager(self, connection_manager):
         """Set the WebSocket connection manager for real-time updates."""
         self.connection_manager = connection_manager
@@ -130,6 +149,7 @@ class WebSummarizationService(BaseService):
             
             async with self._task_lock:
                 self.active_tasks[task_id] = task
+                self._cancel_tokens[task_id] = CancellationToken()
             
             self.logger.logger.info(f"Created summarization task {task_id} for {start_date} to {end_date}")
             
@@ -192,6 +212,10 @@ class WebSummarizationService(BaseService):
                 if task.status == SummaryTaskStatus.RUNNING:
                     task.status = SummaryTaskStatus.CANCELLED
                     task.completed_at = datetime.utcnow()
+                    # Stops the worker thread at its next file, period or backoff
+                    token = self._cancel_tokens.get(task_id)
+                    if token is not None:
+                        token.cancel()
                     
                     self.logger.logger.info(f"Cancelled summarization task {task_id}")
                     return True
@@ -224,6 +248,7 @@ class WebSummarizationService(BaseService):
                     del self.active_tasks[task_id]
                     if task_id in self.task_progress:
                         del self.task_progress[task_id]
+                    self._cancel_tokens.pop(task_id, None)
                     cleaned_count += 1
             
             if cleaned_count > 0:
@@ -241,12 +266,16 @@ class WebSummarizationService(BaseService):
             task = self.active_tasks[task_id]
             if task.status == SummaryTaskStatus.CANCELLED:
                 return
+            cancel_token = self._cancel_tokens.get(task_id)
 
-            await self._update_progress(task_id, 0.0, "Initializing summarization")
             loop = asyncio.get_running_loop()
+            reporter = ProgressReporter(
+                loop, lambda snapshot: self._publish_progress(task_id, snapshot)
+            )
+            await reporter.start_phase("Initializing summarization", 0.0, 10.0)
 
             # Phase 1: File Discovery
-            await self._update_progress(task_id, 10.0, "Discovering journal files")
+            await reporter.start_phase("Discovering journal files", 10.0, 30.0)
             discovery_result = await loop.run_in_executor(
                 None, summarization_pipeline.discover_files,
                 self.config.processing.base_path, task.start_date, task.end_date
@@ -257,30 +286,33 @@ class WebSummarizationService(BaseService):
                 return
 
             # Phase 2: Content Processing
-            await self._update_progress(task_id, 30.0, "Processing journal content")
+            await reporter.start_phase("Processing journal content", 30.0, 50.0)
             processed_content, processing_stats = await loop.run_in_executor(
                 None, summarization_pipeline.process_content,
-                discovery_result.found_files, self.config.processing.max_file_size_mb
+                discovery_result.found_files, self.config.processing.max_file_size_mb,
+                self.config.processing
             )
             if task.status == SummaryTaskStatus.CANCELLED:
                 return
 
             # Phase 3: LLM Analysis
-            await self._update_progress(task_id, 50.0, "Analyzing content with LLM")
+            await reporter.start_phase("Analyzing content with LLM", 50.0, 80.0, unit="files")
             analysis_results, api_stats, llm_client = await loop.run_in_executor(
                 None, summarization_pipeline.analyze_content,
-                processed_content, self.config
+                processed_content, self.config, None, self.llm_client, cancel_token,
+                reporter.report
             )
             if task.status == SummaryTaskStatus.CANCELLED:
                 return
 
             # Phase 4: Summary Generation
-            await self._update_progress(task_id, 80.0, "Generating summary")
+            await reporter.start_phase("Generating summary", 80.0, 100.0, unit="periods")
             summaries, summary_stats = await loop.run_in_executor(
                 None, summarization_pipeline.generate_summaries,
                 analysis_results, llm_client, task.summary_type.value,
-                task.start_date, task.end_date
+                task.start_date, task.end_date, cancel_token, reporter.report
             )
+            await reporter.flush()
 
             # Combine summary texts for storage
             combined_result = "\n\n".join(s.summary_text for s in summaries)
@@ -288,13 +320,31 @@ class WebSummarizationService(BaseService):
             await self._update_progress(task_id, 100.0, "Summarization completed")
             await self._complete_task(task_id, combined_result, None)
 
+        except TaskCancelledError as e:
+            # cancel_task already marked the task; just record what was spent
+            if e.api_stats is not None:
+                self.logger.logger.info(
+                    f"Summarization task {task_id} stopped after {e.api_stats.total_calls} "
+                    f"API calls ({e.api_stats.successful_calls} successful)"
+                )
+            else:
+                self.logger.logger.info(f"Summarization task {task_id} stopped")
         except Exception as e:
             self.logger.logger.error(f"Summarization task {task_id} failed: {str(e)}")
             await self._update_task_status(task_id, SummaryTaskStatus.FAILED, error_message=str(e))
     
-    async def _update_progress(self, task_id: str, progress: float, current_step: str) -> None:
+    async def _publish_progress(self, task_id: str, snapshot: ProgressSnapshot) -> None:
+        """Publish a ProgressReporter snapshot for a task."""
+        await self._update_progress(task_id, snapshot.progress, snapshot.current_step,
+                                    eta_seconds=snapshot.eta_seconds,
+                                    items_per_second=snapshot.items_per_second)
+
+    async def _update_progress(self, task_id: str, progress: float, current_step: str,
+                               eta_seconds: Optional[float] = None,
+                               items_per_second: Optional[float] = None) -> None:
         """Update task progress."""
         try:
+            progress_data = None
             async with self._task_lock:
                 if task_id in self.active_tasks:
                     task = self.active_tasks[task_id]
@@ -306,20 +356,23 @@ class WebSummarizationService(BaseService):
                         task_id=task_id,
                         progress=progress,
                         current_step=current_step,
-                        status=task.status
+                        status=task.status,
+                        eta_seconds=eta_seconds
                     )
                     
                     self.task_progress[task_id] = progress_update
-                    
-                    # Send WebSocket update if connection manager is available
-                    if self.connection_manager:
-                        progress_data = {
-                            "progress": progress,
-                            "current_step": current_step,
-                            "status": task.status.value,
-                            "timestamp": progress_update.timestamp.isoformat()
-                        }
-                        await self.connection_manager.send_progress_update(task_id, progress_data)
+                    progress_data = {
+                        "progress": progress,
+                        "current_step": current_step,
+                        "status": task.status.value,
+                        "eta_seconds": eta_seconds,
+                        "items_per_second": items_per_second,
+                        "timestamp": progress_update.timestamp.isoformat()
+                    }
+
+            # Broadcast outside the lock so WebSocket clients never hold up other tasks
+            if progress_data is not None and self.connection_manager:
+                await self.connection_manager.send_progress_update(task_id, progress_data)
                     
         except Exception as e:
             self.logger.logger.error(f"Failed to update progress for task {task_id}: {str(e)}")
@@ -328,6 +381,7 @@ class WebSummarizationService(BaseService):
                                 error_message: Optional[str] = None) -> None:
         """Update task status."""
         try:
+            status_data = None
             async with self._task_lock:
                 if task_id in self.active_tasks:
                     task = self.active_tasks[task_id]
@@ -337,17 +391,17 @@ class WebSummarizationService(BaseService):
                     if status in [SummaryTaskStatus.COMPLETED, SummaryTaskStatus.FAILED, SummaryTaskStatus.CANCELLED]:
                         task.completed_at = datetime.utcnow()
                     
-                    # Send WebSocket update if connection manager is available
-                    if self.connection_manager:
-                        status_data = {
-                            "status": status.value,
-                            "progress": task.progress,
-                            "current_step": task.current_step,
-                            "error_message": error_message,
-                            "completed_at": task.completed_at.isoformat() if task.completed_at else None,
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                        await self.connection_manager.send_task_status(task_id, status_data)
+                    status_data = {
+                        "status": status.value,
+                        "progress": task.progress,
+                        "current_step": task.current_step,
+                        "error_message": error_message,
+                        "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+                        "timestamp": datetime.utcnow().isoformat()
+                    }
+
+            if status_data is not None and self.connection_manager:
+                await self.connection_manager.send_task_status(task_id, status_data)
                         
         except Exception as e:
             self.logger.logger.error(f"Failed to update status for task {task_id}: {str(e)}")
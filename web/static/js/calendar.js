@@ -11,8 +11,11 @@ class CalendarView {
 
     async init() {
         try {
-            await this.loadCalendarData();
-            await this.loadRecentEntries();
+            // Month and recent entries in one round trip; fall back to separate requests
+            if (!(await this.loadInitialData())) {
+                await this.loadCalendarData();
+                await this.loadRecentEntries();
+            }
             this.setupEventListeners();
             this.updateStats();
         } catch (error) {
@@ -21,6 +24,27 @@ class CalendarView {
         }
     }
 
+    async loadInitialData() {
+        try {
+            const response = await fetch(
+                `/api/dashboard?recent_limit=5&year=${this.currentYear}&month=${this.currentMonth}`
+            );
+            if (!response.ok) throw new Error('Failed to fetch dashboard');
+
+            const data = await response.json();
+            this.calendarData = data.calendar;
+            this.recentEntries = data.recent_entries.entries || [];
+
+            this.renderCalendar();
+            this.updateTitle();
+            this.renderRecentEntries();
+            return true;
+        } catch (error) {
+            console.error('Failed to load initial calendar data:', error);
+            return false;
+        }
+    }
+
     async loadCalendarData() {
         try {
             const response = await fetch(`/api/calendar/${this.currentYear}/${this.currentMonth}`);
@@ -9,9 +9,12 @@ class Dashboard {
 
     async init() {
         try {
-            await this.loadTodayInfo();
-            await this.loadRecentEntries();
-            await this.loadStats();
+            // One round trip for first paint; per-panel endpoints remain as fallback
+            if (!(await this.loadDashboard())) {
+                await this.loadTodayInfo();
+                await this.loadRecentEntries();
+                await this.loadStats();
+            }
             this.setupEventListeners();
         } catch (error) {
             console.error('Failed to initialize dashboard:', error);
@@ -19,6 +22,26 @@ class Dashboard {
         }
     }
 
+    async loadDashboard() {
+        try {
+            const response = await fetch('/api/dashboard?recent_limit=5');
+            if (!response.ok) throw new Error('Failed to fetch dashboard');
+
+            const data = await response.json();
+            this.todayData = data.today;
+            this.recentEntries = data.recent_entries.entries || [];
+            this.stats = data.stats;
+
+            this.updateTodaySection();
+            this.updateRecentEntriesSection();
+            this.updateStatsSection();
+            return true;
+        } catch (error) {
+            console.error('Failed to load dashboard:', error);
+            return false;
+        }
+    }
+
     async loadTodayInfo() {
         try {
             const response = await fetch('/api/calendar/today');
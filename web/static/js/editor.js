@@ -7,6 +7,8 @@ class JournalEditor {
         this.autoSaveInterval = null;
         this.lastSaved = null;
         this.hasUnsavedChanges = false;
+        this.savedContent = null;
+        this.savedHash = null;
 
         this.init();
     }
@@ -33,6 +35,8 @@ class JournalEditor {
                 this.content = entry.content || '';
                 document.getElementById('editor-textarea').value = this.content;
                 this.lastSaved = new Date(entry.modified_at || entry.created_at);
+                this.savedContent = this.content;
+                this.savedHash = await this.hashContent(this.content);
             } else if (response.status === 404) {
                 // Entry doesn't exist yet, start with empty content
                 this.content = `${this.formatDate(new Date(this.entryDate))}\n\n`;
@@ -176,25 +180,26 @@ class JournalEditor {
                 Utils.setLoading(document.getElementById('save-btn'), true);
             }
 
-            const response = await fetch(`/api/entries/${this.entryDate}`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                    'X-Requested-With': 'XMLHttpRequest'
-                },
-                body: JSON.stringify({
-                    date: this.entryDate,
-                    content: this.content
-                })
-            });
+            const contentToSave = this.content;
+            const contentHash = await this.hashContent(contentToSave);
+
+            let saved = false;
+            if (contentHash && contentHash === this.savedHash) {
+                // Nothing changed since the last save
+                saved = true;
+            } else if (contentHash && this.savedHash) {
+                saved = await this.patchEntry(contentToSave, contentHash);
+            }
 
-            if (!response.ok) {
-                throw new Error('Failed to save entry');
+            if (!saved) {
+                await this.postEntry(contentToSave);
             }
 
-            this.hasUnsavedChanges = false;
+            this.savedContent = contentToSave;
+            this.savedHash = contentHash;
+            this.hasUnsavedChanges = this.content !== contentToSave;
             this.lastSaved = new Date();
-            this.updateSaveStatus('saved');
+            this.updateSaveStatus(this.hasUnsavedChanges ? 'unsaved' : 'saved');
 
             if (!silent) {
                 Utils.showToast('Entry saved successfully', 'success');
@@ -204,7 +209,10 @@ class JournalEditor {
             console.error('Failed to save entry:', error);
             this.updateSaveStatus('error');
 
-            if (!silent) {
+            if (error.conflict) {
+                // Never silently overwrite changes made elsewhere
+                Utils.showToast('This entry was changed elsewhere. Reload to get the latest version.', 'error');
+            } else if (!silent) {
                 Utils.showToast('Failed to save entry', 'error');
             }
         } finally {
@@ -214,6 +222,96 @@ class JournalEditor {
         }
     }
 
+    async postEntry(content) {
+        const response = await fetch(`/api/entries/${this.entryDate}`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-Requested-With': 'XMLHttpRequest'
+            },
+            body: JSON.stringify({
+                date: this.entryDate,
+                content: content
+            })
+        });
+
+        if (!response.ok) {
+            throw new Error('Failed to save entry');
+        }
+    }
+
+    /**
+     * Send only the changed region of the document, conditional on the
+     * server still holding the version we last saved or loaded.
+     * Returns false when the server asks for a full save instead.
+     */
+    async patchEntry(content, contentHash) {
+        const response = await fetch(`/api/entries/${this.entryDate}/content`, {
+            method: 'PATCH',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-Requested-With': 'XMLHttpRequest'
+            },
+            body: JSON.stringify({
+                base_hash: this.savedHash,
+                content_hash: contentHash,
+                edits: [this.computeEdit(this.savedContent, content)]
+            })
+        });
+
+        if (response.status === 409) {
+            const error = new Error('Entry was modified elsewhere');
+            error.conflict = true;
+            throw error;
+        }
+        if (response.status === 422) {
+            return false;
+        }
+        if (!response.ok) {
+            throw new Error('Failed to save entry');
+        }
+        return true;
+    }
+
+    /**
+     * Single splice covering the changed region. Offsets are in code points
+     * so they match Python string indexing on the server.
+     */
+    computeEdit(oldText, newText) {
+        const oldChars = Array.from(oldText);
+        const newChars = Array.from(newText);
+
+        let prefix = 0;
+        const maxPrefix = Math.min(oldChars.length, newChars.length);
+        while (prefix < maxPrefix && oldChars[prefix] === newChars[prefix]) {
+            prefix++;
+        }
+
+        let suffix = 0;
+        const maxSuffix = maxPrefix - prefix;
+        while (suffix < maxSuffix &&
+               oldChars[oldChars.length - 1 - suffix] === newChars[newChars.length - 1 - suffix]) {
+            suffix++;
+        }
+
+        return {
+            start: prefix,
+            end: oldChars.length - suffix,
+            text: newChars.slice(prefix, newChars.length - suffix).join('')
+        };
+    }
+
+    async hashContent(text) {
+        // SubtleCrypto is only available in secure contexts (localhost counts)
+        if (!window.crypto || !window.crypto.subtle) {
+            return null;
+        }
+        const digest = await window.crypto.subtle.digest('SHA-256', new TextEncoder().encode(text));
+        return Array.from(new Uint8Array(digest))
+            .map(byte => byte.toString(16).padStart(2, '0'))
+            .join('');
+    }
+
     togglePreview() {
         this.isPreviewMode = !this.isPreviewMode;
         const previewPane = document.getElementById('preview-pane');
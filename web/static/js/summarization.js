@@ -235,12 +235,17 @@ class SummarizationInterface {
 
             ws.onopen = () => {
                 console.log(`WebSocket connected for task ${taskId}`);
+                // Pushed updates make polling redundant while the socket is up
+                this.stopProgressPolling(taskId);
             };
 
             ws.onmessage = (event) => {
                 try {
-                    const data = JSON.parse(event.data);
-                    this.handleProgressUpdate(data);
+                    const message = JSON.parse(event.data);
+                    // Task messages wrap the task state in "data"
+                    if (message.data) {
+                        this.handleProgressUpdate(message.data);
+                    }
                 } catch (error) {
                     console.error('Failed to parse WebSocket message:', error);
                 }
@@ -250,9 +255,9 @@ class SummarizationInterface {
                 console.log(`WebSocket closed for task ${taskId}`, event.code, event.reason);
                 this.websockets.delete(taskId);
 
-                // If connection closed unexpectedly, try to get final status
+                // If connection closed unexpectedly, poll until the task finishes
                 if (event.code !== 1000 && event.code !== 1001) {
-                    setTimeout(() => this.checkTaskStatus(taskId), 2000);
+                    this.startProgressPolling(taskId);
                 }
             };
 
@@ -270,26 +275,45 @@ class SummarizationInterface {
         }
     }
 
+    isSocketOpen(taskId) {
+        const ws = this.websockets.get(taskId);
+        return Boolean(ws) && ws.readyState === WebSocket.OPEN;
+    }
+
     startProgressPolling(taskId) {
-        const pollInterval = setInterval(async () => {
+        const task = this.activeTasks.get(taskId);
+        if (!task || task.pollInterval) {
+            return;
+        }
+
+        task.pollInterval = setInterval(async () => {
+            if (this.isSocketOpen(taskId)) {
+                this.stopProgressPolling(taskId);
+                return;
+            }
             try {
                 const response = await fetch(`/api/summarization/tasks/${taskId}`);
                 if (response.ok) {
                     const data = await response.json();
                     this.handleProgressUpdate(data);
 
-                    if (data.status === 'completed' || data.status === 'failed') {
-                        clearInterval(pollInterval);
+                    if (['completed', 'failed', 'cancelled'].includes(data.status)) {
+                        this.stopProgressPolling(taskId);
                     }
                 }
             } catch (error) {
                 console.error('Failed to poll task status:', error);
-                clearInterval(pollInterval);
+                this.stopProgressPolling(taskId);
             }
         }, 2000);
+    }
 
-        // Store interval for cleanup
-        this.activeTasks.get(taskId).pollInterval = pollInterval;
+    stopProgressPolling(taskId) {
+        const task = this.activeTasks.get(taskId);
+        if (task && task.pollInterval) {
+            clearInterval(task.pollInterval);
+            task.pollInterval = null;
+        }
     }
 
     async checkTaskStatus(taskId) {
@@ -306,7 +330,7 @@ class SummarizationInterface {
 
     handleProgressUpdate(data) {
         // Update progress bar and status
-        this.updateProgress(data.progress || 0, data.current_step || data.status);
+        this.updateProgress(data.progress || 0, data.current_step || data.status, data.eta_seconds);
 
         // Handle task completion
         if (data.status === 'completed') {
@@ -316,7 +340,7 @@ class SummarizationInterface {
         }
     }
 
-    updateProgress(progress, status) {
+    updateProgress(progress, status, etaSeconds) {
         const progressFill = document.getElementById('progress-fill');
         const progressText = document.getElementById('progress-text');
         const progressStatus = document.getElementById('progress-status');
@@ -326,6 +350,19 @@ class SummarizationInterface {
             progressText.textContent = `${Math.round(progress)}%`;
             progressStatus.textContent = status;
         }
+
+        // Replace the up-front guess with the server's measured estimate
+        const estimatedTime = document.getElementById('estimated-time');
+        if (estimatedTime && typeof etaSeconds === 'number') {
+            estimatedTime.textContent = this.formatEta(etaSeconds);
+        }
+    }
+
+    formatEta(seconds) {
+        if (seconds < 60) {
+            return `about ${Math.max(1, Math.round(seconds))} seconds left`;
+        }
+        return `about ${Math.round(seconds / 60)} minutes left`;
     }
 
     handleTaskCompletion(data) {
@@ -0,0 +1,54 @@
+# ABOUTME: Helpers for strong ETags and If-None-Match handling on read-heavy API routes.
+# ABOUTME: Lets routers answer unchanged polls with 304 before running queries or serialization.
+"""ETag and conditional GET utilities for API responses."""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+# Clients may keep a copy but must revalidate it on every use.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a quoted strong ETag from the version components of a resource.
+
+    Components are stringified, so None, dates and datetimes are all fine.
+    """
+    token = "|".join("" if part is None else str(part) for part in parts)
+    return '"' + hashlib.sha256(token.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match header matches etag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so a
+    W/ prefix added by an intermediary does not defeat the match.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response carrying the current validator."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def apply_etag(response: Response, etag: Optional[str]) -> None:
+    """Attach validator headers to a full response (no-op without an ETag)."""
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CACHE_CONTROL
@@ -17,7 +17,7 @@ import argparse
 import datetime
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 # Import Phase 2 components
 from file_discovery import FileDiscovery, FileDiscoveryResult
@@ -38,7 +38,8 @@ from logger import (
 # Import Phase 8 components
 from config_manager import ConfigManager, AppConfig
 # Import database components for CLI integration
-from web.database import DatabaseManager
+if TYPE_CHECKING:
+    from web.database import DatabaseManager
 # Import shared pipeline
 import summarization_pipeline
 
@@ -298,7 +299,16 @@ def resolve_database_path_priority(cli_path: str = None, config_path: str = None
     return None
 
 
-def initialize_database_manager(database_path: str = None) -> DatabaseManager:
+def __getattr__(name: str):
+    """Import web.database, and with it SQLAlchemy, only when a database is actually used."""
+    if name == "DatabaseManager":
+        from web.database import DatabaseManager
+        globals()[name] = DatabaseManager
+        return DatabaseManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def initialize_database_manager(database_path: str = None) -> "DatabaseManager":
     """
     Initialize DatabaseManager with optional database path.
     
@@ -308,7 +318,8 @@ def initialize_database_manager(database_path: str = None) -> DatabaseManager:
     Returns:
         DatabaseManager: Initialized database manager instance
     """
-    return DatabaseManager(database_path=database_path)
+    database_manager_class = getattr(sys.modules[__name__], "DatabaseManager")
+    return database_manager_class(database_path=database_path)
 
 
 def _perform_dry_run(args: argparse.Namespace, config: AppConfig, logger: JournalSummarizerLogger) -> None:
@@ -436,7 +447,7 @@ def _run_content_processing(
     print("📝 Phase 3: Processing file content...")
 
     processed_content, processing_stats = summarization_pipeline.process_content(
-        found_files, config.processing.max_file_size_mb
+        found_files, config.processing.max_file_size_mb, config.processing
     )
 
     # Display processing statistics